@@ -0,0 +1,98 @@
+"""
+/news 조회 쿼리: 전체 엔티티 로드(select(NewsArticle)) vs 컬럼 projection(_news_stmt) 비교.
+
+- bytes:   결과 행의 서버 측 크기 합계 (SELECT sum(pg_column_size(q.*)) FROM (<쿼리>) q)
+           → 본문(content) 을 읽으면 TOAST 값까지 풀어서 전송되므로 그 차이가 그대로 드러남
+- latency: 쿼리 실행 + fetch + 응답 dict 변환까지 (API 로더와 같은 작업) 반복 측정한 p50 / p95
+
+합성 기사(ticker=BENCH)를 --seed 개 넣고 측정한 뒤 지운다 (--keep 이면 유지).
+
+    PYTHONPATH=src python benchmarks/bench_api_projection.py --seed 20000 --content-bytes 6000
+"""
+import sys
+import time
+import argparse
+import statistics
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+import db.writer as writer
+from db.models import NewsArticle
+from api.main import _news_stmt, _article_to_dict
+from bench_bulk_load import BENCH_TICKER, make_rows, cleanup
+
+
+def legacy_news_stmt(ticker: str, limit: int):
+    """변경 전 쿼리: 엔티티 전체(content 포함)"""
+    return (
+        select(NewsArticle)
+        .where(NewsArticle.ticker == ticker)
+        .order_by(NewsArticle.date.desc(), NewsArticle.id.desc())
+        .limit(limit + 1)
+    )
+
+
+def result_bytes(stmt) -> int:
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    with writer.engine.connect() as conn:
+        return int(conn.execute(text(f"SELECT COALESCE(sum(pg_column_size(q.*)), 0) FROM ({sql}) q")).scalar())
+
+
+def time_legacy(limit: int) -> float:
+    started = time.perf_counter()
+    with writer.get_session() as session:
+        rows = session.execute(legacy_news_stmt(BENCH_TICKER, limit)).scalars().all()
+        [_article_to_dict(r) for r in rows]
+    return time.perf_counter() - started
+
+
+def time_projected(limit: int) -> float:
+    started = time.perf_counter()
+    with writer.get_session() as session:
+        rows = session.execute(_news_stmt(BENCH_TICKER, None, None, limit)).all()
+        [_article_to_dict(r) for r in rows]
+    return time.perf_counter() - started
+
+
+def measure(fn, limit: int, runs: int) -> tuple[float, float]:
+    fn(limit)   # 워밍업 (커넥션 / 버퍼 캐시)
+    samples = sorted(fn(limit) for _ in range(runs))
+    return statistics.median(samples) * 1000, samples[max(0, int(len(samples) * 0.95) - 1)] * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="/news 쿼리 projection 전후 비교")
+    parser.add_argument("--seed", type=int, default=20000, help="넣을 합성 기사 수 (0 이면 기존 BENCH 데이터 사용)")
+    parser.add_argument("--content-bytes", type=int, default=6000)
+    parser.add_argument("--limit", type=int, nargs="+", default=[30, 100])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="측정 후 합성 기사를 지우지 않음")
+    args = parser.parse_args()
+
+    writer.init_db()
+    if args.seed:
+        cleanup()
+        writer.BULK_COPY_MIN_ROWS = 1
+        writer._insert_article_rows(make_rows(args.seed, args.content_bytes, "p"))
+        with writer.engine.begin() as conn:
+            conn.execute(text("ANALYZE news_articles"))
+
+    try:
+        print(f"{'limit':>5}  {'path':<10} {'bytes':>12}  {'p50':>9}  {'p95':>9}")
+        for limit in args.limit:
+            for name, stmt, fn in (
+                ("entity", legacy_news_stmt(BENCH_TICKER, limit), time_legacy),
+                ("projected", _news_stmt(BENCH_TICKER, None, None, limit), time_projected),
+            ):
+                size = result_bytes(stmt)
+                p50, p95 = measure(fn, limit, args.runs)
+                print(f"{limit:>5}  {name:<10} {size:>12,}  {p50:>7.2f}ms  {p95:>7.2f}ms")
+    finally:
+        if args.seed and not args.keep:
+            cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+기사 대량 적재 벤치마크: 다중 VALUES INSERT vs COPY + 임시 테이블.
+
+실제 DB(DATABASE_URL)의 news_articles 에 합성 기사(ticker=BENCH)를 넣고 시간을 잰 뒤 지운다.
+VALUES 경로는 바인드 파라미터 제한(65535)을 넘지 않도록 INSERT_BATCH_SIZE 행씩 나눠 실행한다.
+
+    PYTHONPATH=src python benchmarks/bench_bulk_load.py --rows 5000 --content-bytes 6000
+"""
+import sys
+import time
+import random
+import string
+import argparse
+import datetime as dt
+
+from sqlalchemy import delete, select
+
+import db.writer as writer
+from db.models import NewsArticle, NewsArticleUrl, DailySentiment
+from collector.url_utils import url_hash
+
+BENCH_TICKER = "BENCH"
+
+
+def make_rows(n: int, content_bytes: int, run: str) -> list[dict]:
+    rnd = random.Random(42)
+    words = ["".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(3, 9))) for _ in range(2000)]
+    base = dt.date(2024, 1, 1)
+    rows = []
+    for i in range(n):
+        text, size = [], 0
+        while size < content_bytes:
+            w = rnd.choice(words)
+            text.append(w)
+            size += len(w) + 1
+        url = f"https://finance.yahoo.com/news/bench-{run}-{i}.html"
+        rows.append({
+            "ticker": BENCH_TICKER,
+            "date": base + dt.timedelta(days=i % 365),
+            "url": url,
+            "url_hash": url_hash(url),
+            "title": f"Bench article {i}",
+            "content": " ".join(text),
+            "sentiment_label": rnd.choice(["positive", "negative", "neutral"]),
+            "sentiment_score": round(rnd.uniform(-1, 1), 4),
+        })
+    return rows
+
+
+def cleanup() -> None:
+    with writer.get_session() as session:
+        bench_hashes = select(NewsArticle.url_hash).where(NewsArticle.ticker == BENCH_TICKER)
+        session.execute(delete(NewsArticleUrl).where(NewsArticleUrl.url_hash.in_(bench_hashes)))
+        session.execute(delete(NewsArticle).where(NewsArticle.ticker == BENCH_TICKER))
+        session.execute(delete(DailySentiment).where(DailySentiment.ticker == BENCH_TICKER))
+
+
+def run_path(name: str, rows: list[dict], min_rows: int, chunk: int) -> tuple[float, int]:
+    """min_rows 로 경로를 강제: 행 수보다 크면 VALUES, 작으면 COPY."""
+    writer.BULK_COPY_MIN_ROWS = min_rows
+    started = time.perf_counter()
+    inserted = 0
+    for i in range(0, len(rows), chunk):
+        inserted += writer._insert_article_rows(rows[i:i + chunk])
+    elapsed = time.perf_counter() - started
+    print(f"{name:<8} {len(rows):>7}행  {elapsed:>7.2f}s  {len(rows) / elapsed:>9.0f} rows/s  (삽입 {inserted}건)")
+    return elapsed, inserted
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="VALUES vs COPY 기사 적재 벤치마크")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--content-bytes", type=int, default=6000, help="기사 1건 본문 크기")
+    parser.add_argument("--values-batch", type=int, default=writer.INSERT_BATCH_SIZE * 5,
+                        help="VALUES 경로의 한 문장당 행 수 (파라미터 제한 이하)")
+    args = parser.parse_args()
+
+    writer.init_db()
+    cleanup()
+    try:
+        t_values, n_values = run_path(
+            "VALUES", make_rows(args.rows, args.content_bytes, "v"), min_rows=sys.maxsize, chunk=args.values_batch,
+        )
+        cleanup()
+        t_copy, n_copy = run_path("COPY", make_rows(args.rows, args.content_bytes, "c"), min_rows=1, chunk=args.rows)
+        # 같은 행을 다시 넣으면 모두 충돌 → 삽입 0건이어야 함
+        _, n_again = run_path("COPY(dup)", make_rows(args.rows, args.content_bytes, "c"), min_rows=1, chunk=args.rows)
+    finally:
+        cleanup()
+
+    assert n_values == n_copy == args.rows, (n_values, n_copy)
+    assert n_again == 0, n_again
+    print(f"speedup  x{t_values / t_copy:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+기사 추출 엔진: bs4(extract_bs4) vs lxml 단일 순회(extract_lxml) 페이지당 파싱 시간 비교.
+결과가 같은지는 tests/test_extractors.py (parity) 가 확인하고, 여기서는 속도만 잰다.
+
+기본 입력은 tests/fixtures/pages/*.html (Yahoo 기사 레이아웃을 본뜬 수작업 페이지).
+
+    PYTHONPATH=src python benchmarks/bench_extractors.py [--rounds 20] [PAGE.html ...]
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+import statistics
+
+from collector.extractors import extract_bs4, extract_lxml
+
+FIXTURE_PAGES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "pages", "*.html")
+
+
+def per_page(fn, pages: list[str], rounds: int) -> list[float]:
+    """라운드마다 전체 페이지를 한 번씩 파싱한 페이지당 평균 시간(초) 목록."""
+    fn(pages[0])   # 워밍업 (모듈 지연 import)
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for html in pages:
+            fn(html)
+        samples.append((time.perf_counter() - started) / len(pages))
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="기사 추출 엔진 bs4 vs lxml 속도 비교")
+    parser.add_argument("pages", nargs="*", help="HTML 파일 (기본: tests/fixtures/pages)")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.pages or sorted(glob.glob(FIXTURE_PAGES))
+    if not paths:
+        print("측정할 페이지가 없습니다.")
+        return 1
+    pages = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+
+    results = {}
+    print(f"pages={len(pages)} rounds={args.rounds}")
+    print(f"{'engine':<6} {'p50':>10} {'min':>10}")
+    for name, fn in (("bs4", extract_bs4), ("lxml", extract_lxml)):
+        samples = per_page(fn, pages, args.rounds)
+        results[name] = statistics.median(samples)
+        print(f"{name:<6} {results[name] * 1000:>8.2f}ms {min(samples) * 1000:>8.2f}ms")
+    print(f"speedup {results['bs4'] / results['lxml']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+읽기 API 부하 테스트 (동시 클라이언트 N개 → 초당 요청 수, 지연 p50 / p95 / p99).
+
+DB 경로를 재려면 응답 캐시를 끄고 서버를 띄운다:
+    API_CACHE_TTL=0 uvicorn api.main:app --app-dir src --workers 1
+
+    python benchmarks/loadtest_api.py --base-url http://localhost:8000 --concurrency 50 --duration 30
+
+동기/비동기 비교는 같은 호스트(t2.micro 급)에서 변경 전후 커밋의 서버를 차례로 띄워
+같은 인자로 실행하고 출력된 req/s, p99 를 비교한다.
+"""
+import sys
+import time
+import json
+import asyncio
+import argparse
+from collections import Counter
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/stocks/TSLA/prices?limit=30",
+    "/stocks/TSLA/news?limit=30",
+    "/stocks/TSLA/summary?limit=10",
+    "/stocks/005930.KS/prices?limit=30",
+    "/stocks/005930.KS/summary?limit=10",
+]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+async def _client_loop(client: httpx.AsyncClient, paths: list[str], offset: int, deadline: float,
+                       latencies: list[float], statuses: Counter) -> None:
+    i = offset
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            resp = await client.get(path)
+            statuses[resp.status_code] += 1
+        except httpx.HTTPError as e:
+            statuses[type(e).__name__] += 1
+            continue
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(base_url: str, paths: list[str], concurrency: int, duration: float, warmup: float) -> dict:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        if warmup > 0:
+            await asyncio.gather(*(
+                _client_loop(client, paths, n, time.perf_counter() + warmup, [], Counter())
+                for n in range(concurrency)
+            ))
+
+        latencies: list[float] = []
+        statuses: Counter = Counter()
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            _client_loop(client, paths, n, started + duration, latencies, statuses)
+            for n in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round((latencies[-1] if latencies else 0.0) * 1000, 1),
+        "statuses": {str(k): v for k, v in sorted(statuses.items(), key=str)},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stockmind 읽기 API 부하 테스트")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50],
+                        help="동시 클라이언트 수 (여러 개면 차례로 측정)")
+    parser.add_argument("--duration", type=float, default=20.0, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="측정 전 워밍업 시간(초)")
+    parser.add_argument("--path", action="append", dest="paths", help="요청 경로 (반복 지정, 기본: 조회 엔드포인트 5개)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 한 줄씩 출력")
+    args = parser.parse_args()
+
+    for concurrency in args.concurrency:
+        result = asyncio.run(run(args.base_url, args.paths or DEFAULT_PATHS, concurrency, args.duration, args.warmup))
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(
+                f"c={result['concurrency']:>4}  {result['rps']:>8.1f} req/s  "
+                f"p50 {result['p50_ms']:>7.1f}ms  p95 {result['p95_ms']:>7.1f}ms  "
+                f"p99 {result['p99_ms']:>7.1f}ms  max {result['max_ms']:>7.1f}ms  {result['statuses']}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
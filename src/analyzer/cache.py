@@ -0,0 +1,140 @@
+import os
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version as package_version
+from typing import Iterable, Optional
+
+from settings import SENTIMENT_CACHE_ENABLED, SENTIMENT_CACHE_PATH, SENTIMENT_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# analyze_sentiment() 에 영향을 주는 요소(VADER 버전, 자르기 길이, 반올림 자릿수)를 모두 포함.
+# 분석 로직을 바꾸면 suffix 를 올려 기존 캐시를 무효화한다.
+TEXT_LIMIT = 1000
+try:
+    ANALYZER_VERSION = f"vader-{package_version('vaderSentiment')}-t{TEXT_LIMIT}-r4"
+except PackageNotFoundError:
+    ANALYZER_VERSION = f"vader-unknown-t{TEXT_LIMIT}-r4"
+
+
+def normalize_text(text: str) -> str:
+    """VADER 가 실제로 보는 입력(앞 TEXT_LIMIT 자) 기준. 공백 토큰화라 양끝 공백은 결과에 무관."""
+    return text[:TEXT_LIMIT].strip()
+
+
+class SentimentCache:
+    """
+    정규화 텍스트 해시 → {"label", "score"} 캐시.
+    - 메모리: max_memory 개 LRU
+    - 디스크: SQLite 파일 (path=None 이면 메모리만 사용)
+    키에 analyzer 버전이 포함되며, 다른 버전으로 저장된 행은 열 때 삭제된다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = SENTIMENT_CACHE_PATH,
+        max_memory: int = SENTIMENT_CACHE_SIZE,
+        analyzer_version: str = ANALYZER_VERSION,
+    ):
+        self.version = analyzer_version
+        self.max_memory = max(1, max_memory)
+        self._memory: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        if path:
+            self._open(path)
+
+    def key(self, text: str) -> str:
+        payload = f"{self.version}\0{normalize_text(text)}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, dict]:
+        requested = list(dict.fromkeys(keys))
+        found: dict[str, dict] = {}
+        missing: list[str] = []
+        with self._lock:
+            for k in requested:
+                if k in self._memory:
+                    self._memory.move_to_end(k)
+                    found[k] = self._memory[k]
+                else:
+                    missing.append(k)
+
+            if missing and self._conn is not None:
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i:i + 500]
+                    rows = self._conn.execute(
+                        f"SELECT key, label, score FROM sentiment_cache WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                    for k, label, score in rows:
+                        found[k] = {"label": label, "score": score}
+                        self._remember(k, found[k])
+
+            self.hits += len(found)
+            self.misses += len(requested) - len(found)
+        return found
+
+    def put_many(self, items: dict[str, dict]) -> None:
+        if not items:
+            return
+        with self._lock:
+            for k, v in items.items():
+                self._remember(k, v)
+            if self._conn is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO sentiment_cache (key, version, label, score) VALUES (?, ?, ?, ?)",
+                    [(k, self.version, v["label"], v["score"]) for k, v in items.items()],
+                )
+                self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── 내부 ───────────────────────────────────────────────────
+
+    def _remember(self, key: str, value: dict) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+
+    def _open(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sentiment_cache ("
+            " key TEXT PRIMARY KEY, version TEXT NOT NULL, label TEXT NOT NULL, score REAL NOT NULL)"
+        )
+        purged = self._conn.execute(
+            "DELETE FROM sentiment_cache WHERE version != ?", (self.version,)
+        ).rowcount
+        self._conn.commit()
+        if purged:
+            logger.info(f"[sentiment_cache] 이전 analyzer 버전 캐시 {purged}건 삭제 → {self.version}")
+
+
+# ── 프로세스 공유 캐시 ─────────────────────────────────────────
+
+_cache: Optional[SentimentCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_sentiment_cache() -> Optional[SentimentCache]:
+    """SENTIMENT_CACHE_ENABLED=false 면 None."""
+    global _cache
+    if not SENTIMENT_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = SentimentCache()
+        return _cache
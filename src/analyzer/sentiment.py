@@ -1,9 +1,21 @@
+import os
+import time
 import logging
+from collections import Counter
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Sequence
+
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from analyzer.cache import TEXT_LIMIT, SentimentCache, get_sentiment_cache
+from metrics import record
+from settings import (
+    SENTIMENT_WORKERS, SENTIMENT_POOL_MIN_BATCH, SENTIMENT_CHUNK_SIZE, SENTIMENT_STREAM_BATCH,
+)
+
 logger = logging.getLogger(__name__)
 
-# 싱글톤 analyzer (매 호출마다 재생성 방지)
+# 싱글톤 analyzer (매 호출마다 재생성 방지, 워커 프로세스마다 1개)
 _analyzer = None
 
 
@@ -33,7 +45,7 @@ def analyze_sentiment(text: str) -> dict:
         return {"label": "neutral", "score": 0.0}
 
     try:
-        scores = _get_analyzer().polarity_scores(text[:1000])  # 너무 긴 텍스트 방지
+        scores = _get_analyzer().polarity_scores(text[:TEXT_LIMIT])  # 너무 긴 텍스트 방지 (캐시 키와 같은 길이)
         compound = round(scores["compound"], 4)
 
         if compound >= 0.05:
@@ -50,9 +62,125 @@ def analyze_sentiment(text: str) -> dict:
         return {"label": "neutral", "score": 0.0}
 
 
-def analyze_articles(articles: list[dict]) -> list[dict]:
+# ── 배치 / 멀티코어 ───────────────────────────────────────────
+
+def _init_worker() -> None:
+    """워커 프로세스 시작 시 analyzer 를 미리 로드 (lexicon 파싱을 청크마다 반복하지 않음)."""
+    _get_analyzer()
+
+
+def _analyze_chunk(texts: list[str]) -> list[dict]:
+    return [analyze_sentiment(t) for t in texts]
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    workers = SENTIMENT_WORKERS if workers is None else workers
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def _score_texts(texts: list, workers: int, chunk_size: int, pool_min_batch: int) -> tuple[list[dict], int]:
+    """실제 VADER 분석. 반환값: (결과 목록, 사용한 프로세스 수)"""
+    workers = min(workers, -(-len(texts) // max(1, chunk_size)))
+    if workers > 1 and len(texts) >= pool_min_batch:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        # 파이프라인은 스레드에서 호출하므로 fork 대신 spawn 으로 워커 생성
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        ) as pool:
+            return [r for chunk in pool.map(_analyze_chunk, chunks) for r in chunk], workers
+    return _analyze_chunk(texts), 1
+
+
+def analyze_batch(
+    texts: Sequence[str],
+    workers: Optional[int] = None,
+    chunk_size: int = SENTIMENT_CHUNK_SIZE,
+    pool_min_batch: int = SENTIMENT_POOL_MIN_BATCH,
+    use_cache: bool = True,
+    cache: Optional[SentimentCache] = None,
+) -> list[dict]:
+    """
+    텍스트 목록을 한 번에 분석. 반환 순서 = 입력 순서, 항목은 analyze_sentiment() 와 동일.
+    - 캐시(analyzer.cache)에 있는 텍스트와 배치 내 중복 텍스트는 다시 분석하지 않음
+    - 남은 텍스트가 pool_min_batch 이상이고 workers > 1 이면 프로세스 풀에 chunk_size 단위로 분배
+      (각 워커는 자체 analyzer 를 가짐)
+    - 그 외에는 현재 프로세스에서 순차 처리 (프로세스 기동 비용이 더 큰 소량 배치)
+    - 처리량(articles/sec)을 로그로, 소요 시간 / 건수를 metrics 의 sentiment 단계로 남김
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+
+    started = time.perf_counter()
+    if use_cache and cache is None:
+        cache = get_sentiment_cache()
+
+    if cache is None:
+        results, used = _score_texts(texts, _resolve_workers(workers), chunk_size, pool_min_batch)
+        hits = 0
+    else:
+        results: list[Optional[dict]] = [None] * len(texts)
+        pending: dict[str, list[int]] = {}   # 캐시 키 → 같은 텍스트의 입력 위치들
+        for i, t in enumerate(texts):
+            if not isinstance(t, str) or not t.strip():
+                results[i] = analyze_sentiment(t)
+            else:
+                pending.setdefault(cache.key(t), []).append(i)
+
+        cached = cache.get_many(pending)
+        hits = sum(len(pending[k]) for k in cached)
+        todo = [k for k in pending if k not in cached]
+        scored, used = _score_texts(
+            [texts[pending[k][0]] for k in todo], _resolve_workers(workers), chunk_size, pool_min_batch,
+        ) if todo else ([], 0)
+        cache.put_many(dict(zip(todo, scored)))
+
+        for k, sentiment in {**cached, **dict(zip(todo, scored))}.items():
+            for i in pending[k]:
+                results[i] = dict(sentiment)
+
+    elapsed = time.perf_counter() - started
+    record("sentiment", elapsed, calls=1, items=len(texts))
+    rate = len(texts) / elapsed if elapsed > 0 else float("inf")
+    logger.info(
+        f"[sentiment] 배치 {len(texts)}건 분석 (캐시 적중 {hits}건, {used} proc, "
+        f"{elapsed:.2f}s, {rate:.0f} articles/sec)"
+    )
+    return results
+
+
+def article_text(article: dict) -> str:
+    """content가 있으면 content 기준, 없으면 title 기준으로 분석"""
+    return article.get("content") or article.get("title") or ""
+
+
+def _attach(articles: list[dict], sentiments: list[dict]) -> list[dict]:
+    return [
+        {
+            **article,
+            "sentiment_label": sentiment["label"],
+            "sentiment_score": sentiment["score"],
+        }
+        for article, sentiment in zip(articles, sentiments)
+    ]
+
+
+def _log_distribution(counts: Counter) -> None:
+    logger.info(
+        f"[sentiment] 분석 완료 → positive={counts['positive']}, "
+        f"negative={counts['negative']}, neutral={counts['neutral']}"
+    )
+
+
+def analyze_articles(articles: list[dict], workers: Optional[int] = None) -> list[dict]:
     """
     fetch_articles()의 반환값을 받아 각 기사에 sentiment 필드를 추가해 반환.
+    대량 배치는 analyze_batch() 를 통해 여러 코어에 분배된다.
 
     입력:
     [{"url": ..., "title": ..., "content": ..., "date": ...}, ...]
@@ -61,21 +189,27 @@ def analyze_articles(articles: list[dict]) -> list[dict]:
     [{"url": ..., "title": ..., "content": ..., "date": ...,
       "sentiment_label": "positive", "sentiment_score": 0.82}, ...]
     """
-    results = []
-    for article in articles:
-        # content가 있으면 content 기준, 없으면 title 기준으로 분석
-        text = article.get("content") or article.get("title") or ""
-        sentiment = analyze_sentiment(text)
-
-        results.append({
-            **article,
-            "sentiment_label": sentiment["label"],
-            "sentiment_score": sentiment["score"],
-        })
+    results = _attach(articles, analyze_batch([article_text(a) for a in articles], workers=workers))
+    _log_distribution(Counter(r["sentiment_label"] for r in results))
+    return results
 
-    pos = sum(1 for r in results if r["sentiment_label"] == "positive")
-    neg = sum(1 for r in results if r["sentiment_label"] == "negative")
-    neu = sum(1 for r in results if r["sentiment_label"] == "neutral")
-    logger.info(f"[sentiment] 분석 완료 → positive={pos}, negative={neg}, neutral={neu}")
 
-    return results
+def iter_analyzed(
+    articles: Iterable[dict],
+    batch_size: int = SENTIMENT_STREAM_BATCH,
+    workers: Optional[int] = None,
+) -> Iterator[dict]:
+    """
+    기사 스트림(iter_articles() 등)을 batch_size 개씩 묶어 analyze_batch() 로 분석하고
+    sentiment 필드가 추가된 기사를 순서대로 yield. 한 번에 batch_size 개만 메모리에 둔다.
+    """
+    counts: Counter = Counter()
+    it = iter(articles)
+    while True:
+        batch = list(islice(it, max(1, batch_size)))
+        if not batch:
+            break
+        for result in _attach(batch, analyze_batch([article_text(a) for a in batch], workers=workers)):
+            counts[result["sentiment_label"]] += 1
+            yield result
+    _log_distribution(counts)
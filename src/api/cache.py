@@ -0,0 +1,141 @@
+"""
+읽기 API 응답 캐시 (프로세스 내 TTL + LRU).
+
+- 키: 엔드포인트 이름 + 기본값이 채워진 쿼리 파라미터 → 같은 조회는 파라미터 순서와 무관하게 같은 키
+- 값: 직렬화된 JSON 본문 + ETag + 생성 시점의 data_version
+- data_version(writer 가 데이터 변경 시 1 증가)이 바뀌면 TTL 과 무관하게 모든 항목이 무효
+- data_version 조회 자체도 version_check_sec 동안 재사용해 캐시 적중 시 DB 를 거의 건드리지 않음
+- version_source 는 동기 함수 또는 코루틴 함수 (비동기 API 는 get_async / current_version_async 사용)
+"""
+import time
+import hashlib
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional
+
+from settings import API_CACHE_TTL, API_CACHE_SIZE, API_VERSION_CHECK_SEC
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    version: int
+    expires_at: float
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(목록 / 약한 비교 / *) 가 etag 와 일치하는지."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or any(c.removeprefix("W/") == etag for c in candidates)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        version_source: Callable[[], int],
+        ttl: float = API_CACHE_TTL,
+        max_entries: int = API_CACHE_SIZE,
+        version_check_sec: float = API_VERSION_CHECK_SEC,
+    ):
+        self.version_source = version_source
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.version_check_sec = version_check_sec
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._version_checked = 0.0
+
+    def current_version(self) -> int:
+        """data_version 을 version_check_sec 간격으로만 조회. 값이 바뀌면 캐시를 비운다."""
+        version = self._fresh_version()
+        return version if version is not None else self._set_version(self.version_source())
+
+    async def current_version_async(self) -> int:
+        """version_source 가 코루틴 함수(비동기 DB 조회)여도 되는 current_version()."""
+        version = self._fresh_version()
+        if version is not None:
+            return version
+        version = self.version_source()
+        if inspect.isawaitable(version):
+            version = await version
+        return self._set_version(version)
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        return self._lookup(key, self.current_version())
+
+    async def get_async(self, key: Hashable) -> Optional[CachedResponse]:
+        return self._lookup(key, await self.current_version_async())
+
+    def put(self, key: Hashable, body: bytes, version: int) -> CachedResponse:
+        entry = CachedResponse(body, make_etag(body), version, time.monotonic() + self.ttl)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def _fresh_version(self) -> Optional[int]:
+        with self._lock:
+            if self._version is not None and time.monotonic() - self._version_checked < self.version_check_sec:
+                return self._version
+        return None
+
+    def _set_version(self, version: int) -> int:
+        with self._lock:
+            if version != self._version:
+                if self._version is not None:
+                    # 항목별 version 비교로도 걸러지지만, 이전 버전 응답이 메모리를 차지하지 않도록 비움
+                    logger.info(f"[api_cache] data_version {self._version} → {version}, 캐시 {len(self._entries)}건 무효화")
+                    self._entries.clear()
+                self._version = version
+            self._version_checked = time.monotonic()
+        return version
+
+    def _lookup(self, key: Hashable, version: int) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_sec": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "data_version": self._version,
+            }
@@ -1,13 +1,21 @@
+import json
 import logging
+import datetime as dt
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Awaitable, Callable, Hashable, Optional
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from sqlalchemy import select, and_
-
-from db.writer import init_db, get_session
-from db.models import StockPrice, NewsArticle
+from sqlalchemy import Float, select, and_, func
+
+from api.cache import ResponseCache, etag_matches
+from api.metrics import MetricsMiddleware, render_metrics
+from api.pagination import InvalidCursor, decode_cursor, keyset_page, split_page
+from db.async_session import get_async_session, get_data_version_async, dispose_async_engine
+from db.writer import init_db
+from db.models import StockPrice, NewsArticle, DailySentiment
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
 from settings import TICKERS
 
 logger = logging.getLogger(__name__)
@@ -17,9 +25,11 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    init_db()
+    # 마이그레이션은 동기 엔진(alembic)으로 1회 적용, 요청 처리는 비동기 엔진 사용
+    await run_in_threadpool(init_db)
     logger.info("[api] 서버 시작")
     yield
+    await dispose_async_engine()
     logger.info("[api] 서버 종료")
 
 
@@ -29,6 +39,12 @@ app = FastAPI(
     version="0.1.0",
     lifespan=lifespan,
 )
+# 경로별 지연 히스토그램 / 응답 수 (/metrics)
+app.add_middleware(MetricsMiddleware)
+
+
+# 읽기 API 응답 캐시 (파이프라인이 데이터를 바꾸면 data_version 으로 무효화)
+response_cache = ResponseCache(version_source=get_data_version_async)
 
 
 # ── Response Schemas ──────────────────────────────────────────
@@ -59,6 +75,16 @@ class NewsArticleResponse(BaseModel):
         from_attributes = True
 
 
+class StockPricePage(BaseModel):
+    items: list[StockPriceResponse]
+    next_cursor: Optional[str]
+
+
+class NewsArticlePage(BaseModel):
+    items: list[NewsArticleResponse]
+    next_cursor: Optional[str]
+
+
 class DailySummaryResponse(BaseModel):
     ticker: str
     date: str
@@ -68,79 +94,101 @@ class DailySummaryResponse(BaseModel):
     positive_count: int
     negative_count: int
     neutral_count: int
+    mean_score: Optional[float]
+    min_score: Optional[float]
+    max_score: Optional[float]
 
 
 # ── Endpoints ─────────────────────────────────────────────────
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """서버 상태 확인"""
     return {"status": "ok"}
 
 
+@app.get("/cache/stats", summary="응답 캐시 적중률 조회")
+async def get_cache_stats():
+    """응답 캐시 항목 수, 적중/미적중 횟수, 현재 data_version"""
+    return response_cache.stats()
+
+
+@app.get("/metrics", summary="Prometheus 메트릭", include_in_schema=False)
+async def get_metrics():
+    """경로별 요청 지연 히스토그램, 응답 수, DB 풀 상태 (Prometheus 텍스트 포맷)"""
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get(
     "/stocks/{ticker}/prices",
-    response_model=list[StockPriceResponse],
+    response_model=StockPricePage,
     summary="주가 이력 조회",
 )
-def get_stock_prices(
+async def get_stock_prices(
+    request: Request,
     ticker: str,
-    limit: int = Query(default=30, ge=1, le=100, description="조회할 최대 행 수"),
+    limit: int = Query(default=30, ge=1, le=100, description="페이지당 최대 행 수"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor (다음 페이지)"),
 ):
     """
     ticker의 일별 주가 데이터를 최신순으로 반환.
     지원 ticker: 005930.KS, TSLA
+    next_cursor 가 있으면 cursor 로 넘겨 다음 페이지를 조회 (마지막 페이지면 null).
     """
     _validate_ticker(ticker)
-    with get_session() as session:
-        rows = session.execute(
-            select(StockPrice)
-            .where(StockPrice.ticker == ticker)
-            .order_by(StockPrice.date.desc())
-            .limit(limit)
-        ).scalars().all()
+    after = _decode_cursor(cursor, PRICE_CURSOR)
+    return await _cached_json(
+        request, ("prices", ticker, limit, cursor), lambda: _load_prices(ticker, limit, after),
+    )
 
-    if not rows:
+
+async def _load_prices(ticker: str, limit: int, after: Optional[tuple] = None) -> dict:
+    async with get_async_session() as session:
+        rows = (await session.execute(_prices_stmt(ticker, limit, after))).all()
+
+    if not rows and after is None:
         raise HTTPException(status_code=404, detail=f"{ticker} 주가 데이터가 없습니다.")
 
-    return [_price_to_dict(r) for r in rows]
+    rows, next_cursor = split_page(rows, limit, key=lambda r: (r.date,))
+    return {"items": [_price_to_dict(r) for r in rows], "next_cursor": next_cursor}
 
 
 @app.get(
     "/stocks/{ticker}/news",
-    response_model=list[NewsArticleResponse],
+    response_model=NewsArticlePage,
     summary="뉴스 감정분석 이력 조회",
 )
-def get_news_articles(
+async def get_news_articles(
+    request: Request,
     ticker: str,
-    date: Optional[str] = Query(default=None, description="날짜 필터 (YYYY-MM-DD)"),
+    date: Optional[dt.date] = Query(default=None, description="날짜 필터 (YYYY-MM-DD)"),
     sentiment: Optional[str] = Query(default=None, description="감정 필터 (positive/negative/neutral)"),
-    limit: int = Query(default=30, ge=1, le=100, description="조회할 최대 행 수"),
+    limit: int = Query(default=30, ge=1, le=100, description="페이지당 최대 행 수"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor (다음 페이지)"),
 ):
     """
     ticker의 뉴스 기사 및 감정분석 결과를 최신순으로 반환.
-    date, sentiment 필터 사용 가능.
+    date, sentiment 필터 사용 가능. 페이지 이동은 같은 필터 + cursor 로.
     """
     _validate_ticker(ticker)
+    after = _decode_cursor(cursor, NEWS_CURSOR)
+    return await _cached_json(
+        request, ("news", ticker, date, sentiment, limit, cursor),
+        lambda: _load_news(ticker, date, sentiment, limit, after),
+    )
 
-    conditions = [NewsArticle.ticker == ticker]
-    if date:
-        conditions.append(NewsArticle.date == date)
-    if sentiment:
-        conditions.append(NewsArticle.sentiment_label == sentiment)
 
-    with get_session() as session:
-        rows = session.execute(
-            select(NewsArticle)
-            .where(and_(*conditions))
-            .order_by(NewsArticle.date.desc())
-            .limit(limit)
-        ).scalars().all()
+async def _load_news(
+    ticker: str, date: Optional[dt.date], sentiment: Optional[str], limit: int, after: Optional[tuple] = None,
+) -> dict:
+    async with get_async_session() as session:
+        rows = (await session.execute(_news_stmt(ticker, date, sentiment, limit, after))).all()
 
-    if not rows:
+    if not rows and after is None:
         raise HTTPException(status_code=404, detail="조건에 맞는 기사가 없습니다.")
 
-    return [_article_to_dict(r) for r in rows]
+    rows, next_cursor = split_page(rows, limit, key=lambda r: (r.date, r.id))
+    return {"items": [_article_to_dict(r) for r in rows], "next_cursor": next_cursor}
 
 
 @app.get(
@@ -148,7 +196,8 @@ def get_news_articles(
     response_model=list[DailySummaryResponse],
     summary="일별 주가 + 감정 요약 조회",
 )
-def get_daily_summary(
+async def get_daily_summary(
+    request: Request,
     ticker: str,
     limit: int = Query(default=10, ge=1, le=30, description="조회할 최대 일수"),
 ):
@@ -157,45 +206,54 @@ def get_daily_summary(
     파이프라인 동작 확인용 핵심 엔드포인트.
     """
     _validate_ticker(ticker)
+    return await _cached_json(request, ("summary", ticker, limit), lambda: _load_daily_summary(ticker, limit))
 
-    with get_session() as session:
-        prices = session.execute(
-            select(StockPrice)
-            .where(StockPrice.ticker == ticker)
-            .order_by(StockPrice.date.desc())
-            .limit(limit)
-        ).scalars().all()
-
-        if not prices:
-            raise HTTPException(status_code=404, detail=f"{ticker} 데이터가 없습니다.")
-
-        summaries = []
-        for price in prices:
-            articles = session.execute(
-                select(NewsArticle).where(
-                    and_(
-                        NewsArticle.ticker == ticker,
-                        NewsArticle.date == price.date,
-                    )
-                )
-            ).scalars().all()
-
-            summaries.append({
-                "ticker":           ticker,
-                "date":             str(price.date),
-                "direction":        price.direction,
-                "price_change_pct": price.price_change_pct,
-                "article_count":    len(articles),
-                "positive_count":   sum(1 for a in articles if a.sentiment_label == "positive"),
-                "negative_count":   sum(1 for a in articles if a.sentiment_label == "negative"),
-                "neutral_count":    sum(1 for a in articles if a.sentiment_label == "neutral"),
-            })
-
-    return summaries
+
+async def _load_daily_summary(ticker: str, limit: int) -> list[dict]:
+    async with get_async_session() as session:
+        rows = (await session.execute(_daily_summary_stmt(ticker, limit))).mappings().all()
+
+    if not rows:
+        raise HTTPException(status_code=404, detail=f"{ticker} 데이터가 없습니다.")
+
+    return [
+        {
+            "ticker":           ticker,
+            "date":             str(r["date"]),
+            "direction":        r["direction"],
+            "price_change_pct": r["price_change_pct"],
+            "article_count":    r["article_count"],
+            "positive_count":   r["positive_count"],
+            "negative_count":   r["negative_count"],
+            "neutral_count":    r["neutral_count"],
+            "mean_score":       r["mean_score"],
+            "min_score":        r["min_score"],
+            "max_score":        r["max_score"],
+        }
+        for r in rows
+    ]
 
 
 # ── Helpers ───────────────────────────────────────────────────
 
+async def _cached_json(request: Request, key: Hashable, load: Callable[[], Awaitable[list[dict]]]) -> Response:
+    """
+    key(엔드포인트 + 정규화된 쿼리)로 응답 캐시를 조회하고, 없으면 load() 결과를 JSON 으로 직렬화해 저장.
+    ETag 를 붙여 반환하며 If-None-Match 가 일치하면 본문 없이 304.
+    load() 가 HTTPException(404 등)을 던지면 캐시하지 않는다.
+    """
+    entry = await response_cache.get_async(key)
+    if entry is None:
+        version = await response_cache.current_version_async()
+        body = json.dumps(await load(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        entry = response_cache.put(key, body, version)
+
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
 def _validate_ticker(ticker: str) -> None:
     if ticker not in TICKERS:
         raise HTTPException(
@@ -204,7 +262,88 @@ def _validate_ticker(ticker: str) -> None:
         )
 
 
-def _price_to_dict(r: StockPrice) -> dict:
+def _decode_cursor(cursor: Optional[str], types: tuple) -> Optional[tuple]:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor, types)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+# 커서 키: 주가는 (ticker, date) 가 유일하므로 date 만으로 충분 (uq_stock_price_ticker_date 순서 그대로)
+PRICE_CURSOR = (dt.date,)
+NEWS_CURSOR = (dt.date, int)
+
+
+# 응답에 필요한 컬럼만 조회 (ORM 객체 대신 Row 튜플 → identity map / 속성 계측 비용 없음)
+PRICE_COLUMNS = (
+    StockPrice.ticker, StockPrice.date, StockPrice.open, StockPrice.close, StockPrice.volume,
+    StockPrice.price_change, StockPrice.price_change_pct, StockPrice.direction,
+)
+# content(본문)는 응답에 없으므로 읽지 않음. id 는 커서용
+NEWS_COLUMNS = (
+    NewsArticle.id, NewsArticle.ticker, NewsArticle.date, NewsArticle.url, NewsArticle.title,
+    NewsArticle.sentiment_label, NewsArticle.sentiment_score,
+)
+
+
+def _prices_stmt(ticker: str, limit: int, after: Optional[tuple] = None):
+    """limit+1 행을 읽는다 (split_page 로 다음 페이지 여부 판단)."""
+    stmt = select(*PRICE_COLUMNS).where(StockPrice.ticker == ticker)
+    return keyset_page(stmt, [StockPrice.date], after, limit)
+
+
+def _news_stmt(
+    ticker: str, date: Optional[dt.date], sentiment: Optional[str], limit: int, after: Optional[tuple] = None,
+):
+    """(date, id) 키셋 → ix_news_articles_ticker_date_id / ix_news_articles_ticker_label_date_id 순서로 읽음."""
+    conditions = [NewsArticle.ticker == ticker]
+    if date:
+        conditions.append(NewsArticle.date == date)
+    if sentiment:
+        conditions.append(NewsArticle.sentiment_label == sentiment)
+    stmt = select(*NEWS_COLUMNS).where(and_(*conditions))
+    return keyset_page(stmt, [NewsArticle.date, NewsArticle.id], after, limit)
+
+
+def _daily_summary_stmt(ticker: str, limit: int):
+    """
+    최근 limit일 주가에 daily_sentiment 롤업을 붙이는 단일 쿼리 (news_articles 는 읽지 않음 → O(일수)).
+    SELECT p.date, p.direction, p.price_change_pct,
+           coalesce(s.article_count, 0), ..., s.score_sum / nullif(s.score_count, 0), s.min_score, s.max_score
+    FROM (최근 limit일 stock_prices) p
+    LEFT JOIN daily_sentiment s ON s.ticker = :ticker AND s.date = p.date
+    ORDER BY p.date DESC
+    """
+    prices = (
+        select(StockPrice.date, StockPrice.direction, StockPrice.price_change_pct)
+        .where(StockPrice.ticker == ticker)
+        .order_by(StockPrice.date.desc())
+        .limit(limit)
+        .subquery("p")
+    )
+    s = DailySentiment
+
+    return (
+        select(
+            prices.c.date,
+            prices.c.direction,
+            prices.c.price_change_pct,
+            func.coalesce(s.article_count, 0).label("article_count"),
+            func.coalesce(s.positive_count, 0).label("positive_count"),
+            func.coalesce(s.negative_count, 0).label("negative_count"),
+            func.coalesce(s.neutral_count, 0).label("neutral_count"),
+            (s.score_sum / func.nullif(s.score_count, 0, type_=Float)).label("mean_score"),
+            s.min_score,
+            s.max_score,
+        )
+        .select_from(prices.outerjoin(s, and_(s.ticker == ticker, s.date == prices.c.date)))
+        .order_by(prices.c.date.desc())
+    )
+
+
+def _price_to_dict(r) -> dict:
     return {
         "ticker":           r.ticker,
         "date":             str(r.date),
@@ -217,7 +356,7 @@ def _price_to_dict(r: StockPrice) -> dict:
     }
 
 
-def _article_to_dict(r: NewsArticle) -> dict:
+def _article_to_dict(r) -> dict:
     return {
         "ticker":          r.ticker,
         "date":            str(r.date),
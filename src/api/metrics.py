@@ -0,0 +1,58 @@
+"""
+API 메트릭: 경로별 요청 지연 히스토그램 + 응답 수 (ASGI 미들웨어) + DB 풀 상태.
+/metrics 가 metrics.REGISTRY 를 Prometheus 텍스트 포맷으로 노출한다.
+
+라벨의 route 는 실제 경로가 아니라 경로 템플릿(/stocks/{ticker}/news)이라 ticker 수와 무관하게 시계열 수가 고정된다.
+라우트에 맞지 않은 요청(404)은 route="unmatched" 로 묶는다.
+BaseHTTPMiddleware 대신 순수 ASGI 미들웨어로 구현해 요청마다 태스크 / 스트림을 추가로 만들지 않는다.
+"""
+import time
+
+from db.async_session import pool_stats
+from metrics import REGISTRY, counter, gauge, histogram
+
+# 캐시 적중(수 ms)부터 statement_timeout(DB_STATEMENT_TIMEOUT_MS) 근처까지
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+REQUEST_SECONDS = histogram(
+    "stockmind_http_request_duration_seconds", "경로별 요청 처리 시간(초)", ["method", "route"], LATENCY_BUCKETS,
+)
+REQUESTS = counter("stockmind_http_requests_total", "경로 / 상태 코드별 응답 수", ["method", "route", "status"])
+DB_POOL = gauge("stockmind_db_pool_connections", "API 비동기 커넥션 풀 상태", ["state"])
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 라우터가 매칭한 라우트를 scope["route"] 에 남김
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            REQUEST_SECONDS.observe(time.perf_counter() - started, method=method, route=route)
+            REQUESTS.inc(method=method, route=route, status=status)
+
+
+def render_metrics() -> str:
+    """DB 풀 상태를 갱신한 뒤 전체 레지스트리를 텍스트 포맷으로."""
+    stats = pool_stats()
+    if stats is not None:
+        for state, value in stats.items():
+            DB_POOL.set(value, state=state)
+    return REGISTRY.render()
@@ -0,0 +1,73 @@
+"""
+키셋(커서) 페이지네이션.
+
+OFFSET 은 앞 페이지 행을 모두 읽고 버리므로 뒤 페이지일수록 느려진다.
+대신 마지막 행의 정렬 키(date, id)를 커서로 넘기고 다음 페이지는
+WHERE (date, id) < (:date, :id) ORDER BY date DESC, id DESC LIMIT n 으로 읽는다.
+정렬 순서와 같은 인덱스를 타므로 몇 번째 페이지든 비용이 같다.
+
+커서는 정렬 키 값을 JSON → base64url 로 감싼 불투명 문자열이며, 클라이언트는 해석하지 않고 그대로 돌려준다.
+"""
+import json
+import base64
+import binascii
+import datetime as dt
+from typing import Optional, Sequence
+
+from sqlalchemy import tuple_
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class InvalidCursor(ValueError):
+    """디코딩할 수 없거나 엔드포인트와 맞지 않는 커서."""
+
+
+def encode_cursor(*keys) -> str:
+    """정렬 키 값(date, id 등) → 불투명 커서 문자열."""
+    payload = [k.isoformat() if isinstance(k, dt.date) else k for k in keys]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> tuple:
+    """
+    encode_cursor() 의 역. types 순서대로 값을 변환 (dt.date 는 ISO 문자열에서 복원).
+    형식이 다르면 InvalidCursor.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise InvalidCursor("커서 키 개수가 맞지 않습니다.")
+        return tuple(
+            dt.date.fromisoformat(v) if t is dt.date else t(v)
+            for v, t in zip(values, types)
+        )
+    except InvalidCursor:
+        raise
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursor(f"잘못된 커서: {e}") from None
+
+
+def keyset_page(stmt: Select, columns: Sequence[ColumnElement], cursor: Optional[tuple], limit: int) -> Select:
+    """
+    stmt 에 columns 내림차순 정렬 + 커서 이후 조건 + LIMIT limit+1 을 붙인다.
+    한 행을 더 읽어 다음 페이지 존재 여부를 판단한다 (split_page).
+    """
+    if cursor is not None:
+        if len(columns) == 1:
+            stmt = stmt.where(columns[0] < cursor[0])
+        else:
+            # 행 비교 (date, id) < (:date, :id) → 인덱스 범위 조건으로 사용됨
+            # 행 비교만으로는 파티션 pruning 이 되지 않으므로 첫 키(파티션 키 date) 단독 상한도 함께 건다
+            stmt = stmt.where(tuple_(*columns) < tuple_(*cursor), columns[0] <= cursor[0])
+    return stmt.order_by(*(c.desc() for c in columns)).limit(limit + 1)
+
+
+def split_page(rows: list, limit: int, key) -> tuple[list, Optional[str]]:
+    """keyset_page() 로 읽은 rows → (이번 페이지 rows, next_cursor). key(row) 는 정렬 키 튜플."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*key(rows[-1]))
@@ -0,0 +1,234 @@
+"""
+과거 데이터 백필 (신규 ticker 온보딩, 수집 공백 복구).
+
+- 주가: [start, end] 를 chunk_days 일 구간으로 나눠 최대 workers 개를 동시에 조회하고
+        COPY 경로(upsert_stock_prices(bulk=True))로 저장
+- 뉴스: Yahoo 뉴스 목록/RSS 는 날짜 범위 조회를 지원하지 않으므로 깊게 스크롤한 1회 탐색 결과 중
+        [start, end] 안에 발행된 기사만 저장 (목록에 남아 있는 기간까지만 채워짐)
+        링크 소스 실패 / 기사 수집 실패가 있으면 완료 기록을 남기지 않아 다음 실행 때 다시 탐색
+- 뉴스를 넣기 전에 [start, end] 의 news_articles 월 파티션을 만들어 둠
+- 구간 저장이 끝날 때마다 backfill_checkpoints 에 기록 → 중단 후 같은 명령을 다시 실행하면 남은 구간만 처리
+  (--restart 로 기록을 지우고 처음부터)
+
+    PYTHONPATH=src python src/backfill.py --start 2021-01-01 [--end 2026-10-16] [--ticker NVDA ...]
+                                          [--chunk-days 90] [--workers 4] [--no-news] [--restart]
+"""
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Iterable, Iterator, Optional
+
+from settings import (
+    TICKERS, PRICE_INTERVAL, BACKFILL_CHUNK_DAYS, BACKFILL_WORKERS, BACKFILL_MAX_SCROLL, BACKFILL_MAX_ARTICLES,
+    BULK_COPY_CHUNK_ROWS,
+)
+from collector.driver_pool import shutdown_driver_pool
+from collector.price_fetcher import fetch_price_range
+from collector.link_sources import discover_links
+from collector.article_fetcher import iter_articles
+from analyzer.sentiment import iter_analyzed
+from db.writer import (
+    init_db, upsert_stock_prices, insert_articles_stream, filter_new_urls,
+    get_completed_chunks, record_checkpoint, clear_checkpoints, prepare_news_partitions,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(threadName)s %(name)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger(__name__)
+
+
+def split_range(start: date, end: date, chunk_days: int = BACKFILL_CHUNK_DAYS) -> list[tuple[date, date]]:
+    """[start, end] (양끝 포함) → chunk_days 일 단위 연속 구간 목록. 구간 경계는 start 기준으로 고정."""
+    if end < start:
+        return []
+    step = timedelta(days=max(1, chunk_days))
+    chunks = []
+    cursor = start
+    while cursor <= end:
+        chunk_end = min(end, cursor + step - timedelta(days=1))
+        chunks.append((cursor, chunk_end))
+        cursor = chunk_end + timedelta(days=1)
+    return chunks
+
+
+# ── 주가 ──────────────────────────────────────────────────────
+
+def _backfill_price_chunk(ticker: str, chunk: tuple[date, date], interval: str) -> int:
+    rows = fetch_price_range(ticker, chunk[0], chunk[1], interval=interval)
+    saved = upsert_stock_prices(rows, bulk=True) if rows else 0
+    record_checkpoint(ticker, "prices", chunk[0], chunk[1], saved)
+    return saved
+
+
+def backfill_prices(
+    ticker: str,
+    start: date,
+    end: date,
+    chunk_days: int = BACKFILL_CHUNK_DAYS,
+    workers: int = BACKFILL_WORKERS,
+    interval: str = PRICE_INTERVAL,
+) -> dict:
+    """
+    완료 기록이 없는 구간만 병렬 조회 + 저장. 실패한 구간은 기록하지 않아 다음 실행 때 다시 시도된다.
+    반환값: {"chunks", "skipped", "failed", "rows"}
+    """
+    chunks = split_range(start, end, chunk_days)
+    done = get_completed_chunks(ticker, "prices")
+    pending = [c for c in chunks if c not in done]
+    result = {"chunks": len(chunks), "skipped": len(chunks) - len(pending), "failed": 0, "rows": 0}
+    if not pending:
+        logger.info(f"[backfill] {ticker} 주가: {len(chunks)}개 구간 모두 완료 상태")
+        return result
+
+    logger.info(
+        f"[backfill] {ticker} 주가: {len(pending)}/{len(chunks)}개 구간 처리 "
+        f"({result['skipped']}개는 이전 실행에서 완료, workers={workers})"
+    )
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="backfill") as pool:
+        futures = {pool.submit(_backfill_price_chunk, ticker, c, interval): c for c in pending}
+        for fut in as_completed(futures):
+            chunk = futures[fut]
+            try:
+                saved = fut.result()
+            except Exception as e:
+                result["failed"] += 1
+                logger.warning(f"[backfill] {ticker} 주가 {chunk[0]}~{chunk[1]} 실패: {e}")
+                continue
+            result["rows"] += saved
+            logger.info(f"[backfill] {ticker} 주가 {chunk[0]}~{chunk[1]}: {saved}건 저장")
+    return result
+
+
+# ── 뉴스 ──────────────────────────────────────────────────────
+
+def _in_range(articles: Iterable[dict], start: date, end: date, counter: dict) -> Iterator[dict]:
+    """수집 실패(counter["failed"]) / 발행일이 구간 밖인(counter["dropped"]) 기사는 감정 분석 전에 버림."""
+    lo, hi = start.isoformat(), end.isoformat()
+    for a in articles:
+        if a.get("error"):
+            counter["failed"] += 1
+        elif lo <= (a.get("date") or "") <= hi:
+            yield a
+        else:
+            counter["dropped"] += 1
+
+
+def backfill_news(
+    ticker: str,
+    start: date,
+    end: date,
+    max_scroll: int = BACKFILL_MAX_SCROLL,
+    max_articles: int = BACKFILL_MAX_ARTICLES,
+) -> dict:
+    """
+    뉴스 1회 탐색 → 구간 안 기사만 스트리밍으로 분석/저장 (COPY 경로 크기로 묶어 저장).
+    RSS 후보만으로 멈추지 않도록 min_candidates=max_articles 로 탐색해 Selenium 목록을 max_scroll 만큼 스크롤한다.
+    이미 저장된 URL 은 filter_new_urls 로 제외되므로 중간에 끊겨도 재실행 시 남은 기사만 처리된다.
+    링크 소스나 기사 수집이 하나라도 실패하면 완료 기록을 남기지 않는다 (다음 실행 때 재시도).
+    반환값: {"skipped", "links", "dropped", "failed", "inserted", "completed"}
+    """
+    result = {"skipped": False, "links": 0, "dropped": 0, "failed": 0, "inserted": 0, "completed": False}
+    if (start, end) in get_completed_chunks(ticker, "news"):
+        logger.info(f"[backfill] {ticker} 뉴스: {start}~{end} 완료 상태")
+        result["skipped"] = True
+        return result
+
+    failed_sources: list[str] = []
+    links = discover_links(
+        ticker, max_scroll=max_scroll, max_articles=max_articles, url_filter=filter_new_urls,
+        min_candidates=max_articles, failures=failed_sources,
+    )
+    result["links"] = len(links)
+    if links:
+        articles = _in_range(iter_articles(links), start, end, result)
+        result["inserted"] = insert_articles_stream(ticker, iter_analyzed(articles), batch_size=BULK_COPY_CHUNK_ROWS)
+    logger.info(
+        f"[backfill] {ticker} 뉴스: 링크 {result['links']}개, 구간 밖 {result['dropped']}개, "
+        f"수집 실패 {result['failed']}개, 저장 {result['inserted']}건"
+    )
+
+    if failed_sources or result["failed"]:
+        logger.warning(
+            f"[backfill] {ticker} 뉴스 {start}~{end}: 실패한 소스 {failed_sources or '-'}, "
+            f"수집 실패 {result['failed']}개 → 완료 기록 없이 종료 (다음 실행 때 재시도)"
+        )
+        return result
+    record_checkpoint(ticker, "news", start, end, result["inserted"])
+    result["completed"] = True
+    return result
+
+
+# ── 진입점 ────────────────────────────────────────────────────
+
+def backfill(
+    tickers: list[str],
+    start: date,
+    end: Optional[date] = None,
+    chunk_days: int = BACKFILL_CHUNK_DAYS,
+    workers: int = BACKFILL_WORKERS,
+    news: bool = True,
+    restart: bool = False,
+) -> list[dict]:
+    """ticker 를 차례로 백필 (ticker 안에서 주가 구간을 병렬 처리). 반환값: ticker별 결과"""
+    end = end or date.today()
+    init_db()
+    if news:
+        # 과거 기사가 DEFAULT 파티션에 쌓이지 않도록 구간의 월 파티션을 먼저 만듦
+        prepare_news_partitions(start, end)
+    logger.info(f"=== 백필 시작 | tickers={tickers} {start}~{end} chunk={chunk_days}일 workers={workers} ===")
+
+    results = []
+    started = time.perf_counter()
+    try:
+        for ticker in tickers:
+            t0 = time.perf_counter()
+            if restart:
+                logger.info(f"[backfill] {ticker} 완료 기록 {clear_checkpoints(ticker)}건 삭제 → 처음부터")
+            result = {"ticker": ticker, "prices": backfill_prices(ticker, start, end, chunk_days, workers)}
+            if news:
+                result["news"] = backfill_news(ticker, start, end)
+            result["elapsed"] = time.perf_counter() - t0
+            results.append(result)
+    finally:
+        shutdown_driver_pool()
+
+    for r in results:
+        p = r["prices"]
+        line = (
+            f"[summary] {r['ticker']}: 주가 {p['rows']}건 "
+            f"(구간 {p['chunks']}개, 건너뜀 {p['skipped']}, 실패 {p['failed']})"
+        )
+        if "news" in r:
+            n = r["news"]
+            line += f", 기사 {n['inserted']}건" + ("" if n["skipped"] or n["completed"] else " (미완료)")
+        logger.info(f"{line}, {r['elapsed']:.1f}s")
+    logger.info(f"=== 백필 종료 | {time.perf_counter() - started:.1f}s ===")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="과거 주가/뉴스 백필 (중단 후 재실행 시 이어서 진행)")
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="종료일 (기본: 오늘)")
+    parser.add_argument("--ticker", action="append", dest="tickers", help="대상 ticker (반복 지정, 기본: TICKERS)")
+    parser.add_argument("--chunk-days", type=int, default=BACKFILL_CHUNK_DAYS)
+    parser.add_argument("--workers", type=int, default=BACKFILL_WORKERS)
+    parser.add_argument("--no-news", action="store_true", help="주가만 백필")
+    parser.add_argument("--restart", action="store_true", help="완료 기록을 지우고 처음부터")
+    args = parser.parse_args()
+
+    outcome = backfill(
+        args.tickers or TICKERS, args.start, args.end,
+        chunk_days=args.chunk_days, workers=args.workers, news=not args.no_news, restart=args.restart,
+    )
+    incomplete = [
+        r for r in outcome
+        if r["prices"]["failed"] or ("news" in r and not (r["news"]["skipped"] or r["news"]["completed"]))
+    ]
+    sys.exit(1 if incomplete else 0)
@@ -1,118 +1,165 @@
-import os
 import time
-import random
 import logging
 import datetime as dt
-from typing import Iterable, Optional
-
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
 
+from collector.driver_pool import get_driver_pool
+from collector.extractors import extract_article
 from collector.http_utils import make_session, http_get, UARotator
-from settings import UA_LIST, SELENIUM
+from collector.page_cache import PageCache, cached_get, get_page_cache, get_rendered, put_rendered
+from collector.rate_limiter import HostRateLimiter, get_rate_limiter
+from metrics import record, stage
+from settings import UA_LIST, FETCH_WORKERS, OFFLINE_MODE
 
 logger = logging.getLogger(__name__)
 
 
-def _get_driver_for_fallback(user_agent: Optional[str] = None) -> webdriver.Remote:
-    opts = Options()
-    opts.add_argument("--headless=new")
-    opts.add_argument("--disable-gpu")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    if user_agent:
-        opts.add_argument(f"--user-agent={user_agent}")
-    use_remote = os.getenv("USE_REMOTE_WEBDRIVER", "false").lower() == "true"
-    if use_remote:
-        remote_url = os.getenv("SELENIUM_REMOTE_URL", "http://selenium:4444")
-        return webdriver.Remote(command_executor=remote_url, options=opts)
-    return webdriver.Chrome(options=opts)
-
-
-def _extract_title_safely(soup: BeautifulSoup) -> str:
-    og = soup.find("meta", attrs={"property": "og:title"})
-    if og and og.get("content"):
-        return og["content"].strip()
-
-    meta_title = soup.find("meta", attrs={"name": "title"})
-    if meta_title and meta_title.get("content"):
-        return meta_title["content"].strip()
-
-    for sel in ("h1", "header h1", "article h1", "div.caas-title-wrapper h1"):
-        h = soup.select_one(sel)
-        if h and h.get_text(strip=True):
-            return h.get_text(strip=True)
-
-    if soup.title and soup.title.get_text():
-        return soup.title.get_text(strip=True)
-    return ""
-
-
-def _extract_content_safely(soup: BeautifulSoup) -> str:
-    primary = soup.select("article p, main p, div[data-test-locator='mega'] p")
-    if primary:
-        return " ".join(p.get_text(strip=True) for p in primary if p.get_text(strip=True))
-
-    for sel in [
-        "div.caas-body p",
-        "div#article-body p",
-        "div[itemprop='articleBody'] p",
-        "div[itemprop='articleBody'] div p",
-        "section[data-test-locator='mega'] p",
-    ]:
-        nodes = soup.select(sel)
-        if nodes:
-            return " ".join(p.get_text(strip=True) for p in nodes if p.get_text(strip=True))
-
-    meta = soup.find("meta", {"name": "description"}) or soup.find("meta", {"property": "og:description"})
-    if meta and meta.get("content"):
-        return meta["content"].strip()
-    return ""
-
-
-def _parse_date_kst(soup: BeautifulSoup) -> str:
-    """기사 발행일을 KST 기준 YYYY-MM-DD 로 반환. 실패 시 오늘 날짜."""
-    import pandas as pd
-
-    t = soup.select_one("time[datetime]")
-    if t and t.has_attr("datetime"):
-        try:
-            utc_iso = t["datetime"].replace("Z", "+00:00")
-            kst = pd.to_datetime(utc_iso).tz_convert("Asia/Seoul").to_pydatetime()
-            return kst.strftime("%Y-%m-%d")
-        except Exception:
-            pass
-
-    for meta_name in (
-        {"property": "article:published_time"},
-        {"name": "article:published_time"},
-        {"name": "publish-date"},
-        {"itemprop": "datePublished"},
-    ):
-        meta = soup.find("meta", attrs=meta_name)
-        if meta and meta.get("content"):
-            try:
-                utc_iso = meta["content"].replace("Z", "+00:00")
-                kst = pd.to_datetime(utc_iso).tz_convert("Asia/Seoul").to_pydatetime()
-                return kst.strftime("%Y-%m-%d")
-            except Exception:
-                continue
-
-    return dt.datetime.now().strftime("%Y-%m-%d")
-
-
-def fetch_articles(
+def _fetch_one(
+    u: str,
+    session,
+    rotator: UARotator,
+    limiter: HostRateLimiter,
+    min_len_for_ok: int,
+    enable_selenium_fallback: bool,
+    cache: Optional[PageCache] = None,
+    offline: bool = OFFLINE_MODE,
+) -> dict:
+    """
+    URL 1개 수집. 실패 시 error 키를 포함한 dict 반환 (예외를 밖으로 던지지 않음).
+    소요 시간 / 성공·실패 / 원본 바이트 수는 metrics 의 article_fetch 단계로 기록.
+    """
+    started = time.perf_counter()
+    result, nbytes = _fetch_page(u, session, rotator, limiter, min_len_for_ok, enable_selenium_fallback, cache, offline)
+    failed = "error" in result
+    record(
+        "article_fetch", time.perf_counter() - started, calls=1,
+        items=0 if failed else 1, errors=1 if failed else 0, nbytes=nbytes,
+    )
+    return result
+
+
+def _fetch_page(
+    u: str,
+    session,
+    rotator: UARotator,
+    limiter: HostRateLimiter,
+    min_len_for_ok: int,
+    enable_selenium_fallback: bool,
+    cache: Optional[PageCache],
+    offline: bool,
+) -> tuple[dict, int]:
+    """_fetch_one 본체. 반환값: (기사 dict, 받은 원본 HTML 바이트 수)"""
+    nbytes = 0
+
+    def limited_get(url: str, **kwargs):
+        # 캐시에서 바로 나가는 요청은 기다리지 않도록 실제 네트워크 요청만 limiter 를 거침
+        return limiter.request(http_get, url, session=session, ua_rotator=rotator, **kwargs)
+
+    try:
+        resp = cached_get(limited_get, u, cache=cache, offline=offline)
+        nbytes = len(resp.content)
+        page = extract_article(resp.text)
+        content, title, date_str = page["content"], page["title"], page["date"]
+
+        # 본문이 너무 짧으면 Selenium 폴백 시도 (오프라인 모드에서는 캐시된 렌더링 결과만 사용)
+        if enable_selenium_fallback and len(content) < min_len_for_ok and "finance.yahoo.com" in u:
+            with stage("selenium_fallback") as st:
+                if offline:
+                    page_source = get_rendered(u, cache)
+                else:
+                    # 공유 드라이버 풀의 워밍된 세션 사용 (동시 Chrome 수는 풀 크기로 제한)
+                    with get_driver_pool().acquire(user_agent=rotator.pick()) as driver:
+                        driver.get(u)
+                        time.sleep(1.5)
+                        page_source = driver.page_source
+                    put_rendered(u, page_source, cache)
+                if page_source:
+                    st.add(items=1, nbytes=len(page_source.encode("utf-8")))
+            page2 = extract_article(page_source) if page_source else None
+            if page2 and len(page2["content"]) > len(content):
+                content = page2["content"]
+                date_str = page2["date"] or date_str
+                if page2["title"]:
+                    title = page2["title"]
+
+        logger.debug(f"[article_fetcher] 수집 완료: {u[:60]}...")
+        return {
+            "url": u,
+            "title": title or "",
+            "content": content or "",
+            "date": date_str,
+        }, nbytes
+
+    except Exception as e:
+        logger.warning(f"[article_fetcher] 실패: {u[:60]}... → {e}")
+        return {
+            "url": u,
+            "title": "",
+            "content": "",
+            "date": dt.datetime.now().strftime("%Y-%m-%d"),
+            "error": str(e),
+        }, nbytes
+
+
+def iter_articles(
     urls: Iterable[str],
     ua_mode: str = "round_robin",
-    delay_range: tuple = (0.8, 1.6),
     min_len_for_ok: int = 120,
     enable_selenium_fallback: bool = True,
-) -> list[dict]:
+    max_workers: int = FETCH_WORKERS,
+    limiter: Optional[HostRateLimiter] = None,
+    cache: Optional[PageCache] = None,
+    offline: bool = OFFLINE_MODE,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[dict]:
     """
-    URL 목록을 받아 기사 본문을 수집.
+    URL 스트림을 받아 수집된 기사를 입력 순서대로 하나씩 yield 하는 제너레이터.
+    max_workers개 스레드가 make_session()의 커넥션 풀을 공유해 동시에 수집하며,
+    호스트별 동시 요청 수와 속도는 limiter(기본값: 프로세스 공유 get_rate_limiter())가 조절하며,
+    429/503 응답을 받으면 Retry-After 만큼 쉬고 감속, 정상 응답이 이어지면 가속한다.
 
-    반환 예시:
+    동시에 진행/대기 중인 URL은 max_in_flight개(기본값 max_workers × 2)로 제한되어
+    URL 수와 무관하게 메모리 사용량이 일정하다. 소비자가 중간에 멈추면 남은 요청은 취소된다.
+
+    원본 HTML 은 PageCache(기본값: get_page_cache())에 저장되고, 다음 실행 때 ETag/Last-Modified 로
+    재검증한다. offline=True 면 네트워크 없이 캐시된 페이지만으로 추출 (캐시에 없는 URL은 error).
+    """
+    cache = cache or get_page_cache()
+    rotator = UARotator(UA_LIST, ua_mode)
+    session = make_session()
+    limiter = limiter or get_rate_limiter()
+    workers = max(1, max_workers)
+    window = max(workers, max_in_flight or workers * 2)
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch")
+    in_flight: deque[Future] = deque()
+    done = 0
+    try:
+        for u in urls:
+            in_flight.append(pool.submit(
+                _fetch_one, u, session, rotator, limiter, min_len_for_ok, enable_selenium_fallback,
+                cache, offline,
+            ))
+            if len(in_flight) >= window:
+                done += 1
+                yield in_flight.popleft().result()
+        while in_flight:
+            done += 1
+            yield in_flight.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        session.close()
+        logger.info(f"[article_fetcher] 총 {done}개 처리 완료 (workers={workers})")
+
+
+def fetch_articles(urls: Iterable[str], **kwargs) -> list[dict]:
+    """
+    URL 목록을 받아 기사 본문을 수집 (iter_articles() 결과를 리스트로 모음).
+    인자는 iter_articles() 와 동일.
+
+    반환 예시 (입력 URL 순서 유지):
     [
         {
             "url": "https://...",
@@ -124,58 +171,4 @@ def fetch_articles(
     ]
     실패한 URL은 error 키를 포함해 반환.
     """
-    rotator = UARotator(UA_LIST, ua_mode)
-    session = make_session()
-    results = []
-
-    for u in urls:
-        try:
-            resp = http_get(u, session=session, ua_rotator=rotator)
-            soup = BeautifulSoup(resp.text, "html.parser")
-            content = _extract_content_safely(soup)
-            title = _extract_title_safely(soup)
-            date_str = _parse_date_kst(soup)
-
-            # 본문이 너무 짧으면 Selenium 폴백 시도
-            if enable_selenium_fallback and len(content) < min_len_for_ok and "finance.yahoo.com" in u:
-                driver = _get_driver_for_fallback(user_agent=rotator.pick())
-                try:
-                    driver.set_page_load_timeout(SELENIUM.get("page_load_timeout", 180))
-                    driver.get(u)
-                    time.sleep(1.5)
-                    soup2 = BeautifulSoup(driver.page_source, "html.parser")
-                    content2 = _extract_content_safely(soup2)
-                    if len(content2) > len(content):
-                        content = content2
-                        date_str = _parse_date_kst(soup2) or date_str
-                        title2 = _extract_title_safely(soup2)
-                        if title2:
-                            title = title2
-                finally:
-                    try:
-                        driver.quit()
-                    except Exception:
-                        pass
-
-            results.append({
-                "url": u,
-                "title": title or "",
-                "content": content or "",
-                "date": date_str,
-            })
-            logger.debug(f"[article_fetcher] 수집 완료: {u[:60]}...")
-
-        except Exception as e:
-            logger.warning(f"[article_fetcher] 실패: {u[:60]}... → {e}")
-            results.append({
-                "url": u,
-                "title": "",
-                "content": "",
-                "date": dt.datetime.now().strftime("%Y-%m-%d"),
-                "error": str(e),
-            })
-
-        time.sleep(random.uniform(*delay_range))
-
-    logger.info(f"[article_fetcher] 총 {len(results)}개 처리 완료")
-    return results
+    return list(iter_articles(urls, **kwargs))
@@ -0,0 +1,233 @@
+import os
+import random
+import logging
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+from settings import SELENIUM, UA_LIST, DRIVER_POOL_SIZE, DRIVER_MAX_USES, DRIVER_MAX_MEMORY_MB
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+
+def build_chrome_options(user_agent: Optional[str] = None) -> "Options":
+    # selenium 은 무거우므로 실제로 브라우저가 필요할 때만 import
+    from selenium.webdriver.chrome.options import Options
+
+    opts = Options()
+    chrome_bin = os.getenv("CHROME_BIN")
+    if chrome_bin:
+        opts.binary_location = chrome_bin
+    if SELENIUM.get("headless", True):
+        opts.add_argument("--headless=new")
+    if SELENIUM.get("disable_gpu", True):
+        opts.add_argument("--disable-gpu")
+    w, h = SELENIUM.get("window_size", (1920, 1080))
+    opts.add_argument(f"--window-size={w}x{h}")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        },
+    )
+    if user_agent:
+        opts.add_argument(f"--user-agent={user_agent}")
+    return opts
+
+
+def create_driver(user_agent: Optional[str] = None) -> "webdriver.Remote":
+    """Chrome 세션 1개 생성 (USE_REMOTE_WEBDRIVER=true 면 Selenium 서버 사용)."""
+    from selenium import webdriver
+
+    options = build_chrome_options(user_agent=user_agent or random.choice(UA_LIST))
+    use_remote = os.getenv("USE_REMOTE_WEBDRIVER", "false").lower() == "true"
+    if use_remote:
+        remote_url = os.getenv("SELENIUM_REMOTE_URL", "http://selenium:4444")
+        driver = webdriver.Remote(command_executor=remote_url, options=options)
+    else:
+        driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(SELENIUM.get("page_load_timeout", 180))
+    return driver
+
+
+def _proc_rss_mb(root_pid: int) -> float:
+    """root_pid 와 모든 하위 프로세스의 RSS 합계(MB). /proc 가 없으면 0."""
+    children: dict[int, list[int]] = {}
+    rss_kb: dict[int, int] = {}
+    try:
+        pids = [int(p) for p in os.listdir("/proc") if p.isdigit()]
+    except OSError:
+        return 0.0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        rss_kb[pid] = int(line.split()[1])
+                        break
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(pid)
+
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss_kb.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total / 1024
+
+
+def driver_memory_mb(driver) -> float:
+    """
+    드라이버가 점유한 메모리(MB) 추정.
+    로컬 Chrome 은 chromedriver 프로세스 트리의 RSS, 원격 세션은 JS 힙 사용량으로 대신한다.
+    """
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None) if service else None
+    if process is not None and os.path.isdir("/proc"):
+        return _proc_rss_mb(process.pid)
+    try:
+        used = driver.execute_script(
+            "return (window.performance && performance.memory) ? performance.memory.usedJSHeapSize : 0;"
+        )
+        return (used or 0) / (1024 * 1024)
+    except Exception:
+        return 0.0
+
+
+class DriverPool:
+    """
+    워밍된 Chrome 세션을 최대 size개까지 재사용하는 풀.
+    - acquire(): 유휴 세션을 꺼내거나 없으면 새로 생성 (동시 사용 수는 size로 제한)
+    - 반납 시 쿠키 삭제 + about:blank 로 초기화
+    - max_uses 페이지를 처리했거나 메모리가 max_memory_mb 를 넘은 세션, 예외가 난 세션은 폐기
+    """
+
+    def __init__(
+        self,
+        size: int = DRIVER_POOL_SIZE,
+        max_uses: int = DRIVER_MAX_USES,
+        max_memory_mb: float = DRIVER_MAX_MEMORY_MB,
+        factory: Callable[..., object] = create_driver,
+    ):
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.max_memory_mb = max_memory_mb
+        self._factory = factory
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._idle: list = []
+        self._uses: dict[int, int] = {}
+        self.created = 0
+        self.recycled = 0
+
+    @contextmanager
+    def acquire(self, user_agent: Optional[str] = None) -> Iterator[object]:
+        with self._slots:
+            driver = self._take()
+            healthy = False
+            try:
+                if user_agent:
+                    _override_user_agent(driver, user_agent)
+                yield driver
+                healthy = True
+            finally:
+                with self._lock:
+                    self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+                self._give_back(driver, healthy)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+        logger.info(f"[driver_pool] 종료 (생성 {self.created}회, 재활용 {self.recycled}회)")
+
+    # ── 내부 ───────────────────────────────────────────────────
+
+    def _take(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        driver = self._factory()
+        with self._lock:
+            self.created += 1
+            self._uses[id(driver)] = 0
+        logger.info(f"[driver_pool] Chrome 세션 생성 ({self.created}번째)")
+        return driver
+
+    def _give_back(self, driver, healthy: bool) -> None:
+        reason = None
+        if not healthy:
+            reason = "예외 발생"
+        elif self._uses.get(id(driver), 0) >= self.max_uses:
+            reason = f"{self.max_uses}회 사용"
+        elif self.max_memory_mb and driver_memory_mb(driver) > self.max_memory_mb:
+            reason = f"메모리 {self.max_memory_mb}MB 초과"
+
+        if reason is None:
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except Exception as e:
+                reason = f"초기화 실패: {e}"
+
+        if reason is not None:
+            logger.info(f"[driver_pool] 세션 폐기 ({reason})")
+            self.recycled += 1
+            self._quit(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    def _quit(self, driver) -> None:
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def _override_user_agent(driver, user_agent: str) -> None:
+    """로컬 Chrome 은 CDP 로 세션의 UA 를 교체. 원격 세션은 생성 시 UA 를 유지."""
+    execute_cdp = getattr(driver, "execute_cdp_cmd", None)
+    if execute_cdp is None:
+        return
+    try:
+        execute_cdp("Network.setUserAgentOverride", {"userAgent": user_agent})
+    except Exception:
+        pass
+
+
+# ── 프로세스 공유 풀 ───────────────────────────────────────────
+
+_pool: Optional[DriverPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool()
+        return _pool
+
+
+def shutdown_driver_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
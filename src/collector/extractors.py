@@ -0,0 +1,481 @@
+"""
+기사 HTML → {"title", "content", "date"} 추출 엔진.
+
+- "lxml": lxml 트리를 한 번 순회하며 제목/본문/발행일 후보를 모두 수집 (기본값)
+- "bs4":  BeautifulSoup(html.parser) + CSS 선택자 폴백 (기존 로직)
+
+lxml 엔진은 bs4 엔진과 같은 우선순위 규칙을 따르며, 파싱/순회 중 예외가 나면 bs4 엔진으로 폴백한다.
+libxml2 는 잘못된 마크업(<p> 안의 블록 요소, 세미콜론 없는 엔티티, CDATA ...)을 html.parser 와 다르게 복구하므로
+lxml 엔진은 html.parser 가 만들 트리를 재현해 lxml 트리와 비교하고, 다르면 MarkupDivergence 로 bs4 폴백한다.
+"""
+import re
+import logging
+import datetime as dt
+from html import unescape
+from html.entities import name2codepoint
+from typing import TYPE_CHECKING, Callable, Optional
+
+from settings import ARTICLE_PARSER
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+# 본문 문단 선택자 (우선순위 순). primary 는 하나의 선택자 그룹으로 취급.
+CONTENT_PRIMARY_SEL = "article p, main p, div[data-test-locator='mega'] p"
+CONTENT_FALLBACK_SELS = [
+    "div.caas-body p",
+    "div#article-body p",
+    "div[itemprop='articleBody'] p",
+    "div[itemprop='articleBody'] div p",
+    "section[data-test-locator='mega'] p",
+]
+TITLE_H1_SELS = ("h1", "header h1", "article h1", "div.caas-title-wrapper h1")
+DATE_META_ATTRS = (
+    {"property": "article:published_time"},
+    {"name": "article:published_time"},
+    {"name": "publish-date"},
+    {"itemprop": "datePublished"},
+)
+
+
+def _today() -> str:
+    return dt.datetime.now().strftime("%Y-%m-%d")
+
+
+def _kst() -> dt.tzinfo:
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo("Asia/Seoul")
+    except Exception:
+        # tzdata 가 없는 slim 이미지 대비. KST 는 1988년 이후 DST 가 없어 고정 오프셋과 동일
+        return dt.timezone(dt.timedelta(hours=9), "KST")
+
+
+KST = _kst()
+
+# fromisoformat(3.10)이 받지 못하는 형태 보정: 소수 초 자릿수, 콜론 없는 오프셋(+0900)
+_FRACTION_RE = re.compile(r"(\.\d+)(?=[+-]\d{2}:?\d{2}$|$)")
+_OFFSET_RE = re.compile(r"([+-]\d{2})(\d{2})$")
+
+
+def _to_kst_date(value: str) -> str:
+    """
+    시각 문자열 → KST 기준 YYYY-MM-DD. 변환 실패 시 예외.
+    ISO-8601(Z/오프셋/소수 초) 과 RFC 2822 형식을 지원하며, 시간대가 없는 값은 거부한다.
+    """
+    text = value.strip().replace("Z", "+00:00")
+    try:
+        text = _OFFSET_RE.sub(r"\1:\2", text) if "T" in text or " " in text else text
+        text = _FRACTION_RE.sub(lambda m: m.group(1)[:7].ljust(7, "0"), text)
+        parsed = dt.datetime.fromisoformat(text)
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+        parsed = parsedate_to_datetime(value)
+    if parsed.tzinfo is None:
+        raise ValueError(f"시간대 정보 없음: {value}")
+    return parsed.astimezone(KST).strftime("%Y-%m-%d")
+
+
+# ── bs4 엔진 ──────────────────────────────────────────────────
+
+def _extract_title_safely(soup: "BeautifulSoup") -> str:
+    og = soup.find("meta", attrs={"property": "og:title"})
+    if og and og.get("content"):
+        return og["content"].strip()
+
+    meta_title = soup.find("meta", attrs={"name": "title"})
+    if meta_title and meta_title.get("content"):
+        return meta_title["content"].strip()
+
+    for sel in TITLE_H1_SELS:
+        h = soup.select_one(sel)
+        if h and h.get_text(strip=True):
+            return h.get_text(strip=True)
+
+    if soup.title and soup.title.get_text():
+        return soup.title.get_text(strip=True)
+    return ""
+
+
+def _extract_content_safely(soup: "BeautifulSoup") -> str:
+    primary = soup.select(CONTENT_PRIMARY_SEL)
+    if primary:
+        return " ".join(p.get_text(strip=True) for p in primary if p.get_text(strip=True))
+
+    for sel in CONTENT_FALLBACK_SELS:
+        nodes = soup.select(sel)
+        if nodes:
+            return " ".join(p.get_text(strip=True) for p in nodes if p.get_text(strip=True))
+
+    meta = soup.find("meta", {"name": "description"}) or soup.find("meta", {"property": "og:description"})
+    if meta and meta.get("content"):
+        return meta["content"].strip()
+    return ""
+
+
+def _parse_date_kst(soup: "BeautifulSoup") -> str:
+    """기사 발행일을 KST 기준 YYYY-MM-DD 로 반환. 실패 시 오늘 날짜."""
+    t = soup.select_one("time[datetime]")
+    if t and t.has_attr("datetime"):
+        try:
+            return _to_kst_date(t["datetime"])
+        except Exception:
+            pass
+
+    for meta_name in DATE_META_ATTRS:
+        meta = soup.find("meta", attrs=meta_name)
+        if meta and meta.get("content"):
+            try:
+                return _to_kst_date(meta["content"])
+            except Exception:
+                continue
+
+    return _today()
+
+
+def extract_bs4(html: str) -> dict:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    return {
+        "title": _extract_title_safely(soup),
+        "content": _extract_content_safely(soup),
+        "date": _parse_date_kst(soup),
+    }
+
+
+# ── html.parser 호환 검사 ─────────────────────────────────────
+#
+# lxml 트리가 bs4(html.parser) 트리와 같을 때만 lxml 엔진 결과가 bs4 엔진 결과와 같다.
+# 문서가 아래 "엄격한" 부분집합에 속하면 html.parser + bs4 가 만들 요소 시작/끝 순서를 정규식 토큰화로 재현하고,
+# extract_lxml 이 lxml 트리를 순회하며 만든 순서와 비교한다. 부분집합을 벗어나거나 순서가 다르면 MarkupDivergence.
+#   - 태그: 속성 따옴표가 올바른 시작 태그, 공백만 허용하는 끝 태그. 끝 태그는 항상 가장 안쪽 열린 태그를 닫아야 함
+#     (생략된 끝 태그 / 어긋난 중첩은 두 파서가 다르게 복구). html / head / body 는 문서 바깥쪽에 한 번씩만
+#   - 주석(<!-- -->, 본문에 -- 없음), 첫 태그 앞의 <!DOCTYPE>. 그 밖의 <!, <?, CDATA, 태그가 아닌 < 는 불허
+#   - 엔티티: 세미콜론으로 끝나는 HTML4 이름 / 유효 범위의 숫자 참조만 (bs4 는 cp1252 보정, libxml2 는 미해석)
+#   - 제어 문자 / CR 불허, script / style 은 소문자 태그와 닫는 태그가 있어야 함
+
+class MarkupDivergence(ValueError):
+    """lxml 트리가 html.parser 트리와 달라 lxml 엔진 결과를 믿을 수 없음 (extract_article 이 bs4 로 폴백)."""
+
+
+# bs4 HTMLTreeBuilder.empty_element_tags
+_VOID_TAGS = frozenset((
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed", "frame", "hr", "image", "img", "input",
+    "isindex", "keygen", "link", "menuitem", "meta", "nextid", "param", "source", "spacer", "track", "wbr",
+))
+# html.parser 가 내용을 태그로 해석하지 않는 요소 (HTMLParser.CDATA_CONTENT_ELEMENTS)
+_RAW_TEXT_TAGS = ("script", "style")
+# libxml2 가 없으면 보충하고 위치를 옮기기도 하므로 순서 비교에서 제외
+_IMPLIED_TAGS = frozenset(("html", "head", "body"))
+# 추출에 쓰는 속성은 값까지 비교
+_COMPARED_ATTRS = {
+    "meta": ("property", "name", "itemprop", "content"),
+    "time": ("datetime",),
+    "div": ("class", "id", "itemprop", "data-test-locator"),
+    "section": ("data-test-locator",),
+}
+# lang / rang 은 bs4(HTML5 표)와 libxml2(HTML4 표)의 문자가 다름
+_SAFE_ENTITIES = frozenset(name2codepoint) - {"lang", "rang"}
+
+_ATTRS = r"""(?:\s+[a-zA-Z_:][-a-zA-Z0-9_:.]*(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'=<>`]+))?)*"""
+# 특수 문자(<, &, 제어 문자)에서 시작하는 토큰. 앞의 대안이 모두 실패하면 bad 로 잡혀 부분집합 밖으로 판정
+_TOKEN_RE = re.compile(
+    # 앞의 lookahead 는 정규식 엔진이 특수 문자가 아닌 위치를 빠르게 건너뛰게 함
+    r"(?=[<&\x00-\x08\x0b-\x1f\x7f-\x9f])(?:"
+    rf"(?P<raw><(?P<rawtag>script|style)(?P<rawattrs>{_ATTRS})\s*>.*?</\s*(?P=rawtag)\s*>)"
+    rf"|(?P<start><(?P<name>[a-zA-Z][a-zA-Z0-9-]*)(?P<attrs>{_ATTRS})\s*(?P<slash>/?)>)"
+    r"|(?P<end></(?P<endname>[a-zA-Z][a-zA-Z0-9-]*)\s*>)"
+    r"|(?P<comment><!--(?!-?>)(?:(?!--).)*-->)"
+    r"|(?P<doctype><![dD][oO][cC][tT][yY][pP][eE][^<>]*>)"
+    r"|(?P<entity>&(?:[a-zA-Z][a-zA-Z0-9]*|#[0-9]{1,7}|#[xX][0-9a-fA-F]{1,6});)"
+    r"|(?P<amp>&(?![a-zA-Z0-9#]))"
+    r"|(?P<bad>[<&\x00-\x08\x0b-\x1f\x7f-\x9f]))",
+    re.S,
+)
+_ATTR_RE = re.compile(r"""([a-zA-Z_:][-a-zA-Z0-9_:.]*)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""")
+
+
+def _safe_codepoint(cp: int) -> bool:
+    return cp in (9, 10) or 32 <= cp <= 126 or 160 <= cp <= 0xD7FF or 0xE000 <= cp <= 0xFFFD or 0x10000 <= cp <= 0x10FFFD
+
+
+def _attr_values(tag: str, raw: str) -> tuple:
+    """html.parser 처럼 속성을 읽어 (같은 이름은 마지막 값, 값 없으면 "") _COMPARED_ATTRS[tag] 순서의 값 튜플."""
+    found = {}
+    for m in _ATTR_RE.finditer(raw):
+        value = next((v for v in m.group(2, 3, 4) if v is not None), "")
+        found[m.group(1).lower()] = unescape(value)
+    return tuple(found.get(k) for k in _COMPARED_ATTRS[tag])
+
+
+def _markup_events(html: str) -> list[tuple]:
+    """
+    html.parser + bs4 가 만들 트리의 요소 시작/끝 순서 [("+", tag, attrs), ("-", tag, None), ...].
+    attrs 는 _COMPARED_ATTRS 대상 태그만 값 튜플, 나머지는 None. html/head/body 는 제외.
+    엄격한 부분집합을 벗어나면 MarkupDivergence.
+    """
+    events: list[tuple] = []
+    stack: list[str] = []
+    implied_seen: set[str] = set()
+    seen_tag = False
+
+    for m in _TOKEN_RE.finditer(html):
+        kind = m.lastgroup
+        if kind == "start":
+            seen_tag = True
+            tag = m.group("name").lower()
+            if tag in _RAW_TEXT_TAGS:
+                # 닫는 태그가 없거나 대소문자가 다른 script / style
+                raise MarkupDivergence(f"<{tag}> 형식 @{m.start()}")
+            if tag in _IMPLIED_TAGS:
+                # 본문 중간 / 중복된 html·head·body 는 libxml2 가 무시하며 양옆 텍스트를 한 노드로 합침
+                if tag in implied_seen or any(t not in _IMPLIED_TAGS for t in stack):
+                    raise MarkupDivergence(f"<{tag}> 위치 @{m.start()}")
+                implied_seen.add(tag)
+            else:
+                attrs = _attr_values(tag, m.group("attrs")) if tag in _COMPARED_ATTRS else None
+                events.append(("+", tag, attrs))
+            if tag in _VOID_TAGS or m.group("slash"):
+                # 빈 요소 / <tag/> 는 바로 닫힘 (bs4 handle_startendtag)
+                if tag not in _IMPLIED_TAGS:
+                    events.append(("-", tag, None))
+            else:
+                stack.append(tag)
+        elif kind == "end":
+            seen_tag = True
+            tag = m.group("endname").lower()
+            if not stack or stack[-1] != tag:
+                raise MarkupDivergence(f"</{tag}> 가 열린 태그 {stack[-1] if stack else '-'} 와 맞지 않음 @{m.start()}")
+            stack.pop()
+            if tag not in _IMPLIED_TAGS:
+                events.append(("-", tag, None))
+        elif kind == "entity":
+            ref = m.group()[1:-1]
+            if ref[0] != "#":
+                ok = ref in _SAFE_ENTITIES
+            else:
+                ok = _safe_codepoint(int(ref[2:], 16) if ref[1] in "xX" else int(ref[1:]))
+            if not ok:
+                raise MarkupDivergence(f"엔티티 {m.group()} @{m.start()}")
+        elif kind == "raw":
+            seen_tag = True
+            tag = m.group("rawtag")
+            events.append(("+", tag, None))
+            events.append(("-", tag, None))
+        elif kind == "doctype":
+            if seen_tag:
+                raise MarkupDivergence(f"본문 중간의 DOCTYPE @{m.start()}")
+        elif kind == "bad":
+            raise MarkupDivergence(f"해석할 수 없는 {m.group()!r} @{m.start()}")
+        # comment / amp: 트리에 요소를 만들지 않음
+
+    if any(tag not in _IMPLIED_TAGS for tag in stack):
+        raise MarkupDivergence(f"닫히지 않은 태그 {stack}")
+    return events
+
+
+# ── lxml 단일 순회 엔진 ───────────────────────────────────────
+
+# bs4 가 get_text() 에서 빼는 문자열의 컨테이너 (HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS)
+# → 이 요소 안쪽(깊이 무관)의 텍스트는 모두 제외
+_SKIP_TEXT_TAGS = frozenset(("script", "style", "template", "rt", "rp"))
+
+
+def _text_strip(el) -> str:
+    """bs4 의 get_text(strip=True) 와 같은 규칙: 하위 텍스트 조각을 각각 strip 후 이어붙임."""
+    parts = []
+    stack = [(el, False)]
+    while stack:
+        node, is_tail_only = stack.pop()
+        tag = node.tag if isinstance(node.tag, str) else None
+        if not is_tail_only:
+            if tag is not None and node.text:
+                parts.append(node.text)
+            # 자식은 (본문+tail) 순서로 방문해야 하므로 역순으로 push. 제외 컨테이너는 tail 만
+            for child in reversed(node):
+                stack.append((child, True))
+                if child.tag not in _SKIP_TEXT_TAGS:
+                    stack.append((child, False))
+        elif node is not el and node.tail:
+            parts.append(node.tail)
+    return "".join(s for s in (p.strip() for p in parts) if s)
+
+
+def _text_of(el) -> str:
+    """_text_strip(), 단 제외 컨테이너 안쪽이라 None 으로 기록된 요소는 빈 문자열."""
+    return _text_strip(el) if el is not None else ""
+
+
+def _has_class(el, name: str) -> bool:
+    return name in (el.get("class") or "").split()
+
+
+def extract_lxml(html: str) -> dict:
+    """
+    lxml 단일 순회 추출. 트리가 html.parser 트리와 다르면 MarkupDivergence
+    (이때 결과가 extract_bs4 와 달라질 수 있으므로 extract_article 이 bs4 로 폴백).
+    """
+    import lxml.html
+    from lxml import etree
+
+    expected = _markup_events(html)
+    root = lxml.html.document_fromstring(html)
+
+    metas: dict[tuple[str, str], str] = {}     # (속성명, 값) → 처음 나온 meta 의 content
+    h1s: list[tuple] = []                      # (element, in_header, in_article, in_caas_title)
+    paras: dict[str, list] = {k: [] for k in ("primary", *CONTENT_FALLBACK_SELS)}
+    title_el = None
+    title_seen = False
+    time_value: Optional[str] = None
+    events: list[tuple] = []                   # _markup_events() 와 비교할 시작/끝 순서
+
+    # 조상 컨텍스트 카운터 (start 에서 +1, end 에서 -1)
+    ctx = dict.fromkeys(
+        ("header", "article", "main", "mega_div", "mega_section", "caas_title", "caas_body", "article_body", "body_prop",
+         "no_text"),
+        0,
+    )
+    pushed: list[tuple] = []
+
+    for event, el in etree.iterwalk(root, events=("start", "end")):
+        tag = el.tag if isinstance(el.tag, str) else None
+        if tag is None:
+            continue
+        if event == "end":
+            for key in pushed.pop():
+                ctx[key] -= 1
+            if tag not in _IMPLIED_TAGS:
+                events.append(("-", tag, None))
+            continue
+        if tag not in _IMPLIED_TAGS:
+            attrs = tuple(el.get(k) for k in _COMPARED_ATTRS[tag]) if tag in _COMPARED_ATTRS else None
+            events.append(("+", tag, attrs))
+        # script / template 등 안쪽 텍스트는 bs4 get_text() 에서 빠지므로 요소 대신 None 을 기록
+        node = None if ctx["no_text"] else el
+
+        if tag == "meta":
+            for attr in ("property", "name", "itemprop"):
+                value = el.get(attr)
+                if value is not None:
+                    metas.setdefault((attr, value), el.get("content"))
+        elif tag == "p":
+            if ctx["article"] or ctx["main"] or ctx["mega_div"]:
+                paras["primary"].append(node)
+            if ctx["caas_body"]:
+                paras["div.caas-body p"].append(node)
+            if ctx["article_body"]:
+                paras["div#article-body p"].append(node)
+            if ctx["body_prop"]:
+                paras["div[itemprop='articleBody'] p"].append(node)
+            if ctx["mega_section"]:
+                paras["section[data-test-locator='mega'] p"].append(node)
+        elif tag == "h1":
+            h1s.append((node, ctx["header"] > 0, ctx["article"] > 0, ctx["caas_title"] > 0))
+        elif tag == "title" and not title_seen:
+            title_el, title_seen = node, True
+        elif tag == "time" and time_value is None and el.get("datetime") is not None:
+            time_value = el.get("datetime")
+
+        keys = []
+        if tag in ("header", "article", "main"):
+            keys.append(tag)
+        elif tag == "div":
+            if el.get("data-test-locator") == "mega":
+                keys.append("mega_div")
+            if _has_class(el, "caas-title-wrapper"):
+                keys.append("caas_title")
+            if _has_class(el, "caas-body"):
+                keys.append("caas_body")
+            if el.get("id") == "article-body":
+                keys.append("article_body")
+            if el.get("itemprop") == "articleBody":
+                keys.append("body_prop")
+        elif tag == "section" and el.get("data-test-locator") == "mega":
+            keys.append("mega_section")
+        if tag in _SKIP_TEXT_TAGS:
+            keys.append("no_text")
+        for key in keys:
+            ctx[key] += 1
+        pushed.append(keys)
+
+    if events != expected:
+        at = next((i for i, (a, b) in enumerate(zip(events, expected)) if a != b), min(len(events), len(expected)))
+        raise MarkupDivergence(f"lxml 트리가 html.parser 트리와 다름 (요소 이벤트 #{at})")
+
+    return {
+        "title": _pick_title(metas, h1s, title_el),
+        "content": _pick_content(metas, paras),
+        "date": _pick_date(metas, time_value),
+    }
+
+
+def _pick_title(metas: dict, h1s: list, title_el) -> str:
+    for attr in (("property", "og:title"), ("name", "title")):
+        content = metas.get(attr)
+        if content:
+            return content.strip()
+
+    for flag in (None, 1, 2, 3):
+        first = next((h for h in h1s if flag is None or h[flag]), None)
+        if first is not None:
+            text = _text_of(first[0])
+            if text:
+                return text
+    return _text_of(title_el)
+
+
+def _pick_content(metas: dict, paras: dict) -> str:
+    for key in ("primary", *CONTENT_FALLBACK_SELS):
+        nodes = paras.get(key)
+        if nodes:
+            return " ".join(t for t in (_text_of(p) for p in nodes) if t)
+
+    # bs4: find(name=description) or find(property=og:description) → 먼저 찾은 meta 의 content
+    for attr in (("name", "description"), ("property", "og:description")):
+        if attr in metas:
+            content = metas[attr]
+            return content.strip() if content else ""
+    return ""
+
+
+def _pick_date(metas: dict, time_value: Optional[str]) -> str:
+    if time_value is not None:
+        try:
+            return _to_kst_date(time_value)
+        except Exception:
+            pass
+
+    for attrs in DATE_META_ATTRS:
+        (attr, value), = attrs.items()
+        content = metas.get((attr, value))
+        if content:
+            try:
+                return _to_kst_date(content)
+            except Exception:
+                continue
+    return _today()
+
+
+# ── 엔진 선택 ─────────────────────────────────────────────────
+
+ENGINES: dict[str, Callable[[str], dict]] = {
+    "lxml": extract_lxml,
+    "bs4": extract_bs4,
+}
+
+
+def extract_article(html: str, engine: str = ARTICLE_PARSER) -> dict:
+    """
+    engine 으로 추출하고, 실패하면 bs4 엔진으로 폴백.
+    반환값: {"title": str, "content": str, "date": "YYYY-MM-DD"}
+    """
+    extractor = ENGINES.get(engine, extract_bs4)
+    if extractor is not extract_bs4:
+        try:
+            return extractor(html)
+        except Exception as e:
+            logger.debug(f"[extractors] {engine} 추출 실패 → bs4 폴백: {e}")
+    return extract_bs4(html)
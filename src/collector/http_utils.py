@@ -1,6 +1,7 @@
 import random
+import threading
 from itertools import cycle
-from typing import Iterable, List, Optional
+from typing import List, Optional
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -14,11 +15,13 @@ class UARotator:
         self.ua_list = ua_list or UA_LIST
         self.mode = mode
         self._cycle = cycle(self.ua_list)
+        self._lock = threading.Lock()
 
     def pick(self) -> str:
         if self.mode == "random":
             return random.choice(self.ua_list)
-        return next(self._cycle)
+        with self._lock:
+            return next(self._cycle)
 
 
 def make_session(
@@ -31,7 +34,8 @@ def make_session(
         read=total_retry,
         connect=total_retry,
         backoff_factor=backoff_factor,
-        status_forcelist=(429, 500, 502, 503, 504),
+        # 429 / 503 은 rate_limiter 가 Retry-After 를 반영해 처리
+        status_forcelist=(500, 502, 504),
         allowed_methods=("GET", "HEAD", "OPTIONS"),
         raise_on_status=False,
     )
@@ -0,0 +1,157 @@
+"""
+뉴스 링크 탐색 소스.
+
+- "rss":      Yahoo Finance 헤드라인 RSS 를 HTTP 로 받아 파싱 (브라우저 없음, 기본 1순위)
+- "selenium": 뉴스 목록 페이지를 Chrome 으로 스크롤 (yahoo_scraper.scrape_listing_links)
+
+discover_links() 는 LINK_SOURCES 순서대로 후보를 모으다가 후보가 min_candidates 개 이상이면
+나머지(느린) 소스는 건너뛴다. 후보가 충분한지는 DB 중복 제거(url_filter) 이전 기준으로 판단하므로
+새 기사가 없는 날에도 Selenium 을 띄우지 않는다.
+"""
+import logging
+import xml.etree.ElementTree as ET
+from typing import Callable, List, Optional, Protocol, Sequence, Set
+
+from collector.http_utils import make_session, http_get, UARotator
+from collector.page_cache import cached_get, get_page_cache
+from collector.rate_limiter import get_rate_limiter
+from collector.url_utils import canonicalize_url
+from collector.yahoo_scraper import scrape_listing_links, select_links
+from metrics import record, stage
+from settings import (
+    UA_LIST, YF_MAX_SCROLL, YF_MAX_ARTICLES, YF_RSS_URL, LINK_SOURCES, LINK_MIN_CANDIDATES, OFFLINE_MODE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class LinkSource(Protocol):
+    name: str
+
+    def candidates(self, ticker: str, max_scroll: int = YF_MAX_SCROLL, **hints) -> List[str]:
+        """
+        ticker 뉴스 링크 후보 (표준화 전 href 도 허용, 최신순).
+        hints: stop_urls / url_filter / max_articles — 조기 종료가 가능한 소스만 사용
+        """
+        ...
+
+
+class RssLinkSource:
+    """헤드라인 RSS(<item><link>)에서 링크 추출. 응답은 페이지 캐시를 거쳐 ETag 로 재검증된다."""
+
+    name = "rss"
+
+    def __init__(self, url_template: str = YF_RSS_URL, offline: bool = OFFLINE_MODE):
+        self.url_template = url_template
+        self.offline = offline
+        self._session = make_session()
+        self._rotator = UARotator(UA_LIST)
+
+    def candidates(self, ticker: str, max_scroll: int = YF_MAX_SCROLL, **hints) -> List[str]:
+        url = self.url_template.format(ticker=ticker)
+        resp = cached_get(
+            self._get, url, cache=get_page_cache(), max_age=0, offline=self.offline,
+            headers={"Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8"},
+        )
+        record("link_scrape", nbytes=len(resp.content))
+        if resp.status_code != 200:
+            raise RuntimeError(f"RSS 응답 {resp.status_code}")
+        return parse_rss_links(resp.content)
+
+    def _get(self, url: str, **kwargs):
+        return get_rate_limiter().request(http_get, url, session=self._session, ua_rotator=self._rotator, **kwargs)
+
+
+class SeleniumLinkSource:
+    """Chrome 으로 목록 페이지를 스크롤 (느리지만 RSS 에 없는 오래된 기사까지 수집)."""
+
+    name = "selenium"
+
+    def __init__(self, offline: bool = OFFLINE_MODE):
+        self.offline = offline
+
+    def candidates(self, ticker: str, max_scroll: int = YF_MAX_SCROLL, **hints) -> List[str]:
+        # 새 링크가 충분하거나 기존 링크 구간에 도달하면 스크롤 조기 종료
+        return scrape_listing_links(ticker, max_scroll=max_scroll, offline=self.offline, **hints)
+
+
+SOURCES: dict[str, Callable[[], LinkSource]] = {
+    "rss": RssLinkSource,
+    "selenium": SeleniumLinkSource,
+}
+
+
+def parse_rss_links(body: bytes) -> List[str]:
+    """RSS 2.0 / Atom 문서에서 기사 링크를 문서 순서대로 추출."""
+    root = ET.fromstring(body)
+    links = []
+    for el in root.iter():
+        tag = el.tag.rsplit("}", 1)[-1]
+        if tag == "item":
+            link = el.findtext("link")
+            if link:
+                links.append(link.strip())
+        elif tag == "entry":
+            for child in el:
+                if child.tag.rsplit("}", 1)[-1] == "link" and child.get("href"):
+                    links.append(child.get("href"))
+                    break
+    return links
+
+
+def build_sources(names: str = LINK_SOURCES) -> List[LinkSource]:
+    sources = []
+    for name in (n.strip() for n in names.split(",")):
+        if not name:
+            continue
+        if name not in SOURCES:
+            raise ValueError(f"알 수 없는 링크 소스: {name} (가능: {', '.join(SOURCES)})")
+        sources.append(SOURCES[name]())
+    return sources
+
+
+def discover_links(
+    ticker: str,
+    max_scroll: int = YF_MAX_SCROLL,
+    max_articles: int = YF_MAX_ARTICLES,
+    stop_urls: Optional[Set[str]] = None,
+    url_filter: Optional[Callable[[List[str]], List[str]]] = None,
+    sources: Optional[Sequence[LinkSource]] = None,
+    min_candidates: int = LINK_MIN_CANDIDATES,
+    failures: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    collect_yahoo_links() 와 같은 stop_urls / url_filter / max_articles 규칙으로 링크 수집.
+    sources 를 순서대로 시도하며, 모은 후보가 min(min_candidates, max_articles) 개 이상이면 중단.
+    소스 하나가 실패해도 다음 소스로 넘어간다. failures 를 넘기면 실패한 소스 이름을 추가한다
+    (빈 결과가 "기사 없음" 인지 "탐색 실패" 인지 구분해야 하는 호출자용).
+    """
+    with stage("link_scrape") as st:
+        sources = build_sources() if sources is None else sources
+        stop_urls = {canonicalize_url(u) for u in (stop_urls or ())}
+        enough = max(1, min(min_candidates, max_articles))
+
+        candidates: List[str] = []
+        for source in sources:
+            try:
+                raw = source.candidates(
+                    ticker, max_scroll=max_scroll, stop_urls=stop_urls, url_filter=url_filter,
+                    max_articles=max_articles,
+                )
+                found = select_links(raw, set(), None, len(raw))
+            except Exception as e:
+                logger.warning(f"[link_sources] {ticker} {source.name} 실패: {e}")
+                st.add(errors=1)
+                if failures is not None:
+                    failures.append(source.name)
+                continue
+            known = set(candidates)
+            candidates.extend(u for u in found if u not in known)
+            logger.info(f"[link_sources] {ticker} {source.name}: 후보 {len(found)}개 (누적 {len(candidates)}개)")
+            if len(candidates) >= enough:
+                break
+
+        links = select_links(candidates, stop_urls, url_filter, max_articles)
+        st.add(items=len(links))
+    logger.info(f"[link_sources] {ticker} 링크 {len(links)}개 수집")
+    return links
@@ -0,0 +1,289 @@
+"""
+수집한 원본 페이지(기사 HTML, 차트 JSON, Selenium 렌더링 결과) 디스크 캐시.
+
+- 본문: 내용 해시(SHA-256) 이름의 gzip 파일 → 같은 내용은 키가 달라도 한 번만 저장
+- 색인: SQLite (키 → 내용 해시, ETag, Last-Modified, 인코딩, 수집 시각)
+- 용량: max_bytes 를 넘으면 가장 오래 접근하지 않은 본문부터 삭제 (LRU)
+
+cached_get() 은 캐시된 ETag/Last-Modified 로 조건부 요청을 보내 304 면 캐시 본문을 돌려주고,
+OFFLINE_MODE 에서는 네트워크 없이 캐시만 사용한다 (없으면 OfflineCacheMiss).
+"""
+import os
+import gzip
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from settings import (
+    PAGE_CACHE_ENABLED, PAGE_CACHE_DIR, PAGE_CACHE_MAX_MB, PAGE_CACHE_MAX_AGE, OFFLINE_MODE,
+)
+
+logger = logging.getLogger(__name__)
+
+# Selenium 으로 렌더링한 page_source 는 HTTP 응답과 구분해 저장
+RENDERED_PREFIX = "rendered:"
+
+
+class OfflineCacheMiss(LookupError):
+    """오프라인 모드에서 캐시에 없는 페이지를 요청한 경우."""
+
+
+@dataclass
+class CachedPage:
+    key: str
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    encoding: Optional[str]
+    fetched_at: float
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+
+class PageCache:
+    """
+    키(보통 URL) → 원본 바이트 캐시. 여러 스레드가 공유한다.
+    """
+
+    def __init__(self, root: str = PAGE_CACHE_DIR, max_bytes: int = PAGE_CACHE_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max(1, max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(root, "index.sqlite"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            " hash TEXT PRIMARY KEY, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " key TEXT PRIMARY KEY, hash TEXT NOT NULL, etag TEXT, last_modified TEXT,"
+            " encoding TEXT, fetched_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_pages_hash ON pages (hash)")
+        self._conn.commit()
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def get(self, key: str) -> Optional[CachedPage]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hash, etag, last_modified, encoding, fetched_at FROM pages WHERE key = ?", (key,)
+            ).fetchone()
+            body = self._read_blob(row[0]) if row else None
+            if body is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE blobs SET accessed_at = ? WHERE hash = ?", (time.time(), row[0]))
+            self._conn.commit()
+        return CachedPage(key, body, row[1], row[2], row[3], row[4])
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        encoding: Optional[str] = None,
+    ) -> None:
+        digest = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        with self._lock:
+            known = self._conn.execute("SELECT size FROM blobs WHERE hash = ?", (digest,)).fetchone()
+            if known and os.path.exists(self._blob_path(digest)):
+                self._conn.execute("UPDATE blobs SET accessed_at = ? WHERE hash = ?", (now, digest))
+            else:
+                if known:
+                    self._total -= known[0]
+                size = self._write_blob(digest, body)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO blobs (hash, size, accessed_at) VALUES (?, ?, ?)", (digest, size, now)
+                )
+                self._total += size
+
+            old = self._conn.execute("SELECT hash FROM pages WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (key, hash, etag, last_modified, encoding, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, digest, etag, last_modified, encoding, now),
+            )
+            if old and old[0] != digest:
+                self._drop_unreferenced(old[0])
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, key: str) -> None:
+        """304 재검증 성공 → 수집 시각만 갱신."""
+        with self._lock:
+            self._conn.execute("UPDATE pages SET fetched_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            pages = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            blobs = self._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+        return {"pages": pages, "blobs": blobs, "bytes": self._total, "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ── 내부 ───────────────────────────────────────────────────
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, "blobs", digest[:2], f"{digest}.gz")
+
+    def _write_blob(self, digest: str, body: bytes) -> int:
+        path = self._blob_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(gzip.compress(body, compresslevel=6))
+        os.replace(tmp, path)
+        return os.path.getsize(path)
+
+    def _read_blob(self, digest: str) -> Optional[bytes]:
+        try:
+            with open(self._blob_path(digest), "rb") as f:
+                return gzip.decompress(f.read())
+        except (OSError, EOFError) as e:
+            # 파일이 지워졌거나 깨진 경우 → 색인도 정리하고 miss 처리
+            logger.warning(f"[page_cache] 캐시 파일 손상/누락 {digest[:12]}: {e}")
+            self._remove_blob(digest)
+            self._conn.commit()
+            return None
+
+    def _drop_unreferenced(self, digest: str) -> None:
+        if not self._conn.execute("SELECT 1 FROM pages WHERE hash = ? LIMIT 1", (digest,)).fetchone():
+            self._remove_blob(digest)
+
+    def _remove_blob(self, digest: str) -> None:
+        row = self._conn.execute("SELECT size FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        self._conn.execute("DELETE FROM pages WHERE hash = ?", (digest,))
+        self._conn.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+        if row:
+            self._total -= row[0]
+        try:
+            os.remove(self._blob_path(digest))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        if self._total <= self.max_bytes:
+            return
+        victims = self._conn.execute("SELECT hash FROM blobs ORDER BY accessed_at").fetchall()
+        for (digest,) in victims:
+            if self._total <= self.max_bytes:
+                break
+            self._remove_blob(digest)
+            self.evicted += 1
+
+
+# ── HTTP 연동 ─────────────────────────────────────────────────
+
+def _response_from_cache(url: str, page: CachedPage) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = url
+    resp._content = page.body
+    resp.encoding = page.encoding
+    resp.headers = CaseInsensitiveDict({k: v for k, v in (("ETag", page.etag), ("Last-Modified", page.last_modified)) if v})
+    resp.from_cache = True
+    return resp
+
+
+def cached_get(
+    get: Callable[..., requests.Response],
+    url: str,
+    cache: Optional[PageCache] = None,
+    key: Optional[str] = None,
+    max_age: float = PAGE_CACHE_MAX_AGE,
+    revalidate: bool = True,
+    offline: bool = OFFLINE_MODE,
+    **kwargs,
+) -> requests.Response:
+    """
+    get(url, headers=..., **kwargs) 를 캐시를 거쳐 호출 (get: http_get / requests.get 등).
+    - key:        캐시 키 (기본값 url). 쿼리가 매번 바뀌는 요청은 고정 키를 넘긴다
+    - max_age:    이 시간(초) 안에 받은 캐시는 요청 없이 그대로 사용
+    - revalidate: ETag / Last-Modified 로 조건부 요청. key 가 실제 요청과 다르면 False 로 둔다
+    - offline:    네트워크 없이 캐시만 사용, 없으면 OfflineCacheMiss
+    200 응답만 저장하며, 캐시에서 나온 응답은 from_cache=True.
+    """
+    key = key or url
+    page = cache.get(key) if cache is not None else None
+
+    if offline:
+        if page is None:
+            raise OfflineCacheMiss(f"오프라인 캐시 없음: {key}")
+        return _response_from_cache(url, page)
+
+    if page is not None and time.time() - page.fetched_at < max_age:
+        return _response_from_cache(url, page)
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if page is not None and revalidate:
+        if page.etag:
+            headers["If-None-Match"] = page.etag
+        if page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+
+    resp = get(url, headers=headers, **kwargs)
+    status = getattr(resp, "status_code", None)
+
+    if status == 304 and page is not None:
+        cache.touch(key)
+        return _response_from_cache(url, page)
+    if status == 200 and cache is not None:
+        cache.put(
+            key,
+            resp.content,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            encoding=resp.encoding or resp.apparent_encoding,
+        )
+    resp.from_cache = False
+    return resp
+
+
+def get_rendered(url: str, cache: Optional[PageCache] = None) -> Optional[str]:
+    """Selenium 렌더링 결과(page_source) 캐시 조회."""
+    cache = cache or get_page_cache()
+    page = cache.get(RENDERED_PREFIX + url) if cache is not None else None
+    return page.text if page is not None else None
+
+
+def put_rendered(url: str, html: str, cache: Optional[PageCache] = None) -> None:
+    cache = cache or get_page_cache()
+    if cache is not None:
+        cache.put(RENDERED_PREFIX + url, html.encode("utf-8"), encoding="utf-8")
+
+
+# ── 프로세스 공유 캐시 ─────────────────────────────────────────
+
+_cache: Optional[PageCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> Optional[PageCache]:
+    """PAGE_CACHE_ENABLED=false 면 None (OFFLINE_MODE 에서는 항상 사용)."""
+    global _cache
+    if not (PAGE_CACHE_ENABLED or OFFLINE_MODE):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = PageCache()
+        return _cache
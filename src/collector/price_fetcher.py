@@ -1,9 +1,12 @@
 import logging
-import requests
-import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
 
-from settings import TICKERS, PRICE_PERIOD, PRICE_INTERVAL
+from collector.http_utils import make_session, http_get, UARotator
+from collector.page_cache import cached_get, get_page_cache
+from collector.rate_limiter import get_rate_limiter
+from metrics import stage
+from settings import TICKERS, PRICE_PERIOD, PRICE_INTERVAL, PRICE_OVERLAP_DAYS
 
 logger = logging.getLogger(__name__)
 
@@ -20,73 +23,137 @@ HEADERS = {
 }
 
 
-def fetch_price(ticker: str, period: str = PRICE_PERIOD, interval: str = PRICE_INTERVAL) -> list[dict]:
+_session = make_session()
+_rotator = UARotator()
+
+
+def _limited_get(url: str, **kwargs):
+    return get_rate_limiter().request(http_get, url, session=_session, ua_rotator=_rotator, **kwargs)
+
+
+def fetch_price(
+    ticker: str,
+    period: str = PRICE_PERIOD,
+    interval: str = PRICE_INTERVAL,
+    since: Optional[date] = None,
+    overlap_days: int = PRICE_OVERLAP_DAYS,
+) -> list[dict]:
     """
     yfinance 없이 Yahoo Finance API를 직접 호출.
     Docker 환경에서 yfinance 내부 파싱 이슈를 우회.
+    - since: DB에 저장된 마지막 날짜. 지정하면 period 대신
+             (since - overlap_days) 부터만 조회 → 이미 저장된 구간 재다운로드 방지
+    응답 JSON 은 ticker/interval 단위로 페이지 캐시에 보관 (OFFLINE_MODE 에서 마지막 응답 재사용).
+    period1/period2 가 매번 달라 조건부 요청/재사용은 하지 않는다.
+    요청은 공유 rate limiter 를 거친다 (429/503 시 Retry-After 대기 후 재시도).
     """
-    url = YF_CHART_URL.format(ticker=ticker)
-    params = {
-        "period1": int((datetime.now() - timedelta(days=_period_to_days(period))).timestamp()),
-        "period2": int(datetime.now().timestamp()),
-        "interval": interval,
-        "includePrePost": "false",
-    }
+    if since is not None:
+        start = datetime.combine(since - timedelta(days=overlap_days), time.min, tzinfo=timezone.utc)
+    else:
+        start = datetime.now() - timedelta(days=_period_to_days(period))
+    return _fetch_chart(ticker, start, datetime.now(), interval)
 
-    try:
-        resp = requests.get(url, headers=HEADERS, params=params, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception as e:
-        logger.error(f"[price_fetcher] {ticker} 요청 실패: {e}")
-        return []
 
-    try:
-        result = data["chart"]["result"][0]
-        timestamps = result["timestamp"]
-        ohlcv = result["indicators"]["quote"][0]
-        opens   = ohlcv["open"]
-        closes  = ohlcv["close"]
-        volumes = ohlcv["volume"]
-    except (KeyError, IndexError, TypeError) as e:
-        logger.warning(f"[price_fetcher] {ticker} 응답 파싱 실패: {e}")
-        return []
-
-    results = []
-    for ts, o, c, v in zip(timestamps, opens, closes, volumes):
-        if o is None or c is None:
-            continue
+def fetch_price_range(ticker: str, start: date, end: date, interval: str = PRICE_INTERVAL) -> list[dict]:
+    """
+    [start, end] (양끝 포함) 구간 주가 조회. 백필(backfill.py)에서 구간을 나눠 병렬 호출.
+    응답은 구간별 키로 페이지 캐시에 보관 → OFFLINE_MODE 재처리 때도 구간마다 재사용.
+    fetch_price() 와 달리 요청 실패는 예외로 올린다 (빈 구간과 실패를 구분해야 완료 기록을 남길 수 있음).
+    """
+    rows = _fetch_chart(
+        ticker,
+        datetime.combine(start, time.min, tzinfo=timezone.utc),
+        datetime.combine(end + timedelta(days=1), time.min, tzinfo=timezone.utc),
+        interval,
+        cache_key=f"{YF_CHART_URL.format(ticker=ticker)}?interval={interval}&range={start}:{end}",
+        raise_errors=True,
+    )
+    # 거래소 시간대 때문에 경계 밖 날짜가 섞일 수 있음 → 인접 구간과 겹치지 않게 잘라냄
+    return [r for r in rows if start.isoformat() <= r["date"] <= end.isoformat()]
+
+
+def _fetch_chart(
+    ticker: str,
+    start: datetime,
+    end: datetime,
+    interval: str,
+    cache_key: Optional[str] = None,
+    raise_errors: bool = False,
+) -> list[dict]:
+    with stage("price_fetch") as st:
+        url = YF_CHART_URL.format(ticker=ticker)
+        params = {
+            "period1": int(start.timestamp()),
+            "period2": int(end.timestamp()),
+            "interval": interval,
+            "includePrePost": "false",
+        }
+
         try:
-            date_str     = datetime.utcfromtimestamp(ts).strftime("%Y-%m-%d")
-            open_price   = round(float(o), 4)
-            close_price  = round(float(c), 4)
-            volume       = int(v) if v else 0
-            price_change     = round(close_price - open_price, 4)
-            price_change_pct = round((price_change / open_price) * 100, 4) if open_price else 0.0
-            direction = "up" if price_change > 0 else ("down" if price_change < 0 else "flat")
-
-            results.append({
-                "ticker":           ticker,
-                "date":             date_str,
-                "open":             open_price,
-                "close":            close_price,
-                "volume":           volume,
-                "price_change":     price_change,
-                "price_change_pct": price_change_pct,
-                "direction":        direction,
-            })
+            resp = cached_get(
+                _limited_get, url, cache=get_page_cache(), key=cache_key or f"{url}?interval={interval}",
+                max_age=0, revalidate=False, headers=dict(HEADERS), params=params, timeout=15,
+            )
+            st.add(nbytes=len(resp.content))
+            resp.raise_for_status()
+            data = resp.json()
         except Exception as e:
-            logger.warning(f"[price_fetcher] {ticker} {ts} 행 처리 오류: {e}")
-            continue
+            logger.error(f"[price_fetcher] {ticker} 요청 실패: {e}")
+            if raise_errors:
+                raise               # stage() 가 오류로 기록
+            st.add(errors=1)
+            return []
+
+        try:
+            result = data["chart"]["result"][0]
+            timestamps = result["timestamp"]
+            ohlcv = result["indicators"]["quote"][0]
+            opens   = ohlcv["open"]
+            closes  = ohlcv["close"]
+            volumes = ohlcv["volume"]
+        except (KeyError, IndexError, TypeError) as e:
+            logger.warning(f"[price_fetcher] {ticker} 응답 파싱 실패: {e}")
+            st.add(errors=1)
+            return []
+
+        results = []
+        for ts, o, c, v in zip(timestamps, opens, closes, volumes):
+            if o is None or c is None:
+                continue
+            try:
+                date_str     = datetime.utcfromtimestamp(ts).strftime("%Y-%m-%d")
+                open_price   = round(float(o), 4)
+                close_price  = round(float(c), 4)
+                volume       = int(v) if v else 0
+                price_change     = round(close_price - open_price, 4)
+                price_change_pct = round((price_change / open_price) * 100, 4) if open_price else 0.0
+                direction = "up" if price_change > 0 else ("down" if price_change < 0 else "flat")
+
+                results.append({
+                    "ticker":           ticker,
+                    "date":             date_str,
+                    "open":             open_price,
+                    "close":            close_price,
+                    "volume":           volume,
+                    "price_change":     price_change,
+                    "price_change_pct": price_change_pct,
+                    "direction":        direction,
+                })
+            except Exception as e:
+                logger.warning(f"[price_fetcher] {ticker} {ts} 행 처리 오류: {e}")
+                continue
 
-    logger.info(f"[price_fetcher] {ticker} {len(results)}개 수집 완료")
-    return results
+        st.add(items=len(results))
+        logger.info(f"[price_fetcher] {ticker} {len(results)}개 수집 완료")
+        return results
 
 
 def _period_to_days(period: str) -> int:
-    """'5d' → 5, '1mo' → 30, '3mo' → 90"""
+    """'5d' → 5, '1mo' → 30, '3mo' → 90, '1y' → 365"""
     try:
-        if period.endswith("mo"):
+        if period.endswith("y"):
+            return int(period[:-1]) * 365
+        elif period.endswith("mo"):
             return int(period[:-2]) * 30
         elif period.endswith("d"):
             return int(period[:-1])
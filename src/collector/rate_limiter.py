@@ -0,0 +1,183 @@
+"""
+호스트별 적응형 요청 속도 제한 (token bucket + AIMD).
+
+- 호스트마다 초당 rate 개의 토큰이 쌓이고(최대 burst 개), 요청 1건이 토큰 1개를 쓴다
+- 동시 요청 수는 호스트별 per_host 개로 제한
+- 429 / 503 응답: Retry-After 만큼 해당 호스트 요청을 멈추고 rate 를 절반으로 (multiplicative decrease)
+- 정상 응답: rate 를 조금씩 올림 (additive increase, 약 1초마다 +increase_step) → max_rate 까지
+
+수집기(기사 본문, 주가, RSS)는 get_rate_limiter() 로 프로세스 전체에서 같은 인스턴스를 공유한다.
+"""
+import time
+import logging
+import threading
+import datetime as dt
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlsplit
+
+from settings import (
+    FETCH_PER_HOST, RATE_LIMIT_INITIAL, RATE_LIMIT_MIN, RATE_LIMIT_MAX, RATE_LIMIT_BURST,
+    RATE_LIMIT_INCREASE, RATE_LIMIT_RETRIES,
+)
+
+logger = logging.getLogger(__name__)
+
+# 서버가 속도를 낮추라고 알리는 상태 코드
+THROTTLE_STATUSES = (429, 503)
+# Retry-After 가 없을 때 기본 대기(초)
+DEFAULT_PENALTY = 5.0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP-date) → 대기 초. 해석 불가면 None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=dt.timezone.utc)
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+class _HostState:
+    def __init__(self, rate: float, burst: float, per_host: int):
+        self.rate = rate
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.slots = threading.BoundedSemaphore(per_host)
+        self.throttled = 0
+
+
+class HostRateLimiter:
+    """
+    여러 스레드가 공유하며, 서로 다른 호스트 요청은 서로를 기다리지 않는다.
+    initial_rate <= 0 이면 속도 제한 없이 동시 요청 수만 제한.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = RATE_LIMIT_INITIAL,
+        min_rate: float = RATE_LIMIT_MIN,
+        max_rate: float = RATE_LIMIT_MAX,
+        burst: float = RATE_LIMIT_BURST,
+        increase_step: float = RATE_LIMIT_INCREASE,
+        per_host: int = FETCH_PER_HOST,
+        max_retries: int = RATE_LIMIT_RETRIES,
+    ):
+        self.enabled = initial_rate > 0
+        self.initial_rate = initial_rate
+        self.min_rate = min(min_rate, initial_rate) if self.enabled else min_rate
+        self.max_rate = max(max_rate, initial_rate)
+        self.burst = max(1.0, burst)
+        self.increase_step = increase_step
+        self.per_host = max(1, per_host)
+        self.max_retries = max(0, max_retries)
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+
+    # ── 요청 단위 API ─────────────────────────────────────────
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """동시 요청 슬롯 + 토큰 1개를 확보한 뒤 요청을 보낸다."""
+        state = self._state(urlsplit(url).netloc.lower())
+        with state.slots:
+            self._take_token(state)
+            yield
+
+    def feedback(self, url: str, status: Optional[int], retry_after: Optional[str] = None) -> None:
+        """응답 상태를 반영해 해당 호스트의 rate 를 조정."""
+        if status is None:
+            return
+        host = urlsplit(url).netloc.lower()
+        state = self._state(host)
+        with self._lock:
+            if status in THROTTLE_STATUSES:
+                wait = parse_retry_after(retry_after)
+                penalty = DEFAULT_PENALTY if wait is None else wait
+                state.blocked_until = max(state.blocked_until, time.monotonic() + penalty)
+                # 대기 중에는 토큰을 채우지 않음: 차단이 풀린 뒤 첫 요청도 1/rate 간격을 지킨다
+                state.tokens = 0.0
+                state.updated = state.blocked_until
+                state.throttled += 1
+                if self.enabled:
+                    state.rate = max(self.min_rate, state.rate / 2)
+                logger.warning(
+                    f"[rate_limiter] {host} {status} 응답 → {penalty:.1f}s 대기, "
+                    f"{state.rate:.2f} req/s 로 감속"
+                )
+            elif status < 400 and self.enabled and state.rate < self.max_rate:
+                state.rate = min(self.max_rate, state.rate + self.increase_step / state.rate)
+
+    def request(self, get: Callable, url: str, **kwargs):
+        """
+        slot() 안에서 get(url, **kwargs) 호출 후 feedback().
+        429 / 503 이면 Retry-After 만큼 기다렸다가 최대 max_retries 회 재시도하고 마지막 응답을 반환.
+        """
+        for attempt in range(self.max_retries + 1):
+            with self.slot(url):
+                resp = get(url, **kwargs)
+            status = getattr(resp, "status_code", None)
+            headers = getattr(resp, "headers", None) or {}
+            self.feedback(url, status, headers.get("Retry-After"))
+            if status not in THROTTLE_STATUSES or attempt == self.max_retries:
+                return resp
+            logger.info(f"[rate_limiter] 재시도 {attempt + 1}/{self.max_retries}: {url[:60]}")
+        return resp
+
+    def stats(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                host: {"rate": round(s.rate, 3), "throttled": s.throttled}
+                for host, s in self._hosts.items()
+            }
+
+    # ── 내부 ───────────────────────────────────────────────────
+
+    def _state(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.initial_rate, self.burst, self.per_host)
+            return state
+
+    def _take_token(self, state: _HostState) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < state.blocked_until:
+                    wait = state.blocked_until - now
+                elif not self.enabled:
+                    return
+                else:
+                    state.tokens = min(self.burst, state.tokens + (now - state.updated) * state.rate)
+                    state.updated = now
+                    if state.tokens >= 1:
+                        state.tokens -= 1
+                        return
+                    wait = (1 - state.tokens) / state.rate
+            time.sleep(wait)
+
+
+# ── 프로세스 공유 limiter ──────────────────────────────────────
+
+_limiter: Optional[HostRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = HostRateLimiter()
+        return _limiter
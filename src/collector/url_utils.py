@@ -0,0 +1,35 @@
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 같은 기사를 가리키지만 유입 경로마다 달라지는 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    "guccounter", "guce_referrer", "guce_referrer_sig",
+    "ncid", "soc_src", "soc_trk", "tsrc", ".tsrc", "sr_source",
+    "yptr", "fr", "cmpid", "siteid", "fbclid", "gclid", "mc_cid", "mc_eid",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    중복 판정용 표준 URL.
+    - scheme/host 소문자, 기본 포트 제거, fragment 제거
+    - 추적용 쿼리 파라미터(utm_*, guccounter, ncid, .tsrc ...) 제거 후 나머지는 정렬
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not (scheme == "http" and parts.port == 80 or scheme == "https" and parts.port == 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+def url_hash(url: str) -> str:
+    """canonicalize_url() 결과의 SHA-1 (40자 hex). news_articles.url_hash 인덱스 키."""
+    return hashlib.sha1(canonicalize_url(url).encode("utf-8")).hexdigest()
@@ -1,16 +1,12 @@
-import os
 import time
 import random
 import logging
-from typing import List, Set, Optional
+from typing import Callable, Iterable, List, Set, Optional
 
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException
-
-from settings import SELENIUM, UA_LIST, YF_MAX_SCROLL, YF_MAX_ARTICLES
+from collector.driver_pool import get_driver_pool
+from collector.page_cache import get_rendered, put_rendered
+from collector.url_utils import canonicalize_url
+from settings import SELENIUM, UA_LIST, YF_MAX_SCROLL, YF_MAX_ARTICLES, YF_KNOWN_RUN_STOP, OFFLINE_MODE
 
 logger = logging.getLogger(__name__)
 
@@ -23,65 +19,165 @@ YF_STORY_FALLBACKS = [
 ]
 
 
-def _get_driver(options: Options) -> webdriver.Remote:
-    use_remote = os.getenv("USE_REMOTE_WEBDRIVER", "false").lower() == "true"
-    if use_remote:
-        remote_url = os.getenv("SELENIUM_REMOTE_URL", "http://selenium:4444")
-        return webdriver.Remote(command_executor=remote_url, options=options)
-    return webdriver.Chrome(options=options)
-
-
-def _build_chrome_options(user_agent: Optional[str] = None) -> Options:
-    opts = Options()
-    chrome_bin = os.getenv("CHROME_BIN")
-    if chrome_bin:
-        opts.binary_location = chrome_bin
-    if SELENIUM.get("headless", True):
-        opts.add_argument("--headless=new")
-    if SELENIUM.get("disable_gpu", True):
-        opts.add_argument("--disable-gpu")
-    w, h = SELENIUM.get("window_size", (1920, 1080))
-    opts.add_argument(f"--window-size={w}x{h}")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    opts.add_argument("--blink-settings=imagesEnabled=false")
-    opts.add_experimental_option(
-        "prefs",
-        {
-            "profile.managed_default_content_settings.images": 2,
-            "profile.managed_default_content_settings.stylesheets": 2,
-            "profile.default_content_setting_values.notifications": 2,
-        },
-    )
-    if user_agent:
-        opts.add_argument(f"--user-agent={user_agent}")
-    return opts
-
-
 def _normalize_url(href: str) -> Optional[str]:
     if not href:
         return None
     url = href if href.startswith("http") else f"https://finance.yahoo.com{href}"
-    return url if "/news/" in url else None
+    return canonicalize_url(url) if "/news/" in url else None
+
+
+def select_links(
+    hrefs: Iterable[str],
+    stop_urls: Set[str],
+    url_filter: Optional[Callable[[List[str]], List[str]]],
+    max_articles: int,
+) -> List[str]:
+    """
+    href 목록을 표준화해 중복/기존 URL을 제외하고 최대 max_articles개 반환 (입력 순서 유지).
+    url_filter 가 있으면 후보 전체를 먼저 거른 뒤 max_articles 만큼 자른다.
+    """
+    candidates: List[str] = []
+    seen: Set[str] = set()
+
+    for href in hrefs:
+        u = _normalize_url(href)
+        if not u or u in seen or u in stop_urls:
+            continue
+        seen.add(u)
+        candidates.append(u)
+        if url_filter is None and len(candidates) >= max_articles:
+            break
+
+    if url_filter is not None and candidates:
+        candidates = url_filter(candidates)
+    return candidates[:max_articles]
+
+
+def _block_hrefs(blocks) -> List[str]:
+    hrefs = []
+    for sec in blocks:
+        a = sec.find("a") if hasattr(sec, "find") else None
+        if a is None and hasattr(sec, "get"):
+            a = sec
+        href = a.get("href") if a else None
+        if href:
+            hrefs.append(href)
+    return hrefs
+
+
+def _select_links(
+    blocks,
+    stop_urls: Set[str],
+    url_filter: Optional[Callable[[List[str]], List[str]]],
+    max_articles: int,
+) -> List[str]:
+    """기사 블록에서 링크를 뽑아 중복/기존 URL을 제외하고 최대 max_articles개 반환."""
+    return select_links(_block_hrefs(blocks), stop_urls, url_filter, max_articles)
 
 
-def _scroll_until_stable(driver, max_round: int, pause: float, stable_need: int) -> None:
+def _scroll_until_stable(
+    driver,
+    max_round: int,
+    pause: float,
+    stable_need: int,
+    on_round: Optional[Callable[[], bool]] = None,
+) -> int:
+    """
+    페이지 높이가 stable_need 회 연속 그대로일 때까지 최대 max_round 회 스크롤. 실제 스크롤 횟수 반환.
+    on_round: 스크롤 전 1회 + 매 스크롤 후 호출, True 를 돌려주면 즉시 중단 (점진 수집용)
+    """
+    if on_round is not None and on_round():
+        return 0
     last_height = driver.execute_script("return document.body.scrollHeight")
     stable_rounds = 0
-    for _ in range(max_round):
+    for rounds in range(1, max_round + 1):
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         time.sleep(pause)
+        if on_round is not None and on_round():
+            return rounds
         new_height = driver.execute_script("return document.body.scrollHeight")
         if new_height == last_height:
             stable_rounds += 1
             if stable_rounds >= stable_need:
-                break
+                return rounds
         else:
             stable_rounds = 0
             last_height = new_height
+    return max_round
+
+
+# 현재 DOM 의 기사 링크 href 목록 (page_source 전체를 넘기지 않고 필요한 값만 읽음)
+_STORY_HREFS_JS = """
+for (const sel of arguments[0]) {
+    const nodes = document.querySelectorAll(sel);
+    if (nodes.length) {
+        return Array.from(nodes, n => {
+            const a = n.tagName === "A" ? n : n.querySelector("a");
+            return a ? a.getAttribute("href") : null;
+        });
+    }
+}
+return [];
+"""
+
+
+class _LinkHarvester:
+    """
+    스크롤할 때마다 새로 로드된 기사 링크를 읽어 새/기존 URL을 판정하고, 더 스크롤할 필요가 있는지 결정.
+    - 새 링크가 max_articles 개 모이면 중단
+    - 이미 저장된(stop_urls / url_filter 로 걸러진) URL이 known_run 개 연속이면
+      이전 실행에서 수집한 구간에 도달한 것으로 보고 중단
+    """
+
+    def __init__(
+        self,
+        stop_urls: Set[str],
+        url_filter: Optional[Callable[[List[str]], List[str]]],
+        max_articles: Optional[int],
+        known_run: int,
+    ):
+        self.stop_urls = stop_urls
+        self.url_filter = url_filter
+        self.max_articles = max_articles
+        self.known_run = known_run
+        self.seen: Set[str] = set()
+        self.new_links = 0
+        self.known_streak = 0
+        self.reason: Optional[str] = None
+
+    def feed(self, hrefs: Iterable[Optional[str]]) -> bool:
+        hrefs = [h for h in hrefs if h]
+        fresh = select_links(hrefs, self.seen, None, len(hrefs)) if hrefs else []
+        if fresh:
+            self.seen.update(fresh)
+            candidates = [u for u in fresh if u not in self.stop_urls]
+            new = set(self.url_filter(candidates)) if self.url_filter and candidates else set(candidates)
+            for u in fresh:
+                if u in new:
+                    self.new_links += 1
+                    self.known_streak = 0
+                else:
+                    self.known_streak += 1
+
+        if self.max_articles is not None and self.new_links >= self.max_articles:
+            self.reason = f"새 링크 {self.new_links}개 확보"
+        elif self.known_run > 0 and self.known_streak >= self.known_run:
+            self.reason = f"기존 링크 {self.known_streak}개 연속"
+        return self.reason is not None
+
+    def read(self, driver) -> bool:
+        try:
+            hrefs = driver.execute_script(_STORY_HREFS_JS, [YF_STORY_SEL, *YF_STORY_FALLBACKS]) or []
+        except Exception as e:
+            logger.debug(f"[yahoo_scraper] 링크 점진 수집 실패 → 높이 기준 스크롤만 사용: {e}")
+            return False
+        return self.feed(hrefs)
 
 
 def _dismiss_consent(driver) -> None:
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException
+
     texts = ["Accept", "I agree", "동의", "허용"]
     try:
         for t in texts:
@@ -97,70 +193,96 @@ def _dismiss_consent(driver) -> None:
         pass
 
 
-def collect_yahoo_links(
+def scrape_listing_links(
     ticker: str,
     max_scroll: int = YF_MAX_SCROLL,
-    max_articles: int = YF_MAX_ARTICLES,
-    stop_urls: Optional[Set[str]] = None,
     user_agent: Optional[str] = None,
+    offline: bool = OFFLINE_MODE,
+    stop_urls: Optional[Set[str]] = None,
+    url_filter: Optional[Callable[[List[str]], List[str]]] = None,
+    max_articles: Optional[int] = None,
+    known_run: int = YF_KNOWN_RUN_STOP,
 ) -> List[str]:
     """
-    Yahoo Finance에서 ticker 뉴스 링크를 수집.
-    - stop_urls: 이미 DB에 저장된 URL 집합 → 중복 수집 방지
-    - max_articles: 최대 수집 기사 수 (이전 200 → 30으로 축소)
+    Selenium 으로 뉴스 목록 페이지를 스크롤해 /news/ 링크 후보를 페이지 순서대로 반환 (표준화·중복 제거).
+    offline=True 면 마지막으로 캐시된 목록 페이지에서 추출.
+
+    stop_urls / url_filter / max_articles 를 넘기면 스크롤마다 새로 로드된 링크를 판정해
+    새 링크가 max_articles 개 모이거나 기존 링크가 known_run 개 연속 나오면 스크롤을 멈춘다.
     """
-    stop_urls = stop_urls or set()
+    from bs4 import BeautifulSoup
+
     url = f"https://finance.yahoo.com/quote/{ticker}/news?p={ticker}"
-    options = _build_chrome_options(user_agent=user_agent or random.choice(UA_LIST))
-    driver = _get_driver(options)
 
-    try:
-        driver.set_page_load_timeout(SELENIUM.get("page_load_timeout", 180))
-        driver.get(url)
+    if offline:
+        page_source = get_rendered(url)
+        if page_source is None:
+            logger.warning(f"[yahoo_scraper] {ticker} 오프라인 캐시에 목록 페이지 없음")
+            return []
+    else:
+        with get_driver_pool().acquire(user_agent=user_agent or random.choice(UA_LIST)) as driver:
+            driver.get(url)
 
-        try:
-            _dismiss_consent(driver)
-        except Exception:
-            pass
-
-        _scroll_until_stable(
-            driver,
-            max_round=max_scroll,
-            pause=SELENIUM.get("scroll_pause", 1.6),
-            stable_need=SELENIUM.get("max_stable_rounds", 2),
-        )
-
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        blocks = soup.select(YF_STORY_SEL)
-
-        if not blocks:
-            for sel in YF_STORY_FALLBACKS:
-                blocks = soup.select(sel)
-                if blocks:
-                    break
-
-        links: List[str] = []
-        seen: Set[str] = set()
-
-        for sec in blocks:
-            if len(links) >= max_articles:
+            try:
+                _dismiss_consent(driver)
+            except Exception:
+                pass
+
+            harvester = _LinkHarvester(
+                {canonicalize_url(u) for u in (stop_urls or ())}, url_filter, max_articles, known_run,
+            )
+            rounds = _scroll_until_stable(
+                driver,
+                max_round=max_scroll,
+                pause=SELENIUM.get("scroll_pause", 1.6),
+                stable_need=SELENIUM.get("max_stable_rounds", 2),
+                on_round=lambda: harvester.read(driver),
+            )
+            page_source = driver.page_source
+        if harvester.reason:
+            logger.info(
+                f"[yahoo_scraper] {ticker} 스크롤 {rounds}/{max_scroll}회에서 조기 종료 "
+                f"({harvester.reason}) → {max_scroll - rounds}회 절약"
+            )
+        else:
+            logger.info(f"[yahoo_scraper] {ticker} 스크롤 {rounds}/{max_scroll}회")
+        put_rendered(url, page_source)
+
+    soup = BeautifulSoup(page_source, "html.parser")
+    blocks = soup.select(YF_STORY_SEL)
+
+    if not blocks:
+        for sel in YF_STORY_FALLBACKS:
+            blocks = soup.select(sel)
+            if blocks:
                 break
-            a = sec.find("a") if hasattr(sec, "find") else None
-            if a is None and hasattr(sec, "get"):
-                a = sec
-            href = a.get("href") if a else None
-            u = _normalize_url(href)
 
-            if not u or u in seen or u in stop_urls:
-                continue
-            seen.add(u)
-            links.append(u)
+    return select_links(_block_hrefs(blocks), set(), None, len(blocks))
 
-        logger.info(f"[yahoo_scraper] {ticker} 링크 {len(links)}개 수집")
-        return links
 
-    finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
+def collect_yahoo_links(
+    ticker: str,
+    max_scroll: int = YF_MAX_SCROLL,
+    max_articles: int = YF_MAX_ARTICLES,
+    stop_urls: Optional[Set[str]] = None,
+    user_agent: Optional[str] = None,
+    url_filter: Optional[Callable[[List[str]], List[str]]] = None,
+    offline: bool = OFFLINE_MODE,
+) -> List[str]:
+    """
+    Yahoo Finance에서 ticker 뉴스 링크를 수집. 링크는 canonicalize_url() 로 표준화된다.
+    - stop_urls: 제외할 URL 집합 → 중복 수집 방지
+    - url_filter: 후보 URL 목록을 받아 새 URL만 돌려주는 함수 (예: db.writer.filter_new_urls)
+                  → DB에서 한 번에 중복 판정
+    - max_articles: 최대 수집 기사 수 (이전 200 → 30으로 축소)
+    - offline: Selenium 없이 마지막으로 캐시된 목록 페이지에서 링크 추출
+    브라우저 없이 먼저 시도하는 경로는 collector.link_sources.discover_links() 참고.
+    """
+    stop_urls = {canonicalize_url(u) for u in (stop_urls or ())}
+    candidates = scrape_listing_links(
+        ticker, max_scroll=max_scroll, user_agent=user_agent, offline=offline,
+        stop_urls=stop_urls, url_filter=url_filter, max_articles=max_articles,
+    )
+    links = select_links(candidates, stop_urls, url_filter, max_articles)
+    logger.info(f"[yahoo_scraper] {ticker} 링크 {len(links)}개 수집")
+    return links
@@ -0,0 +1,110 @@
+"""
+API 전용 비동기 DB 접근 (SQLAlchemy AsyncEngine + asyncpg).
+
+- 배치 파이프라인(db.writer)은 기존 동기 엔진을 그대로 사용하고, 읽기 API 만 이 모듈을 쓴다
+- 이벤트 루프에서 쿼리를 기다리는 동안 스레드/연결을 붙잡지 않으므로
+  작은 풀(DB_POOL_SIZE + DB_MAX_OVERFLOW)로도 많은 동시 요청을 처리한다
+- 모든 연결에 statement_timeout(DB_STATEMENT_TIMEOUT_MS)을 걸어 느린 쿼리가 풀을 독점하지 않게 한다
+"""
+import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+
+from db.models import DataVersion
+from settings import (
+    DATABASE_URL, ASYNC_DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DB_STATEMENT_TIMEOUT_MS,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# 첫 요청 시 생성 (import 시점에는 asyncpg 를 로드하지 않음)
+_engine: Optional["AsyncEngine"] = None
+_session_factory: Optional["async_sessionmaker[AsyncSession]"] = None
+
+
+def to_async_url(url: str) -> str:
+    """postgresql:// / postgresql+psycopg2:// → postgresql+asyncpg:// (다른 DB 는 그대로)."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql" and parsed.get_driver_name() != "asyncpg":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    return parsed.render_as_string(hide_password=False)
+
+
+def async_engine_options(
+    pool_size: int = DB_POOL_SIZE,
+    max_overflow: int = DB_MAX_OVERFLOW,
+    pool_timeout: float = DB_POOL_TIMEOUT,
+    pool_recycle: int = DB_POOL_RECYCLE,
+    statement_timeout_ms: int = DB_STATEMENT_TIMEOUT_MS,
+) -> dict:
+    """create_async_engine() 인자. statement_timeout 은 연결 시작 파라미터로 서버에 전달."""
+    options = {
+        "pool_size": max(1, pool_size),
+        "max_overflow": max(0, max_overflow),
+        "pool_timeout": pool_timeout,
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": True,
+    }
+    if statement_timeout_ms > 0:
+        options["connect_args"] = {"server_settings": {"statement_timeout": str(statement_timeout_ms)}}
+    return options
+
+
+def get_async_engine() -> "AsyncEngine":
+    # 이벤트 루프는 단일 스레드라 첫 생성 경합이 없음 (await 지점이 없으므로 중복 생성 불가)
+    global _engine, _session_factory
+    if _engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        url = ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+        options = async_engine_options()
+        _engine = create_async_engine(url, **options)
+        _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
+        logger.info(
+            f"[async_session] 비동기 엔진 생성 (pool={options['pool_size']}+{options['max_overflow']}, "
+            f"statement_timeout={DB_STATEMENT_TIMEOUT_MS}ms)"
+        )
+    return _engine
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncIterator["AsyncSession"]:
+    """읽기 전용 요청용 세션. 블록을 벗어나면 연결을 바로 풀에 반환."""
+    get_async_engine()
+    async with _session_factory() as session:
+        yield session
+
+
+async def get_data_version_async() -> int:
+    """db.writer.get_data_version() 의 비동기 버전 (API 응답 캐시 무효화용)."""
+    async with get_async_session() as session:
+        version = (await session.execute(select(DataVersion.version).where(DataVersion.id == 1))).scalar()
+    return version or 0
+
+
+def pool_stats() -> Optional[dict]:
+    """풀 사용 현황 수치 (/metrics 용, 엔진이 아직 없으면 None). overflow 는 풀 크기를 넘어 연 연결 수(음수면 여유)."""
+    if _engine is None:
+        return None
+    pool = _engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+async def dispose_async_engine() -> None:
+    """서버 종료 시 풀의 연결을 모두 닫음."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = _session_factory = None
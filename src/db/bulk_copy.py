@@ -0,0 +1,64 @@
+"""
+대량 적재용 COPY 헬퍼 (PostgreSQL + psycopg2).
+
+다중 VALUES INSERT 는 행 × 컬럼 수만큼 바인드 파라미터를 만들어 65535 개 제한에 걸리고,
+본문(content) 이 큰 수천 행이면 SQL 컴파일 / 전송 자체가 느려진다.
+대신 트랜잭션 임시 테이블에 COPY FROM STDIN (text 포맷) 으로 행을 흘려 넣고,
+INSERT ... SELECT FROM 임시 테이블 한 문장으로 기존과 같은 ON CONFLICT 규칙을 적용한다.
+
+임시 테이블은 ON COMMIT DROP 이라 청크(트랜잭션)마다 새로 만들어지고 정리된다.
+"""
+import io
+import logging
+import datetime as dt
+from typing import Iterable, Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# COPY text 포맷에서 특별한 의미가 있는 문자
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_value(value) -> str:
+    """파이썬 값 → COPY text 포맷 필드 (None → \\N)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dt.date, dt.datetime)):
+        return value.isoformat()
+    return str(value).replace("\x00", "").translate(_COPY_ESCAPES)
+
+
+def copy_buffer(rows: Iterable[dict], columns: Sequence[str]) -> io.StringIO:
+    """행 dict 목록 → COPY text 포맷 버퍼 (컬럼 순서 = columns)."""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join(copy_value(row.get(c)) for c in columns))
+        buf.write("\n")
+    buf.seek(0)
+    return buf
+
+
+def staging_table(name: str, columns: Sequence[str]) -> sa.TableClause:
+    """INSERT ... SELECT 문에서 참조할 임시 테이블 (SQLAlchemy 경량 테이블 객체)."""
+    return sa.table(name, *(sa.column(c) for c in columns))
+
+
+def copy_to_staging(session: Session, target: str, name: str, columns: Sequence[str], rows: list[dict]) -> None:
+    """
+    현재 트랜잭션에 target 과 같은 컬럼 타입의 임시 테이블 name 을 만들고 rows 를 COPY.
+    (commit 시 자동 삭제). 이후 같은 session 에서 name 을 SELECT 할 수 있다.
+    """
+    cols = ", ".join(columns)
+    session.execute(sa.text(
+        f"CREATE TEMP TABLE {name} ON COMMIT DROP AS SELECT {cols} FROM {target} WITH NO DATA"
+    ))
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {name} ({cols}) FROM STDIN", copy_buffer(rows, columns))
+    finally:
+        cursor.close()
@@ -0,0 +1,51 @@
+"""
+Alembic 실행 환경.
+- 코드에서 호출: db.writer.init_db() 가 connection 을 config.attributes 로 넘겨줌
+- CLI 호출:      PYTHONPATH=src alembic upgrade head  (레포 루트의 alembic.ini 사용)
+"""
+from alembic import context
+from sqlalchemy import create_engine, text
+
+from db.models import Base
+from settings import DATABASE_URL
+
+config = context.config
+target_metadata = Base.metadata
+
+# API 서버와 파이프라인이 동시에 기동해도 마이그레이션은 한 번만 적용되도록 잠금
+MIGRATION_LOCK_ID = 48151623
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url") or DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run_with_connection(connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        connection.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+
+    engine = create_engine(config.get_main_option("sqlalchemy.url") or DATABASE_URL)
+    with engine.connect() as connection:
+        _run_with_connection(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,60 @@
+"""baseline: stock_prices, news_articles
+
+마이그레이션 도입 이전에 Base.metadata.create_all() 로 만들어진 DB 도 있으므로
+테이블이 이미 있으면 건너뛴다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set() if context.is_offline_mode() else set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "stock_prices" not in existing:
+        op.create_table(
+            "stock_prices",
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column("ticker", sa.String(20), nullable=False),
+            sa.Column("date", sa.Date, nullable=False),
+            sa.Column("open", sa.Float, nullable=False),
+            sa.Column("close", sa.Float, nullable=False),
+            sa.Column("volume", sa.Integer, nullable=False),
+            sa.Column("price_change", sa.Float, nullable=False),
+            sa.Column("price_change_pct", sa.Float, nullable=False),
+            sa.Column("direction", sa.String(10), nullable=False),
+            sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
+            sa.UniqueConstraint("ticker", "date", name="uq_stock_price_ticker_date"),
+        )
+
+    if "news_articles" not in existing:
+        op.create_table(
+            "news_articles",
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column("ticker", sa.String(20), nullable=False),
+            sa.Column("date", sa.Date, nullable=False),
+            sa.Column("url", sa.String(2048), nullable=False, unique=True),
+            sa.Column("title", sa.String(1024), nullable=True),
+            sa.Column("content", sa.String, nullable=True),
+            sa.Column("sentiment_label", sa.String(20), nullable=True),
+            sa.Column("sentiment_score", sa.Float, nullable=True),
+            sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("news_articles")
+    op.drop_table("stock_prices")
@@ -0,0 +1,41 @@
+"""news_articles 조회 경로용 복합 인덱스
+
+- ix_news_articles_ticker_date:       ticker 필터 + date DESC 정렬 (/news, /summary, get_existing_urls)
+- ix_news_articles_ticker_label_date: ticker + sentiment_label 필터 + date DESC 정렬 (/news?sentiment=)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_news_articles_ticker_date",
+        "news_articles",
+        ["ticker", sa.text("date DESC")],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_news_articles_ticker_label_date",
+        "news_articles",
+        ["ticker", "sentiment_label", sa.text("date DESC")],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_news_articles_ticker_label_date", table_name="news_articles")
+    op.drop_index("ix_news_articles_ticker_date", table_name="news_articles")
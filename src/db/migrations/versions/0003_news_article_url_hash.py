@@ -0,0 +1,85 @@
+"""news_articles.url_hash: 표준화 URL 해시 기반 서버 측 중복 판정
+
+기존 행은 표준화 URL 의 SHA-1 로 채운 뒤 NOT NULL + 인덱스 적용.
+추적 파라미터만 다른 과거 행끼리는 해시가 같을 수 있으므로 유니크가 아닌 일반 인덱스.
+표준화 규칙은 이 리비전 시점의 collector.url_utils 를 그대로 옮겨 둔 것
+(이후 url_utils 가 바뀌어도 0003 이 채우는 값은 변하지 않아야 함).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+
+"""
+import hashlib
+from typing import Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# 0003 시점의 collector.url_utils
+TRACKING_PARAMS = {
+    "guccounter", "guce_referrer", "guce_referrer_sig",
+    "ncid", "soc_src", "soc_trk", "tsrc", ".tsrc", "sr_source",
+    "yptr", "fr", "cmpid", "siteid", "fbclid", "gclid", "mc_cid", "mc_eid",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+
+def url_hash(url: str) -> str:
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not (scheme == "http" and parts.port == 80 or scheme == "https" and parts.port == 443):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    )
+    canonical = urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column("news_articles", sa.Column("url_hash", sa.String(40), nullable=True))
+
+    if not context.is_offline_mode():
+        bind = op.get_bind()
+        articles = sa.table(
+            "news_articles",
+            sa.column("id", sa.Integer),
+            sa.column("url", sa.String),
+            sa.column("url_hash", sa.String),
+        )
+        while True:
+            rows = bind.execute(
+                sa.select(articles.c.id, articles.c.url)
+                .where(articles.c.url_hash.is_(None))
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            bind.execute(
+                articles.update()
+                .where(articles.c.id == sa.bindparam("_id"))
+                .values(url_hash=sa.bindparam("_hash")),
+                [{"_id": r.id, "_hash": url_hash(r.url)} for r in rows],
+            )
+
+    op.alter_column("news_articles", "url_hash", nullable=False)
+    op.create_index("ix_news_articles_url_hash", "news_articles", ["url_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_news_articles_url_hash", table_name="news_articles")
+    op.drop_column("news_articles", "url_hash")
@@ -0,0 +1,34 @@
+"""data_version: API 응답 캐시 무효화용 데이터 변경 스탬프
+
+writer 가 stock_prices / news_articles 를 변경한 트랜잭션 안에서 version 을 1 올린다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    data_version = op.create_table(
+        "data_version",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column("version", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime, server_default=sa.func.now()),
+    )
+    op.bulk_insert(data_version, [{"id": 1, "version": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("data_version")
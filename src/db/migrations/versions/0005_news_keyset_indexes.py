@@ -0,0 +1,56 @@
+"""news_articles 키셋 페이지네이션용 인덱스: (date, id) 정렬
+
+/news 는 ORDER BY date DESC, id DESC + WHERE (date, id) < (:date, :id) 로 페이지를 읽는다.
+기존 (ticker, date DESC) 인덱스로는 같은 날짜 안의 id 정렬이 별도 Sort 단계가 되므로
+id DESC 를 끝에 붙인 인덱스로 교체한다. 앞쪽 컬럼이 같아 기존 인덱스를 쓰던 조회(/summary 등)도 그대로 사용.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_news_articles_ticker_date_id",
+        "news_articles",
+        ["ticker", sa.text("date DESC"), sa.text("id DESC")],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_news_articles_ticker_label_date_id",
+        "news_articles",
+        ["ticker", "sentiment_label", sa.text("date DESC"), sa.text("id DESC")],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_news_articles_ticker_label_date", table_name="news_articles", if_exists=True)
+    op.drop_index("ix_news_articles_ticker_date", table_name="news_articles", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_news_articles_ticker_date",
+        "news_articles",
+        ["ticker", sa.text("date DESC")],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_news_articles_ticker_label_date",
+        "news_articles",
+        ["ticker", "sentiment_label", sa.text("date DESC")],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_news_articles_ticker_label_date_id", table_name="news_articles")
+    op.drop_index("ix_news_articles_ticker_date_id", table_name="news_articles")
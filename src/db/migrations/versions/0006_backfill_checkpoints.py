@@ -0,0 +1,39 @@
+"""backfill_checkpoints: 과거 데이터 백필의 완료 구간 기록
+
+backfill.py 가 (ticker, kind, 구간) 단위로 저장을 마칠 때마다 1행을 남기고,
+재실행 시 기록된 구간을 건너뛰어 중단된 지점부터 이어서 진행한다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "backfill_checkpoints",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column("ticker", sa.String(20), nullable=False),
+        sa.Column("kind", sa.String(20), nullable=False),
+        sa.Column("chunk_start", sa.Date, nullable=False),
+        sa.Column("chunk_end", sa.Date, nullable=False),
+        sa.Column("row_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("completed_at", sa.DateTime, server_default=sa.func.now()),
+        sa.UniqueConstraint("ticker", "kind", "chunk_start", "chunk_end", name="uq_backfill_checkpoint_chunk"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("backfill_checkpoints")
@@ -0,0 +1,63 @@
+"""daily_sentiment: ticker + 날짜별 기사 감정 롤업
+
+/summary 가 매 요청마다 news_articles 를 GROUP BY 하지 않도록 집계를 테이블로 유지한다.
+writer 는 기사 insert / 감정 갱신 트랜잭션 안에서 이 테이블을 함께 갱신하고,
+불일치가 생기면 src/rebuild_rollup.py 로 다시 만든다.
+생성 시 기존 기사로 한 번 채운다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_sentiment",
+        sa.Column("ticker", sa.String(20), primary_key=True),
+        sa.Column("date", sa.Date, primary_key=True),
+        sa.Column("article_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("positive_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("negative_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("neutral_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float, nullable=False, server_default="0"),
+        sa.Column("score_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("min_score", sa.Float, nullable=True),
+        sa.Column("max_score", sa.Float, nullable=True),
+        sa.Column("updated_at", sa.DateTime, server_default=sa.func.now()),
+    )
+    op.execute(
+        """
+        INSERT INTO daily_sentiment (
+            ticker, date, article_count, positive_count, negative_count, neutral_count,
+            score_sum, score_count, min_score, max_score
+        )
+        SELECT ticker, date,
+               count(*),
+               count(*) FILTER (WHERE sentiment_label = 'positive'),
+               count(*) FILTER (WHERE sentiment_label = 'negative'),
+               count(*) FILTER (WHERE sentiment_label = 'neutral'),
+               coalesce(sum(sentiment_score), 0),
+               count(sentiment_score),
+               min(sentiment_score),
+               max(sentiment_score)
+        FROM news_articles
+        GROUP BY ticker, date
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_sentiment")
@@ -0,0 +1,142 @@
+"""news_articles: date 기준 월 단위 RANGE 파티셔닝 + URL 레지스트리
+
+기존 단일 테이블을 news_articles_unpartitioned 로 옮기고, 같은 이름의 파티션 테이블을 만든 뒤 데이터를 복사한다.
+- PK 는 파티션 키를 포함해야 하므로 (id, date). id 는 기존 시퀀스(news_articles_id_seq)를 이어서 사용
+- url UNIQUE 는 파티션 테이블에서 만들 수 없음 → news_article_urls(url_hash PK) 로 전역 중복 방지
+- 기존 데이터가 걸친 달의 월 파티션 + DEFAULT 파티션 생성. 이번 달 이후 파티션은 init_db(ensure_partitions)가 만든다
+- 조회 인덱스는 부모에 만들고 각 파티션에 같은 정의 / 이름 규칙(ix_<파티션>_<접미사>)으로 붙임
+- 인덱스 목록과 파티션 DDL 은 이 리비전 시점의 정의를 그대로 적어 둠
+  (db/partitions.py 나 환경변수가 바뀌어도 0008 이 만드는 스키마는 변하지 않아야 함)
+
+복사 중에는 기사 INSERT 가 막히므로 수집 파이프라인을 멈춘 상태에서 적용한다.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 00:00:00
+
+"""
+from datetime import date
+from typing import Optional, Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, ticker, date, url, url_hash, title, content, sentiment_label, sentiment_score, created_at"
+
+# 0008 시점의 (접미사, 컬럼)
+PARTITION_INDEXES = (
+    ("ticker_date_id", "ticker, date DESC, id DESC"),
+    ("ticker_label_date_id", "ticker, sentiment_label, date DESC, id DESC"),
+)
+
+
+def _next_month(d: date) -> date:
+    return date(d.year + d.month // 12, d.month % 12 + 1, 1)
+
+
+def _create_partition(month: Optional[date]) -> None:
+    """빈 월 파티션(month=None 이면 DEFAULT) 생성: CREATE TABLE (LIKE) → PK / 인덱스 → ATTACH."""
+    name = f"news_articles_{month:%Y_%m}" if month else "news_articles_default"
+    op.execute(f"CREATE TABLE {name} (LIKE news_articles INCLUDING DEFAULTS)")
+    op.execute(f"ALTER TABLE {name} ADD PRIMARY KEY (id, date)")
+    for suffix, cols in PARTITION_INDEXES:
+        op.execute(f"CREATE INDEX ix_{name}_{suffix} ON {name} ({cols})")
+    bound = f"FOR VALUES FROM ('{month}') TO ('{_next_month(month)}')" if month else "DEFAULT"
+    op.execute(f"ALTER TABLE news_articles ATTACH PARTITION {name} {bound}")
+
+
+def upgrade() -> None:
+    # 새 부모 인덱스와 이름이 겹치는 기존 인덱스는 지우고 테이블은 옆으로 옮김
+    op.drop_index("ix_news_articles_ticker_date_id", table_name="news_articles")
+    op.drop_index("ix_news_articles_ticker_label_date_id", table_name="news_articles")
+    op.drop_index("ix_news_articles_url_hash", table_name="news_articles")
+    op.rename_table("news_articles", "news_articles_unpartitioned")
+
+    op.execute(
+        """
+        CREATE TABLE news_articles (
+            id              integer NOT NULL DEFAULT nextval('news_articles_id_seq'),
+            ticker          varchar(20) NOT NULL,
+            date            date NOT NULL,
+            url             varchar(2048) NOT NULL,
+            url_hash        varchar(40) NOT NULL,
+            title           varchar(1024),
+            content         varchar,
+            sentiment_label varchar(20),
+            sentiment_score double precision,
+            created_at      timestamp without time zone DEFAULT now(),
+            CONSTRAINT pk_news_articles PRIMARY KEY (id, date)
+        ) PARTITION BY RANGE (date)
+        """
+    )
+    for suffix, cols in PARTITION_INDEXES:
+        op.execute(f"CREATE INDEX ix_news_articles_{suffix} ON news_articles ({cols})")
+
+    # 기존 데이터가 걸친 달의 파티션 생성 (--sql 오프라인 모드에서는 데이터 범위를 알 수 없으므로 DEFAULT 만)
+    # 데이터가 들어가기 전이라 DEFAULT 에서 옮길 행이 없다
+    first = last = None
+    if not context.is_offline_mode():
+        first, last = op.get_bind().execute(
+            sa.text("SELECT min(date), max(date) FROM news_articles_unpartitioned")
+        ).one()
+    month = first.replace(day=1) if first else None
+    while month and month <= last:
+        _create_partition(month)
+        month = _next_month(month)
+    _create_partition(None)
+
+    op.execute(f"INSERT INTO news_articles ({COLUMNS}) SELECT {COLUMNS} FROM news_articles_unpartitioned")
+
+    op.create_table(
+        "news_article_urls",
+        sa.Column("url_hash", sa.String(40), primary_key=True),
+        sa.Column("date", sa.Date, nullable=False),
+        sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
+    )
+    # 0003 이전에 같은 URL 이 중복 저장된 경우가 있어도 레지스트리에는 하나만
+    op.execute(
+        "INSERT INTO news_article_urls (url_hash, date) "
+        "SELECT url_hash, min(date) FROM news_articles_unpartitioned GROUP BY url_hash"
+    )
+
+    # 시퀀스가 기존 테이블과 함께 삭제되지 않도록 소유 컬럼을 옮긴 뒤 삭제
+    op.execute("ALTER SEQUENCE news_articles_id_seq OWNED BY news_articles.id")
+    op.drop_table("news_articles_unpartitioned")
+    op.execute("ANALYZE news_articles")
+
+
+def downgrade() -> None:
+    op.rename_table("news_articles", "news_articles_partitioned")
+    op.create_table(
+        "news_articles",
+        sa.Column("id", sa.Integer, primary_key=True, server_default=sa.text("nextval('news_articles_id_seq')")),
+        sa.Column("ticker", sa.String(20), nullable=False),
+        sa.Column("date", sa.Date, nullable=False),
+        sa.Column("url", sa.String(2048), nullable=False, unique=True),
+        sa.Column("url_hash", sa.String(40), nullable=False),
+        sa.Column("title", sa.String(1024), nullable=True),
+        sa.Column("content", sa.String, nullable=True),
+        sa.Column("sentiment_label", sa.String(20), nullable=True),
+        sa.Column("sentiment_score", sa.Float, nullable=True),
+        sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
+    )
+    op.execute(
+        f"INSERT INTO news_articles ({COLUMNS}) SELECT {COLUMNS} FROM news_articles_partitioned "
+        "ON CONFLICT (url) DO NOTHING"
+    )
+    op.execute("ALTER SEQUENCE news_articles_id_seq OWNED BY news_articles.id")
+    op.execute("DROP TABLE news_articles_partitioned")   # 파티션 / 인덱스도 함께 삭제됨
+    op.drop_table("news_article_urls")
+
+    op.create_index("ix_news_articles_ticker_date_id", "news_articles",
+                    ["ticker", sa.text("date DESC"), sa.text("id DESC")])
+    op.create_index("ix_news_articles_ticker_label_date_id", "news_articles",
+                    ["ticker", "sentiment_label", sa.text("date DESC"), sa.text("id DESC")])
+    op.create_index("ix_news_articles_url_hash", "news_articles", ["url_hash"])
@@ -1,6 +1,8 @@
 from datetime import date
+from typing import Optional
 from sqlalchemy import (
-    Column, String, Float, Integer, Date, DateTime, UniqueConstraint, func
+    BigInteger, Column, String, Float, Integer, Date, DateTime, Index, PrimaryKeyConstraint, UniqueConstraint,
+    func, text,
 )
 from sqlalchemy.orm import DeclarativeBase
 
@@ -41,22 +43,123 @@ class StockPrice(Base):
 class NewsArticle(Base):
     """
     수집된 뉴스 기사 + 감정분석 결과
-    url 기준으로 중복 방지
+    date 기준 월 단위 RANGE 파티션 테이블 (news_articles_YYYY_MM + news_articles_default, db/partitions.py)
+    → PK 에 파티션 키가 들어가야 하므로 (id, date). id 는 기존 시퀀스를 그대로 사용해 전역에서 유일
+    URL 중복 방지는 파티션 테이블의 UNIQUE 로는 불가능(파티션 키 미포함) → NewsArticleUrl 레지스트리
+    인덱스는 API 조회 경로(ticker 필터 + date DESC, id DESC 정렬)에 맞춤 → migrations/0002, 0005, 0008
     """
     __tablename__ = "news_articles"
 
-    id               = Column(Integer, primary_key=True, autoincrement=True)
+    id               = Column(Integer, nullable=False, server_default=text("nextval('news_articles_id_seq')"))
     ticker           = Column(String(20), nullable=False)
-    date             = Column(Date, nullable=False)
-    url              = Column(String(2048), nullable=False, unique=True)
+    date             = Column(Date, nullable=False)                         # 파티션 키
+    url              = Column(String(2048), nullable=False)                 # canonicalize_url() 적용
+    url_hash         = Column(String(40), nullable=False)                   # url_hash() → NewsArticleUrl 키
     title            = Column(String(1024), nullable=True)
     content          = Column(String, nullable=True)
     sentiment_label  = Column(String(20), nullable=True)   # positive / negative / neutral
     sentiment_score  = Column(Float, nullable=True)        # -1.0 ~ 1.0
     created_at       = Column(DateTime, server_default=func.now())
 
+    __table_args__ = (
+        PrimaryKeyConstraint(id, date, name="pk_news_articles"),
+        # id 까지 포함 → (date, id) 키셋 페이지네이션이 정렬 없이 인덱스 순서로 읽힘 (migrations/0005)
+        # 파티션마다 같은 정의의 ix_<파티션>_<접미사> 인덱스가 자식으로 붙음 (partitions.PARTITION_INDEXES)
+        Index("ix_news_articles_ticker_date_id", ticker, date.desc(), id.desc()),
+        Index("ix_news_articles_ticker_label_date_id", ticker, sentiment_label, date.desc(), id.desc()),
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
+
     def __repr__(self) -> str:
         return (
             f"<NewsArticle ticker={self.ticker} date={self.date} "
             f"sentiment={self.sentiment_label} url={self.url[:40]}...>"
         )
+
+
+class NewsArticleUrl(Base):
+    """
+    news_articles 전역 URL 중복 방지 레지스트리 (표준화 URL 해시 → 기사 날짜)
+    writer 는 한 문장에서 이 테이블에 먼저 INSERT ... ON CONFLICT DO NOTHING 하고,
+    실제로 등록된 해시의 기사만 news_articles 에 넣는다. filter_new_urls 도 이 PK 만 조회
+    """
+    __tablename__ = "news_article_urls"
+
+    url_hash    = Column(String(40), primary_key=True)
+    date        = Column(Date, nullable=False)        # 기사가 들어간 파티션 (news_articles.date)
+    created_at  = Column(DateTime, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<NewsArticleUrl hash={self.url_hash[:12]} date={self.date}>"
+
+
+class DailySentiment(Base):
+    """
+    ticker + 날짜별 기사 감정 집계 (news_articles 롤업)
+    writer 가 기사 insert / 감정 갱신과 같은 트랜잭션에서 갱신 → /summary 는 이 테이블만 읽음 (O(일수))
+    평균은 score_sum / score_count (증분 갱신이 가능하도록 합계와 개수를 저장)
+    """
+    __tablename__ = "daily_sentiment"
+
+    ticker          = Column(String(20), primary_key=True)
+    date            = Column(Date, primary_key=True)
+    article_count   = Column(Integer, nullable=False, default=0)
+    positive_count  = Column(Integer, nullable=False, default=0)
+    negative_count  = Column(Integer, nullable=False, default=0)
+    neutral_count   = Column(Integer, nullable=False, default=0)
+    score_sum       = Column(Float, nullable=False, default=0.0)
+    score_count     = Column(Integer, nullable=False, default=0)     # sentiment_score 가 있는 기사 수
+    min_score       = Column(Float, nullable=True)
+    max_score       = Column(Float, nullable=True)
+    updated_at      = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    @property
+    def mean_score(self) -> Optional[float]:
+        return self.score_sum / self.score_count if self.score_count else None
+
+    def __repr__(self) -> str:
+        return (
+            f"<DailySentiment ticker={self.ticker} date={self.date} "
+            f"articles={self.article_count} mean={self.mean_score}>"
+        )
+
+
+class DataVersion(Base):
+    """
+    데이터 변경 스탬프 (id=1 단일 행)
+    writer 가 주가/기사를 변경하는 트랜잭션 안에서 version 을 1 올림 → API 응답 캐시 무효화 기준
+    """
+    __tablename__ = "data_version"
+
+    id          = Column(Integer, primary_key=True, autoincrement=False)
+    version     = Column(BigInteger, nullable=False, default=0)
+    updated_at  = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<DataVersion version={self.version} updated_at={self.updated_at}>"
+
+
+class BackfillCheckpoint(Base):
+    """
+    백필 완료 구간 기록 (backfill.py)
+    ticker + kind(prices / news) + 구간 단위로 1행. 중단 후 재실행하면 기록된 구간은 건너뛴다.
+    """
+    __tablename__ = "backfill_checkpoints"
+
+    id           = Column(Integer, primary_key=True, autoincrement=True)
+    ticker       = Column(String(20), nullable=False)
+    kind         = Column(String(20), nullable=False)
+    chunk_start  = Column(Date, nullable=False)
+    chunk_end    = Column(Date, nullable=False)
+    row_count    = Column(Integer, nullable=False, default=0)     # 저장(insert/update)된 행 수
+    completed_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("ticker", "kind", "chunk_start", "chunk_end", name="uq_backfill_checkpoint_chunk"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<BackfillCheckpoint ticker={self.ticker} kind={self.kind} "
+            f"{self.chunk_start}~{self.chunk_end} rows={self.row_count}>"
+        )
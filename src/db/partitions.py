@@ -0,0 +1,140 @@
+"""
+news_articles 월 단위 RANGE 파티션 관리 (PostgreSQL 선언적 파티셔닝, migrations/0008).
+
+- news_articles_YYYY_MM: FOR VALUES FROM ('YYYY-MM-01') TO (다음 달 1일)
+- news_articles_default: 아직 파티션이 없는 날짜를 받아 INSERT 가 실패하지 않게 함
+- ensure_partitions(): 필요한 월 파티션을 미리 만듦 (init_db 가 이번 달 ~ NEWS_PARTITION_MONTHS_AHEAD 개월 뒤까지 호출)
+  DEFAULT 에 이미 들어간 그 달 행은 새 파티션으로 옮긴 뒤 ATTACH 한다.
+- drop_partitions_before(): 오래된 월은 DELETE 대신 DETACH + DROP (dead tuple / VACUUM 부담 없음)
+
+파티션 인덱스 이름은 ix_<파티션>_<접미사> 로 고정한다. 부모 인덱스(ix_news_articles_<접미사>)와
+정의가 같으므로 ATTACH 시 새로 만들지 않고 부모 인덱스의 자식으로 연결된다.
+"""
+import re
+import logging
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+PARENT = "news_articles"
+DEFAULT_PARTITION = f"{PARENT}_default"
+
+# (접미사, 컬럼) — models.NewsArticle 의 ix_news_articles_<접미사> 와 같아야 함
+PARTITION_INDEXES = (
+    ("ticker_date_id", "ticker, date DESC, id DESC"),
+    ("ticker_label_date_id", "ticker, sentiment_label, date DESC, id DESC"),
+)
+
+# 여러 프로세스(API / 파이프라인)가 동시에 init_db 해도 같은 파티션을 두 번 만들지 않도록
+_LOCK_KEY = 0x6E657773   # 'news'
+_NAME_RE = re.compile(rf"^{PARENT}_(\d{{4}})_(\d{{2}})$")
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def add_months(d: date, n: int) -> date:
+    """d 가 속한 달의 1일에서 n 개월 이동."""
+    index = d.year * 12 + d.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_range(first: date, last: date) -> list[date]:
+    """first ~ last 가 걸친 달의 1일 목록 (양끝 포함)."""
+    months, cursor = [], month_start(first)
+    while cursor <= last:
+        months.append(cursor)
+        cursor = add_months(cursor, 1)
+    return months
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_{month:%Y_%m}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """news_articles_YYYY_MM → 그 달 1일. DEFAULT 등 월 파티션이 아니면 None."""
+    m = _NAME_RE.match(name)
+    return date(int(m.group(1)), int(m.group(2)), 1) if m else None
+
+
+def partition_ddl(month: Optional[date]) -> list[str]:
+    """
+    월 파티션(month=None 이면 DEFAULT) 생성 SQL.
+    CREATE TABLE (LIKE) → DEFAULT 에서 그 달 행 이동 → PK / 인덱스 → ATTACH 순서.
+    인덱스를 데이터 이동 뒤에 만들고, DEFAULT 에서 행을 지운 뒤 ATTACH 하므로 같은 트랜잭션에서 실행해야 한다.
+    """
+    name = partition_name(month) if month else DEFAULT_PARTITION
+    stmts = [f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS)"]
+    if month:
+        lo, hi = month.isoformat(), add_months(month, 1).isoformat()
+        in_range = f"date >= '{lo}' AND date < '{hi}'"
+        stmts += [
+            f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}",
+            f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}",
+        ]
+        bound = f"FOR VALUES FROM ('{lo}') TO ('{hi}')"
+    else:
+        bound = "DEFAULT"
+    stmts.append(f"ALTER TABLE {name} ADD PRIMARY KEY (id, date)")
+    stmts += [f"CREATE INDEX ix_{name}_{suffix} ON {name} ({cols})" for suffix, cols in PARTITION_INDEXES]
+    stmts.append(f"ALTER TABLE {PARENT} ATTACH PARTITION {name} {bound}")
+    return stmts
+
+
+def existing_partitions(conn: Connection) -> set[str]:
+    rows = conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        f"WHERE i.inhparent = '{PARENT}'::regclass"
+    )).scalars().all()
+    return set(rows)
+
+
+def ensure_partitions(conn: Connection, first: date, last: date) -> list[str]:
+    """first ~ last 가 걸친 달 중 파티션이 없는 달을 만듦 (conn 의 트랜잭션 안). 반환값: 새로 만든 파티션 이름"""
+    conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _LOCK_KEY})
+    have = existing_partitions(conn)
+    created = []
+    if DEFAULT_PARTITION not in have:
+        for stmt in partition_ddl(None):
+            conn.execute(text(stmt))
+        created.append(DEFAULT_PARTITION)
+    for month in month_range(first, last):
+        name = partition_name(month)
+        if name in have:
+            continue
+        for stmt in partition_ddl(month):
+            conn.execute(text(stmt))
+        created.append(name)
+    if created:
+        logger.info(f"[partitions] 파티션 생성: {', '.join(created)}")
+    return created
+
+
+def drop_partitions_before(conn: Connection, cutoff: date) -> list[str]:
+    """
+    cutoff 가 속한 달 이전의 월 파티션을 DETACH + DROP 하고, DEFAULT 에 남은 그 이전 행은 DELETE.
+    daily_sentiment 롤업과 news_article_urls(중복 방지 기록)는 지우지 않는다
+    → 지난 날짜 요약은 그대로 남고, 삭제된 기사가 다시 수집되지도 않음.
+    반환값: 삭제한 파티션 이름
+    """
+    cutoff = month_start(cutoff)
+    conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _LOCK_KEY})
+    dropped = []
+    for name in sorted(existing_partitions(conn)):
+        month = partition_month(name)
+        if month is None or month >= cutoff:
+            continue
+        conn.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+        conn.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    leftover = conn.execute(
+        text(f"DELETE FROM {DEFAULT_PARTITION} WHERE date < :cutoff"), {"cutoff": cutoff},
+    ).rowcount
+    logger.info(f"[partitions] {cutoff} 이전 파티션 {len(dropped)}개 삭제, DEFAULT 잔여 {leftover}행 삭제")
+    return dropped
@@ -1,31 +1,98 @@
+import os
 import logging
+import threading
 from contextlib import contextmanager
 from datetime import date
-from typing import Generator
+from typing import Generator, Iterable, Iterator, Optional
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, select, update, delete, bindparam, func, or_, tuple_, cast, column, values, literal, Date
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from db.models import Base, StockPrice, NewsArticle
-from settings import DATABASE_URL
+from collector.url_utils import canonicalize_url, url_hash
+from db.bulk_copy import copy_to_staging, staging_table
+from db.models import StockPrice, NewsArticle, NewsArticleUrl, DataVersion, BackfillCheckpoint, DailySentiment
+from db.partitions import add_months, ensure_partitions, drop_partitions_before
+from metrics import stage
+from settings import (
+    DATABASE_URL, INSERT_BATCH_SIZE, BULK_COPY_MIN_ROWS, BULK_COPY_CHUNK_ROWS, NEWS_PARTITION_MONTHS_AHEAD,
+)
 
 logger = logging.getLogger(__name__)
 
-# 엔진 / 세션 팩토리 (모듈 로드 시 1회 생성)
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
-SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+# 엔진 / 세션 팩토리 (첫 DB 접근 시 1회 생성 → import 시점에는 드라이버/풀을 만들지 않음)
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    global _engine, _session_factory
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+                _session_factory = sessionmaker(bind=_engine, expire_on_commit=False)
+    return _engine
+
+
+def __getattr__(name: str):
+    # 기존 코드의 `from db.writer import engine, SessionFactory` 호환
+    if name == "engine":
+        return get_engine()
+    if name == "SessionFactory":
+        get_engine()
+        return _session_factory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
 
 
 def init_db() -> None:
-    """테이블이 없으면 생성. 서버 최초 실행 시 호출."""
-    Base.metadata.create_all(engine)
-    logger.info("[writer] DB 테이블 초기화 완료")
+    """
+    스키마를 최신 마이그레이션(head)까지 올림. 서버/파이프라인 시작 시 호출.
+    create_all 과 달리 기존 테이블의 인덱스·컬럼 변경도 적용된다.
+    이어서 news_articles 월 파티션을 이번 달부터 NEWS_PARTITION_MONTHS_AHEAD 개월 뒤까지 미리 만든다.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    cfg = Config()
+    cfg.set_main_option("script_location", MIGRATIONS_DIR)
+    today = date.today()
+    with get_engine().begin() as conn:
+        cfg.attributes["connection"] = conn
+        command.upgrade(cfg, "head")
+        ensure_partitions(conn, today, add_months(today, NEWS_PARTITION_MONTHS_AHEAD))
+    logger.info("[writer] DB 마이그레이션 적용 완료")
+
+
+def prepare_news_partitions(start: date, end: date) -> list[str]:
+    """
+    [start, end] 가 걸친 달의 news_articles 파티션을 미리 만듦 (과거 날짜 백필 전).
+    만들지 않아도 INSERT 는 DEFAULT 파티션으로 들어가지만, 나중에 그 달 파티션을 만들 때 행을 옮겨야 한다.
+    반환값: 새로 만든 파티션 이름
+    """
+    with get_engine().begin() as conn:
+        return ensure_partitions(conn, start, end)
+
+
+def drop_news_partitions_before(cutoff: date) -> list[str]:
+    """cutoff 가 속한 달 이전 기사를 파티션 단위로 삭제 (DETACH + DROP). 반환값: 삭제한 파티션 이름"""
+    with get_engine().begin() as conn:
+        dropped = drop_partitions_before(conn, cutoff)
+    if dropped:
+        with get_session() as session:
+            bump_data_version(session)
+    return dropped
 
 
 @contextmanager
 def get_session() -> Generator[Session, None, None]:
-    session = SessionFactory()
+    get_engine()
+    session = _session_factory()
     try:
         yield session
         session.commit()
@@ -36,12 +103,108 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+# ── DataVersion ───────────────────────────────────────────────
+
+def bump_data_version(session: Session) -> None:
+    """
+    데이터가 바뀐 트랜잭션 안에서 호출 → commit 과 동시에 version 이 올라감.
+    API 응답 캐시(api.cache)는 이 값이 바뀌면 기존 응답을 버린다.
+    """
+    session.execute(
+        update(DataVersion)
+        .where(DataVersion.id == 1)
+        .values(version=DataVersion.version + 1, updated_at=func.now())
+    )
+
+
+def get_data_version() -> int:
+    with get_session() as session:
+        version = session.execute(select(DataVersion.version).where(DataVersion.id == 1)).scalar()
+    return version or 0
+
+
 # ── StockPrice ────────────────────────────────────────────────
 
-def upsert_stock_prices(price_data: list[dict]) -> int:
+def get_latest_price_date(ticker: str) -> Optional[date]:
+    """ticker의 마지막 저장 날짜. 저장된 주가가 없으면 None (→ 전체 백필 필요)."""
+    with get_session() as session:
+        return session.execute(
+            select(func.max(StockPrice.date)).where(StockPrice.ticker == ticker)
+        ).scalar()
+
+
+PRICE_COLUMNS = ("ticker", "date", "open", "close", "volume", "price_change", "price_change_pct", "direction")
+ARTICLE_COLUMNS = (
+    "ticker", "date", "url", "url_hash", "title", "content", "sentiment_label", "sentiment_score",
+)
+
+
+def _price_upsert_stmt(rows: list[dict]):
+    return _price_on_conflict(pg_insert(StockPrice).values(rows))
+
+
+def _price_copy_upsert_stmt(staging: str):
+    """COPY 로 채운 임시 테이블(staging) → stock_prices (_price_upsert_stmt 와 같은 충돌 규칙)."""
+    src = staging_table(staging, PRICE_COLUMNS)
+    return _price_on_conflict(pg_insert(StockPrice).from_select(PRICE_COLUMNS, select(*src.c)))
+
+
+def _price_on_conflict(stmt):
+    """
+    ticker+date 충돌 시 값이 실제로 바뀐 행만 UPDATE.
+    동일한 행은 WHERE 조건에서 걸러져 쓰기(WAL/dead tuple)가 발생하지 않는다.
     """
-    주가 데이터를 upsert (ticker+date 중복 시 업데이트).
-    반환값: 처리된 행 수
+    columns = ("open", "close", "volume", "price_change", "price_change_pct", "direction")
+    return stmt.on_conflict_do_update(
+        index_elements=["ticker", "date"],
+        set_={c: stmt.excluded[c] for c in columns},
+        where=or_(*(StockPrice.__table__.c[c].is_distinct_from(stmt.excluded[c]) for c in columns)),
+    )
+
+
+def _chunks(rows: list[dict], size: int) -> Iterator[list[dict]]:
+    size = max(1, size)
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+def _upsert_price_rows(rows: list[dict], bulk: Optional[bool] = None) -> int:
+    """_write_price_rows + metrics 의 db_write 단계 기록 (items = 변경 행 수)."""
+    with stage("db_write") as st:
+        changed = _write_price_rows(rows, bulk)
+        st.add(items=changed)
+    return changed
+
+
+def _write_price_rows(rows: list[dict], bulk: Optional[bool] = None) -> int:
+    """
+    rows 가 BULK_COPY_MIN_ROWS 이상이면(bulk=True 면 항상) BULK_COPY_CHUNK_ROWS 씩 COPY 경로,
+    아니면 다중 VALUES 한 문장. 청크마다 commit. 반환값: insert/update 된 행 수
+    """
+    if not (len(rows) >= BULK_COPY_MIN_ROWS if bulk is None else bulk):
+        with get_session() as session:
+            changed = session.execute(_price_upsert_stmt(rows)).rowcount
+            if changed:
+                bump_data_version(session)
+        return changed
+
+    changed = 0
+    for chunk in _chunks(rows, BULK_COPY_CHUNK_ROWS):
+        with get_session() as session:
+            copy_to_staging(session, StockPrice.__tablename__, "_stage_stock_prices", PRICE_COLUMNS, chunk)
+            n = session.execute(_price_copy_upsert_stmt("_stage_stock_prices")).rowcount
+            if n:
+                bump_data_version(session)
+        changed += n
+    logger.info(f"[writer] 주가 COPY 적재: {len(rows)}행 → 변경 {changed}건")
+    return changed
+
+
+def upsert_stock_prices(price_data: list[dict], bulk: Optional[bool] = None) -> int:
+    """
+    주가 데이터를 upsert (ticker+date 중복 시 변경된 행만 업데이트).
+    bulk: None 이면 행 수로 COPY 경로 여부 결정, True/False 로 강제 (백필은 True)
+    반환값: 실제로 insert/update 된 행 수
     """
     if not price_data:
         return 0
@@ -66,75 +229,409 @@ def upsert_stock_prices(price_data: list[dict]) -> int:
     if not rows:
         return 0
 
+    changed = _upsert_price_rows(rows, bulk=bulk)
+    logger.info(f"[writer] 주가 upsert 완료: 변경 {changed}건 (전체 {len(rows)}건 중)")
+    return changed
+
+
+# ── BackfillCheckpoint ────────────────────────────────────────
+
+def get_completed_chunks(ticker: str, kind: str) -> set[tuple[date, date]]:
+    """백필이 끝난 (chunk_start, chunk_end) 구간 집합."""
+    with get_session() as session:
+        rows = session.execute(
+            select(BackfillCheckpoint.chunk_start, BackfillCheckpoint.chunk_end)
+            .where(BackfillCheckpoint.ticker == ticker, BackfillCheckpoint.kind == kind)
+        ).all()
+    return {(r.chunk_start, r.chunk_end) for r in rows}
+
+
+def record_checkpoint(ticker: str, kind: str, chunk_start: date, chunk_end: date, row_count: int) -> None:
+    """
+    구간 저장 완료 기록. 데이터 commit 이후 호출하므로 그 사이에 중단되면 구간을 한 번 더 처리하지만,
+    주가 upsert / 기사 insert 는 모두 멱등이라 결과는 같다.
+    """
+    stmt = pg_insert(BackfillCheckpoint).values(
+        ticker=ticker, kind=kind, chunk_start=chunk_start, chunk_end=chunk_end, row_count=row_count,
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_backfill_checkpoint_chunk",
+        set_={"row_count": stmt.excluded.row_count, "completed_at": func.now()},
+    )
     with get_session() as session:
-        stmt = pg_insert(StockPrice).values(rows)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["ticker", "date"],
-            set_={
-                "open":             stmt.excluded.open,
-                "close":            stmt.excluded.close,
-                "volume":           stmt.excluded.volume,
-                "price_change":     stmt.excluded.price_change,
-                "price_change_pct": stmt.excluded.price_change_pct,
-                "direction":        stmt.excluded.direction,
-            },
-        )
         session.execute(stmt)
 
-    logger.info(f"[writer] 주가 upsert 완료: {len(rows)}건")
-    return len(rows)
+
+def clear_checkpoints(ticker: str, kind: Optional[str] = None) -> int:
+    """ticker(+kind) 의 백필 기록 삭제 → 처음부터 다시 백필. 반환값: 삭제된 행 수"""
+    stmt = delete(BackfillCheckpoint).where(BackfillCheckpoint.ticker == ticker)
+    if kind:
+        stmt = stmt.where(BackfillCheckpoint.kind == kind)
+    with get_session() as session:
+        return session.execute(stmt).rowcount
+
+
+# ── DailySentiment (news_articles 롤업) ──────────────────────────
+
+ROLLUP_COLUMNS = (
+    "ticker", "date", "article_count", "positive_count", "negative_count", "neutral_count",
+    "score_sum", "score_count", "min_score", "max_score",
+)
+
+
+def _rollup_select(c):
+    """
+    기사 행(c: ticker / date / sentiment_label / sentiment_score 컬럼) → (ticker, date) 별 집계 SELECT.
+    c 는 news_articles 테이블 컬럼이거나 INSERT ... RETURNING CTE 컬럼.
+    """
+    def label_count(label: str):
+        return func.count().filter(c.sentiment_label == label)
+
+    return (
+        select(
+            c.ticker,
+            c.date,
+            func.count().label("article_count"),
+            label_count("positive").label("positive_count"),
+            label_count("negative").label("negative_count"),
+            label_count("neutral").label("neutral_count"),
+            func.coalesce(func.sum(c.sentiment_score), 0.0).label("score_sum"),
+            func.count(c.sentiment_score).label("score_count"),
+            func.min(c.sentiment_score).label("min_score"),
+            func.max(c.sentiment_score).label("max_score"),
+        )
+        .group_by(c.ticker, c.date)
+    )
+
+
+def _rollup_upsert(source, increment: bool):
+    """
+    집계 SELECT(source) → daily_sentiment.
+    increment=True: 새로 삽입된 기사분을 기존 값에 더함 / False: 다시 계산한 값으로 덮어씀
+    """
+    stmt = pg_insert(DailySentiment).from_select(ROLLUP_COLUMNS, source)
+    ex, cur = stmt.excluded, DailySentiment.__table__.c
+    if increment:
+        set_ = {c: cur[c] + ex[c] for c in ROLLUP_COLUMNS[2:8]}
+        set_["min_score"] = func.least(cur.min_score, ex.min_score)       # NULL 은 무시됨
+        set_["max_score"] = func.greatest(cur.max_score, ex.max_score)
+    else:
+        set_ = {c: ex[c] for c in ROLLUP_COLUMNS[2:]}
+    set_["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(index_elements=["ticker", "date"], set_=set_)
+
+
+def _insert_with_rollup_stmt(src):
+    """
+    기사 원본(src: ARTICLE_COLUMNS 컬럼을 가진 VALUES CTE 또는 COPY 임시 테이블)을
+    URL 레지스트리 등록 · 기사 INSERT · 롤업 갱신과 한 문장으로 묶음:
+
+        WITH reg AS (INSERT INTO news_article_urls SELECT url_hash, date FROM src
+                     ON CONFLICT (url_hash) DO NOTHING RETURNING url_hash),
+             ins AS (INSERT INTO news_articles SELECT src.* FROM src JOIN reg USING (url_hash)
+                     RETURNING ticker, date, sentiment_label, sentiment_score),
+             agg AS (SELECT ticker, date, count(*), ... FROM ins GROUP BY ticker, date),
+             up  AS (INSERT INTO daily_sentiment SELECT * FROM agg ON CONFLICT DO UPDATE SET 누적)
+        SELECT coalesce(sum(article_count), 0) FROM agg      -- 실제 삽입된 기사 수
+
+    파티션 테이블에는 url UNIQUE 를 둘 수 없으므로 중복 판정은 레지스트리 PK 가 맡는다.
+    RETURNING 은 실제로 등록된 해시만 돌려주므로 중복 URL 은 기사/집계 어디에도 들어가지 않는다.
+    src 안의 중복 URL 은 _insert_article_rows 에서 미리 제거한다.
+    """
+    reg = (
+        pg_insert(NewsArticleUrl)
+        .from_select(["url_hash", "date"], select(src.c.url_hash, src.c.date))
+        .on_conflict_do_nothing(index_elements=["url_hash"])
+        .returning(NewsArticleUrl.url_hash)
+        .cte("reg")
+    )
+    new_rows = select(*(src.c[c] for c in ARTICLE_COLUMNS)).join_from(src, reg, reg.c.url_hash == src.c.url_hash)
+    ins = (
+        pg_insert(NewsArticle)
+        .from_select(ARTICLE_COLUMNS, new_rows)
+        .returning(NewsArticle.ticker, NewsArticle.date, NewsArticle.sentiment_label, NewsArticle.sentiment_score)
+        .cte("ins")
+    )
+    agg = _rollup_select(ins.c).cte("agg")
+    up = _rollup_upsert(select(agg), increment=True).cte("up")
+    return select(func.coalesce(func.sum(agg.c.article_count), 0)).add_cte(up)
+
+
+def _recompute_rollup_stmt(where=None):
+    """news_articles 에서 (where 에 해당하는 기사의) 날짜별 집계를 다시 계산해 덮어씀."""
+    source = _rollup_select(NewsArticle.__table__.c)
+    if where is not None:
+        source = source.where(where)
+    return _rollup_upsert(source, increment=False)
+
+
+def _refresh_rollup_for_ids(session: Session, ids: list[int], dates: Iterable[date]) -> None:
+    """감정이 바뀐 기사(ids, 날짜 dates)가 속한 (ticker, date) 만 다시 집계. dates 로 해당 월 파티션만 읽음."""
+    days = (
+        select(NewsArticle.ticker, NewsArticle.date)
+        .where(NewsArticle.id.in_(ids), NewsArticle.date.in_(sorted(set(dates))))
+        .distinct()
+    )
+    session.execute(_recompute_rollup_stmt(tuple_(NewsArticle.ticker, NewsArticle.date).in_(days)))
+
+
+def _clear_rollup_stmt(ticker: Optional[str] = None):
+    """
+    재구성 전에 지울 롤업 행. 티커마다 그 티커의 남은 기사 중 가장 이른 날짜 이후만 지운다.
+
+    일부러 남기는 행:
+      - 그 날짜보다 이전 행: drop_news_partitions_before 로 기사 파티션을 지운 달의 요약이라
+        재계산할 원본이 없다 (롤업이 유일한 기록).
+      - 기사가 하나도 남지 않은 티커의 행 전부: 파티션 삭제로 원본이 모두 사라진 경우이므로
+        min() 이 NULL 이면 (date >= NULL 에 기대지 않고) 'infinity' 로 바꿔 명시적으로 삭제 대상에서 뺀다.
+    """
+    owner = ticker if ticker else DailySentiment.ticker     # 전체 재구성이면 행마다 자기 티커 (상관 서브쿼리)
+    first_day = (
+        select(func.min(NewsArticle.date))
+        .where(NewsArticle.ticker == owner)
+        .scalar_subquery()
+    )
+    clear = delete(DailySentiment).where(DailySentiment.date >= func.coalesce(first_day, cast(literal("infinity"), Date)))
+    if ticker:
+        clear = clear.where(DailySentiment.ticker == ticker)
+    return clear
+
+
+def rebuild_daily_sentiment(ticker: Optional[str] = None) -> int:
+    """
+    daily_sentiment 를 news_articles 로부터 다시 만듦 (불일치 복구용, src/rebuild_rollup.py).
+    삭제와 재계산을 한 트랜잭션에서 수행하므로 도중에 API 가 빈 롤업을 보지 않는다.
+    기사가 남아 있지 않은 (파티션을 삭제한) 지난 날짜의 롤업은 건드리지 않는다 (_clear_rollup_stmt).
+    반환값: 다시 만든 (ticker, date) 행 수
+    """
+    with get_session() as session:
+        session.execute(_clear_rollup_stmt(ticker))
+        where = NewsArticle.ticker == ticker if ticker else None
+        rebuilt = session.execute(_recompute_rollup_stmt(where)).rowcount
+        bump_data_version(session)
+    logger.info(f"[writer] daily_sentiment 재구성: {rebuilt}행 ({ticker or '전체'})")
+    return rebuilt
 
 
 # ── NewsArticle ───────────────────────────────────────────────
 
+def filter_new_urls(candidates: Iterable[str]) -> list[str]:
+    """
+    후보 URL 중 아직 저장되지 않은 것만 (표준화된 형태로, 입력 순서대로) 반환.
+    표준화 URL 해시를 한 번의 IN 쿼리로 news_article_urls PK 에 조회하므로
+    저장된 URL 전체를 메모리에 올리지 않는다.
+    yahoo_scraper.collect_yahoo_links 의 url_filter 로 전달.
+    """
+    by_hash: dict[str, str] = {}
+    for u in candidates:
+        canonical = canonicalize_url(u)
+        by_hash.setdefault(url_hash(canonical), canonical)
+    if not by_hash:
+        return []
+
+    with get_session() as session:
+        known = set(session.execute(_known_hashes_stmt(list(by_hash))).scalars().all())
+
+    logger.info(f"[writer] 후보 URL {len(by_hash)}개 중 기존 {len(known)}개 제외")
+    return [u for h, u in by_hash.items() if h not in known]
+
+
+def _known_hashes_stmt(hashes: list[str]):
+    # 파티션을 모두 뒤지지 않도록 레지스트리 PK 만 조회
+    return select(NewsArticleUrl.url_hash).where(NewsArticleUrl.url_hash.in_(hashes))
+
+
 def get_existing_urls(ticker: str) -> set[str]:
     """
     DB에 이미 저장된 URL 집합 반환.
-    yahoo_scraper의 stop_urls로 전달해 중복 수집 방지.
+    저장 건수에 비례해 커지므로 파이프라인은 filter_new_urls() 를 사용한다.
     """
     with get_session() as session:
-        rows = session.execute(
-            select(NewsArticle.url).where(NewsArticle.ticker == ticker)
-        ).scalars().all()
+        rows = session.execute(_existing_urls_stmt(ticker)).scalars().all()
     return set(rows)
 
 
+def _existing_urls_stmt(ticker: str):
+    return select(NewsArticle.url).where(NewsArticle.ticker == ticker)
+
+
+def _article_row(ticker: str, a: dict) -> Optional[dict]:
+    """기사 dict → news_articles 행. 실패 항목(error 키)이나 변환 불가 항목은 None."""
+    if a.get("error") or not a.get("url"):
+        return None
+    try:
+        canonical = canonicalize_url(a["url"])
+        return {
+            "ticker":          ticker,
+            "date":            date.fromisoformat(a["date"]),
+            "url":             canonical,
+            "url_hash":        url_hash(canonical),
+            "title":           (a.get("title") or "")[:1024],
+            "content":         a.get("content") or "",
+            "sentiment_label": a.get("sentiment_label"),
+            "sentiment_score": a.get("sentiment_score"),
+        }
+    except (KeyError, ValueError) as e:
+        logger.warning(f"[writer] 기사 데이터 변환 오류: {e} → {a.get('url', '')[:60]}")
+        return None
+
+
+def _article_values(rows: list[dict]):
+    """
+    다중 VALUES 경로의 기사 원본 CTE: WITH src AS (SELECT CAST(..) FROM (VALUES ...) AS src_values (...)).
+    CTE 로 한 번만 렌더링하므로 reg / ins 두 곳에서 참조해도 바인드 파라미터는 행 × 컬럼 수 그대로.
+    모든 값이 NULL 인 컬럼(sentiment_score 등)도 text 로 추론되지 않도록 대상 컬럼 타입으로 CAST.
+    """
+    types = {c: NewsArticle.__table__.c[c].type for c in ARTICLE_COLUMNS}
+    v = values(*(column(c, types[c]) for c in ARTICLE_COLUMNS), name="src_values").data(
+        [tuple(r[c] for c in ARTICLE_COLUMNS) for r in rows]
+    )
+    return select(*(cast(v.c[c], types[c]).label(c) for c in ARTICLE_COLUMNS)).cte("src")
+
+
+def _dedupe_rows(rows: list[dict]) -> list[dict]:
+    """같은 배치 안의 중복 URL(url_hash) 은 첫 행만 남김 (레지스트리 JOIN 이 행을 복제하지 않도록)."""
+    seen: set[str] = set()
+    unique = []
+    for r in rows:
+        if r["url_hash"] not in seen:
+            seen.add(r["url_hash"])
+            unique.append(r)
+    return unique
+
+
+def _insert_article_rows(rows: list[dict]) -> int:
+    """_write_article_rows + metrics 의 db_write 단계 기록 (items = 삽입 행 수)."""
+    with stage("db_write") as st:
+        inserted = _write_article_rows(rows)
+        st.add(items=inserted)
+    return inserted
+
+
+def _write_article_rows(rows: list[dict]) -> int:
+    """
+    rows 가 BULK_COPY_MIN_ROWS 이상이면 BULK_COPY_CHUNK_ROWS 씩 COPY 경로, 아니면 다중 VALUES 한 문장.
+    두 경로 모두 _insert_with_rollup_stmt 로 레지스트리 / 기사 / 롤업을 함께 갱신.
+    청크마다 commit. 반환값: 실제 삽입된 행 수
+    """
+    rows = _dedupe_rows(rows)
+    if len(rows) < BULK_COPY_MIN_ROWS:
+        with get_session() as session:
+            inserted = int(session.execute(_insert_with_rollup_stmt(_article_values(rows))).scalar())
+            if inserted:
+                bump_data_version(session)
+            return inserted
+
+    stage_table = staging_table("_stage_news_articles", ARTICLE_COLUMNS)
+    inserted = 0
+    for chunk in _chunks(rows, BULK_COPY_CHUNK_ROWS):
+        with get_session() as session:
+            copy_to_staging(session, NewsArticle.__tablename__, stage_table.name, ARTICLE_COLUMNS, chunk)
+            n = int(session.execute(_insert_with_rollup_stmt(stage_table)).scalar())
+            if n:
+                bump_data_version(session)
+        inserted += n
+    logger.info(f"[writer] 기사 COPY 적재: {len(rows)}행 → 삽입 {inserted}건")
+    return inserted
+
+
 def insert_articles(ticker: str, articles: list[dict]) -> int:
     """
     감정분석이 완료된 기사 목록을 저장.
-    url 중복인 경우 skip (on_conflict_do_nothing).
+    url 중복인 경우 skip (news_article_urls 레지스트리 기준).
     반환값: 실제 삽입된 행 수
     """
     if not articles:
         return 0
 
-    rows = []
+    # error 키가 있는 실패 항목은 저장하지 않음
+    rows = [r for r in (_article_row(ticker, a) for a in articles) if r is not None]
+    if not rows:
+        return 0
+
+    inserted = _insert_article_rows(rows)
+    logger.info(f"[writer] 기사 insert 완료: {inserted}건 (전체 {len(rows)}건 중)")
+    return inserted
+
+
+def insert_articles_stream(
+    ticker: str,
+    articles: Iterable[dict],
+    batch_size: int = INSERT_BATCH_SIZE,
+) -> int:
+    """
+    기사 스트림(iter_analyzed() 등)을 소비하며 batch_size 행마다 INSERT + commit.
+    메모리에는 최대 batch_size 행만 유지되고, 중간에 실패해도 이미 commit 된 배치는 남는다.
+    반환값: 실제 삽입된 행 수
+    """
+    batch_size = max(1, batch_size)
+    inserted = total = batches = 0
+    rows: list[dict] = []
+
+    def flush() -> None:
+        nonlocal inserted, batches
+        inserted += _insert_article_rows(rows)
+        batches += 1
+        rows.clear()
+
     for a in articles:
-        # error 키가 있는 실패 항목은 저장하지 않음
-        if a.get("error") or not a.get("url"):
-            continue
-        try:
-            rows.append({
-                "ticker":          ticker,
-                "date":            date.fromisoformat(a["date"]),
-                "url":             a["url"],
-                "title":           (a.get("title") or "")[:1024],
-                "content":         a.get("content") or "",
-                "sentiment_label": a.get("sentiment_label"),
-                "sentiment_score": a.get("sentiment_score"),
-            })
-        except (KeyError, ValueError) as e:
-            logger.warning(f"[writer] 기사 데이터 변환 오류: {e} → {a.get('url', '')[:60]}")
+        row = _article_row(ticker, a)
+        if row is None:
             continue
+        rows.append(row)
+        total += 1
+        if len(rows) >= batch_size:
+            flush()
+    if rows:
+        flush()
+
+    logger.info(f"[writer] 기사 insert 완료: {inserted}건 (전체 {total}건 중, {batches}회 commit)")
+    return inserted
+
 
+def iter_articles_for_rescore(ticker: Optional[str] = None, batch_size: int = 1000) -> Iterator[list[dict]]:
+    """
+    재분석 대상 기사를 id 순으로 batch_size 씩 반환 (keyset: id > 마지막 id).
+    배치마다 세션을 새로 열어 긴 트랜잭션을 만들지 않는다.
+    """
+    last_id = 0
+    while True:
+        stmt = (
+            select(NewsArticle.id, NewsArticle.date, NewsArticle.title, NewsArticle.content)
+            .where(NewsArticle.id > last_id)
+            .order_by(NewsArticle.id)
+            .limit(batch_size)
+        )
+        if ticker:
+            stmt = stmt.where(NewsArticle.ticker == ticker)
+        with get_session() as session:
+            rows = [dict(r) for r in session.execute(stmt).mappings().all()]
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1]["id"]
+
+
+def update_article_sentiments(rows: list[dict]) -> int:
+    """
+    [{"id", "date", "sentiment_label", "sentiment_score"}, ...] 를 executemany 로 일괄 갱신.
+    date(파티션 키)를 함께 걸어 행마다 해당 월 파티션의 PK 만 조회한다.
+    반환값: 갱신 요청 행 수
+    """
     if not rows:
         return 0
-
+    t = NewsArticle.__table__
+    stmt = (
+        update(t)
+        .where(t.c.id == bindparam("_id"), t.c.date == bindparam("_date"))
+        .values(sentiment_label=bindparam("_label"), sentiment_score=bindparam("_score"))
+    )
+    params = [
+        {"_id": r["id"], "_date": r["date"], "_label": r["sentiment_label"], "_score": r["sentiment_score"]}
+        for r in rows
+    ]
     with get_session() as session:
-        stmt = pg_insert(NewsArticle).values(rows)
-        stmt = stmt.on_conflict_do_nothing(index_elements=["url"])
-        result = session.execute(stmt)
-        inserted = result.rowcount
-
-    logger.info(f"[writer] 기사 insert 완료: {inserted}건 (전체 {len(rows)}건 중)")
-    return inserted
+        session.connection().execute(stmt, params)
+        _refresh_rollup_for_ids(session, [r["id"] for r in rows], (r["date"] for r in rows))
+        bump_data_version(session)
+    return len(rows)
@@ -1,78 +1,190 @@
 import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from settings import TICKERS, YF_MAX_SCROLL, YF_MAX_ARTICLES
+from settings import (
+    TICKERS, YF_MAX_SCROLL, YF_MAX_ARTICLES, PIPELINE_WORKERS,
+    PRICE_INCREMENTAL, PRICE_BACKFILL_PERIOD, OFFLINE_MODE, METRICS_TEXTFILE,
+)
+from metrics import gauge, stage_summary, write_textfile
+from collector.driver_pool import shutdown_driver_pool
+from collector.page_cache import get_page_cache
+from collector.rate_limiter import get_rate_limiter
 from collector.price_fetcher import fetch_price
-from collector.yahoo_scraper import collect_yahoo_links
-from collector.article_fetcher import fetch_articles
-from analyzer.sentiment import analyze_articles
-from db.writer import init_db, upsert_stock_prices, insert_articles, get_existing_urls
+from collector.link_sources import discover_links
+from collector.article_fetcher import iter_articles
+from analyzer.sentiment import iter_analyzed
+from db.writer import (
+    init_db, upsert_stock_prices, insert_articles_stream, filter_new_urls, get_latest_price_date,
+)
 
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+    format="%(asctime)s [%(levelname)s] %(threadName)s %(name)s - %(message)s",
     handlers=[logging.StreamHandler(sys.stdout)],
 )
 logger = logging.getLogger(__name__)
 
+RUN_SECONDS = gauge("stockmind_pipeline_last_run_seconds", "마지막 파이프라인 실행 wall time(초)")
+RUN_FINISHED = gauge("stockmind_pipeline_last_run_timestamp_seconds", "마지막 파이프라인 종료 시각 (unix time)")
+RUN_TICKERS = gauge("stockmind_pipeline_last_run_tickers", "마지막 실행의 ticker 수", ["status"])
+
 
-def run_pipeline(tickers: list[str] = TICKERS) -> None:
+def _fetch_prices(ticker: str) -> list[dict]:
     """
-    전체 파이프라인 실행:
-    1. DB 초기화
-    2. ticker별로:
-       a. 주가 수집 → DB upsert
-       b. 뉴스 링크 수집 (기존 URL 제외)
-       c. 기사 본문 수집
-       d. 감정 분석
-       e. DB insert
+    증분 모드: DB 마지막 저장일 이후(+겹침 구간)만 조회.
+    저장된 주가가 없으면 PRICE_BACKFILL_PERIOD 전체를 백필.
     """
-    logger.info(f"=== 파이프라인 시작 | tickers={tickers} ===")
-    init_db()
+    if not PRICE_INCREMENTAL:
+        return fetch_price(ticker)
+    since = get_latest_price_date(ticker)
+    if since is None:
+        logger.info(f"[{ticker}] 저장된 주가 없음 → {PRICE_BACKFILL_PERIOD} 백필")
+        return fetch_price(ticker, period=PRICE_BACKFILL_PERIOD)
+    logger.info(f"[{ticker}] 마지막 저장일 {since} 이후 증분 조회")
+    return fetch_price(ticker, since=since)
 
-    for ticker in tickers:
-        logger.info(f"--- [{ticker}] 처리 시작 ---")
 
-        # ── 1. 주가 수집 ──────────────────────────────────────
-        logger.info(f"[{ticker}] 주가 수집 중...")
-        price_data = fetch_price(ticker)
-        if price_data:
-            upsert_stock_prices(price_data)
-        else:
-            logger.warning(f"[{ticker}] 주가 데이터 없음, 스킵")
-
-        # ── 2. 뉴스 링크 수집 ────────────────────────────────
-        logger.info(f"[{ticker}] 뉴스 링크 수집 중...")
-        stop_urls = get_existing_urls(ticker)
-        logger.info(f"[{ticker}] 기존 저장 URL {len(stop_urls)}개 → 중복 스킵")
-
-        links = collect_yahoo_links(
-            ticker=ticker,
-            max_scroll=YF_MAX_SCROLL,
-            max_articles=YF_MAX_ARTICLES,
-            stop_urls=stop_urls,
-        )
+def process_ticker(ticker: str) -> dict:
+    """
+    ticker 1개 처리:
+    a. 주가 수집 → DB upsert
+    b. 뉴스 링크 수집 (RSS 우선, 부족하면 Selenium / DB에 저장된 URL은 filter_new_urls 로 제외)
+    c~e. 기사 본문 수집 → 감정 분석 → DB insert 를 스트리밍으로 연결
+         (기사는 수집되는 대로 묶음 단위로 분석·저장되어 메모리 사용량이 링크 수와 무관)
+
+    반환값: {"ticker", "prices", "links", "inserted", "elapsed"}
+    """
+    started = time.perf_counter()
+    result = {"ticker": ticker, "prices": 0, "links": 0, "inserted": 0}
+    logger.info(f"--- [{ticker}] 처리 시작 ---")
+
+    # ── 1. 주가 수집 ──────────────────────────────────────
+    logger.info(f"[{ticker}] 주가 수집 중...")
+    price_data = _fetch_prices(ticker)
+    if price_data:
+        result["prices"] = upsert_stock_prices(price_data)
+    else:
+        logger.warning(f"[{ticker}] 주가 데이터 없음, 스킵")
+
+    # ── 2. 뉴스 링크 수집 ────────────────────────────────
+    logger.info(f"[{ticker}] 뉴스 링크 수집 중...")
+    links = discover_links(
+        ticker=ticker,
+        max_scroll=YF_MAX_SCROLL,
+        max_articles=YF_MAX_ARTICLES,
+        url_filter=filter_new_urls,
+    )
+    result["links"] = len(links)
+
+    if not links:
+        logger.warning(f"[{ticker}] 수집된 링크 없음, 스킵")
+        result["elapsed"] = time.perf_counter() - started
+        return result
+
+    # ── 3~5. 본문 수집 → 감정 분석 → DB 저장 (스트리밍) ──
+    logger.info(f"[{ticker}] 기사 수집/분석/저장 중... ({len(links)}개)")
+    articles = iter_articles(links)
+    analyzed = iter_analyzed(articles)
+    inserted = insert_articles_stream(ticker, analyzed)
+    result["inserted"] = inserted
+    logger.info(f"[{ticker}] DB 저장 완료: {inserted}건")
+
+    result["elapsed"] = time.perf_counter() - started
+    logger.info(f"--- [{ticker}] 처리 완료 ({result['elapsed']:.1f}s) ---")
+    return result
+
+
+def _run_ticker(ticker: str) -> dict:
+    """
+    process_ticker() + 실패 격리. 실패해도 그때까지 쓴 시간을 elapsed 로 남겨
+    ticker 합계(serial) / speedup 에 포함되게 한다.
+    """
+    started = time.perf_counter()
+    try:
+        return process_ticker(ticker)
+    except Exception as e:
+        logger.exception(f"[{ticker}] 처리 실패: {e}")
+        return {"ticker": ticker, "error": str(e), "elapsed": time.perf_counter() - started}
 
-        if not links:
-            logger.warning(f"[{ticker}] 수집된 링크 없음, 스킵")
-            continue
 
-        # ── 3. 기사 본문 수집 ────────────────────────────────
-        logger.info(f"[{ticker}] 기사 본문 수집 중... ({len(links)}개)")
-        articles = fetch_articles(links)
+def run_pipeline(tickers: list[str] = TICKERS, workers: int = PIPELINE_WORKERS) -> list[dict]:
+    """
+    전체 파이프라인 실행:
+    1. DB 초기화
+    2. ticker별 process_ticker()를 최대 workers개 스레드에서 동시 실행
+       → 한 ticker의 Selenium 스크롤과 다른 ticker의 본문 수집/감정 분석이 겹쳐서 진행
+    3. ticker 단위 실패 격리: 한 ticker의 예외는 로그만 남기고 나머지는 계속 처리
 
-        # ── 4. 감정 분석 ─────────────────────────────────────
-        logger.info(f"[{ticker}] 감정 분석 중...")
-        analyzed = analyze_articles(articles)
+    반환값: ticker별 처리 결과 목록 (실패한 ticker는 "error" 키 포함)
+    """
+    logger.info(f"=== 파이프라인 시작 | tickers={tickers} workers={workers} ===")
+    if OFFLINE_MODE:
+        logger.info("오프라인 모드: 네트워크 없이 캐시된 페이지로만 처리")
+    init_db()
 
-        # ── 5. DB 저장 ───────────────────────────────────────
-        inserted = insert_articles(ticker, analyzed)
-        logger.info(f"[{ticker}] DB 저장 완료: {inserted}건")
+    started = time.perf_counter()
+    results: list[dict] = []
+    workers = max(1, min(workers, len(tickers) or 1))
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticker") as pool:
+            futures = [pool.submit(_run_ticker, t) for t in tickers]
+            for fut in as_completed(futures):
+                results.append(fut.result())
+    finally:
+        # 링크 수집과 본문 폴백이 공유한 Chrome 세션 정리
+        shutdown_driver_pool()
+
+    wall = time.perf_counter() - started
+    serial = sum(r.get("elapsed", 0.0) for r in results)
+    speedup = serial / wall if wall > 0 else 1.0
+    failed = [r["ticker"] for r in results if r.get("error")]
+
+    for r in sorted(results, key=lambda r: tickers.index(r["ticker"])):
+        if r.get("error"):
+            logger.info(f"[summary] {r['ticker']}: 실패 ({r['error']}), {r['elapsed']:.1f}s")
+        else:
+            logger.info(
+                f"[summary] {r['ticker']}: 주가 {r['prices']}건, 링크 {r['links']}개, "
+                f"저장 {r['inserted']}건, {r['elapsed']:.1f}s"
+            )
+    logger.info(
+        f"=== 파이프라인 종료 | wall={wall:.1f}s, ticker 합계={serial:.1f}s, "
+        f"speedup={speedup:.2f}x, 실패={failed or '없음'} ==="
+    )
+    for host, st in get_rate_limiter().stats().items():
+        logger.info(f"[rate_limiter] {host}: 최종 {st['rate']} req/s, 429/503 {st['throttled']}회")
+    page_cache = get_page_cache()
+    if page_cache is not None:
+        stats = page_cache.stats()
+        logger.info(
+            f"[page_cache] 적중 {stats['hits']} / 미적중 {stats['misses']}, "
+            f"{stats['pages']}페이지 {stats['bytes'] / 1024 / 1024:.1f}MB"
+        )
+    _export_metrics(wall, len(results) - len(failed), len(failed))
+    return results
 
-        logger.info(f"--- [{ticker}] 처리 완료 ---")
 
-    logger.info("=== 파이프라인 종료 ===")
+def _export_metrics(wall: float, succeeded: int, failed: int) -> None:
+    """단계별 계측 요약을 로그로 남기고 METRICS_TEXTFILE 에 Prometheus textfile 로 저장."""
+    for name, st in stage_summary().items():
+        logger.info(
+            f"[metrics] {name}: {st['calls']}회, {st['seconds']:.1f}s, 건수 {st['items']}, "
+            f"오류 {st['errors']}, {st['bytes'] / 1024:.0f}KB"
+        )
+    RUN_SECONDS.set(wall)
+    RUN_FINISHED.set(time.time())
+    RUN_TICKERS.set(succeeded, status="ok")
+    RUN_TICKERS.set(failed, status="failed")
+    if METRICS_TEXTFILE:
+        try:
+            write_textfile(METRICS_TEXTFILE)
+        except OSError as e:
+            logger.warning(f"[metrics] textfile 저장 실패: {e}")
 
 
 if __name__ == "__main__":
-    run_pipeline()
+    outcome = run_pipeline()
+    sys.exit(1 if any(r.get("error") for r in outcome) else 0)
@@ -0,0 +1,281 @@
+"""
+단계별 계측 + Prometheus 텍스트 포맷 노출 (표준 라이브러리만 사용).
+
+- 파이프라인: stage() / record() 로 단계별 누적 소요 시간, 호출 수, 처리 건수, 오류 수, 바이트 수를 모으고
+  실행이 끝나면 write_textfile() 로 node_exporter textfile collector 용 .prom 파일을 쓴다.
+- API: api/metrics.py 가 같은 레지스트리에 경로별 지연 히스토그램과 DB 풀 상태를 올리고 /metrics 로 노출.
+
+필요한 것은 counter / gauge / histogram 과 텍스트 노출 포맷뿐이라 prometheus_client 를 추가하지 않았다
+(의존성과 import 비용을 늘리지 않음, tests/test_startup.py).
+
+단계 이름 (STAGES):
+    price_fetch        차트 API 조회 (bytes = 응답 본문)
+    link_scrape        뉴스 링크 탐색 (RSS + Selenium 목록 스크롤)
+    article_fetch      기사 1건 수집 + 추출 (bytes = 원본 HTML, selenium_fallback 시간 포함)
+    selenium_fallback  본문이 짧을 때 Chrome 렌더링 (bytes = 렌더링된 HTML)
+    sentiment          감정 분석 배치
+    db_write           주가 upsert / 기사 insert (items = 실제 변경 행 수)
+스레드에서 동시에 실행되는 단계(article_fetch 등)의 seconds 는 벽시계 시간이 아니라 호출별 시간의 합이다.
+"""
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs: Sequence[tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+# ── 메트릭 타입 ───────────────────────────────────────────────
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: dict = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 라벨 {sorted(labels)} ≠ {list(self.labelnames)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _lines(self, key: tuple, value) -> list[str]:
+        return [f"{self.name}{_labels(list(zip(self.labelnames, key)))} {_format_value(value)}"]
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in items:
+            lines += self._lines(key, value)
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if amount < 0:
+            raise ValueError("counter 는 감소할 수 없습니다.")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels) -> Optional[float]:
+        with self._lock:
+            return self._values.get(self._key(labels))
+
+
+class Histogram(_Metric):
+    """버킷별 누적 개수 + 합계 + 개수. 값은 [버킷별 개수..., sum, count] 로 보관."""
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def snapshot(self, **labels) -> dict:
+        """{"buckets": {상한: 누적 개수, ..., inf: count}, "sum", "count"} (테스트 / 디버깅용)"""
+        with self._lock:
+            state = list(self._values.get(self._key(labels), [0] * len(self.buckets) + [0.0, 0]))
+        cumulative, running = {}, 0
+        for bound, n in zip(self.buckets, state):
+            running += n
+            cumulative[bound] = running
+        cumulative[float("inf")] = state[-1]
+        return {"buckets": cumulative, "sum": state[-2], "count": state[-1]}
+
+    def _lines(self, key: tuple, state) -> list[str]:
+        pairs = list(zip(self.labelnames, key))
+        lines, running = [], 0
+        for bound, n in zip(self.buckets + (float("inf"),), state[:len(self.buckets)] + [0]):
+            running += n
+            count = state[-1] if bound == float("inf") else running
+            lines.append(f"{self.name}_bucket{_labels(pairs + [('le', _format_value(bound))])} {count}")
+        lines.append(f"{self.name}_sum{_labels(pairs)} {_format_value(state[-2])}")
+        lines.append(f"{self.name}_count{_labels(pairs)} {state[-1]}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """같은 이름이 이미 있으면 기존 메트릭을 반환 (타입이 다르면 ValueError)."""
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if type(existing) is not type(metric):
+            raise ValueError(f"{metric.name} 은(는) 이미 {existing.kind} 로 등록되어 있습니다.")
+        return existing
+
+    def clear(self) -> None:
+        """모든 메트릭 값 초기화 (등록은 유지)."""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 포맷 (version 0.0.4)."""
+        lines = []
+        for name in sorted(self._metrics):
+            lines += self._metrics[name].render()
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def counter(name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, help, labelnames))
+
+
+def gauge(name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, help, labelnames))
+
+
+def histogram(name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, help, labelnames, buckets))
+
+
+# ── 파이프라인 단계 계측 ──────────────────────────────────────
+
+STAGES = ("price_fetch", "link_scrape", "article_fetch", "selenium_fallback", "sentiment", "db_write")
+
+STAGE_SECONDS = counter("stockmind_stage_seconds_total", "단계별 누적 소요 시간(초)", ["stage"])
+STAGE_CALLS = counter("stockmind_stage_calls_total", "단계별 호출 수", ["stage"])
+STAGE_ITEMS = counter("stockmind_stage_items_total", "단계별 처리 건수", ["stage"])
+STAGE_ERRORS = counter("stockmind_stage_errors_total", "단계별 오류 수", ["stage"])
+STAGE_BYTES = counter("stockmind_stage_bytes_total", "단계별 수신/처리 바이트 수", ["stage"])
+
+
+class StageRecorder:
+    """stage() 블록 안에서 처리 건수 / 오류 / 바이트를 더하는 핸들."""
+    __slots__ = ("name", "items", "errors", "nbytes")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = self.errors = self.nbytes = 0
+
+    def add(self, items: int = 0, errors: int = 0, nbytes: int = 0) -> None:
+        self.items += items
+        self.errors += errors
+        self.nbytes += nbytes
+
+
+def record(name: str, seconds: float = 0.0, calls: int = 0, items: int = 0, errors: int = 0, nbytes: int = 0) -> None:
+    """단계 name 에 값을 누적 (0 인 항목은 건너뜀)."""
+    for metric, amount in (
+        (STAGE_SECONDS, seconds), (STAGE_CALLS, calls), (STAGE_ITEMS, items),
+        (STAGE_ERRORS, errors), (STAGE_BYTES, nbytes),
+    ):
+        if amount:
+            metric.inc(amount, stage=name)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[StageRecorder]:
+    """
+    블록 실행 시간을 단계 name 에 기록. 블록에서 예외가 나가면 오류 1건을 더하고 다시 던진다.
+
+        with stage("price_fetch") as st:
+            ...
+            st.add(items=len(rows), nbytes=len(resp.content))
+    """
+    rec = StageRecorder(name)
+    started = time.perf_counter()
+    try:
+        yield rec
+    except Exception:
+        rec.errors += 1
+        raise
+    finally:
+        record(name, time.perf_counter() - started, 1, rec.items, rec.errors, rec.nbytes)
+
+
+def stage_summary() -> dict[str, dict]:
+    """기록이 있는 단계별 {"calls", "seconds", "items", "errors", "bytes"} (로그 요약용)."""
+    summary = {}
+    for name in STAGES:
+        calls = STAGE_CALLS.value(stage=name)
+        if not calls:
+            continue
+        summary[name] = {
+            "calls": int(calls),
+            "seconds": STAGE_SECONDS.value(stage=name),
+            "items": int(STAGE_ITEMS.value(stage=name)),
+            "errors": int(STAGE_ERRORS.value(stage=name)),
+            "bytes": int(STAGE_BYTES.value(stage=name)),
+        }
+    return summary
+
+
+def write_textfile(path: str, registry: Registry = REGISTRY) -> None:
+    """
+    node_exporter textfile collector 용 .prom 파일로 저장.
+    같은 디렉터리의 임시 파일에 쓴 뒤 os.replace 하므로 수집기가 반쯤 쓰인 파일을 읽지 않는다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(registry.render())
+    os.replace(tmp, path)
+    logger.info(f"[metrics] textfile 저장: {path}")
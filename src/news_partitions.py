@@ -0,0 +1,46 @@
+"""
+news_articles 월 파티션 관리.
+init_db 가 이번 달 ~ NEWS_PARTITION_MONTHS_AHEAD 개월 뒤 파티션을 자동으로 만들므로,
+과거 구간을 미리 만들거나 오래된 기사를 월 단위로 지울 때 사용한다.
+
+    PYTHONPATH=src python src/news_partitions.py --list
+    PYTHONPATH=src python src/news_partitions.py --ensure 2021-01-01 2021-12-31
+    PYTHONPATH=src python src/news_partitions.py --drop-before 2022-01-01
+"""
+import argparse
+import logging
+import sys
+from datetime import date
+
+from db.partitions import existing_partitions
+from db.writer import init_db, get_engine, prepare_news_partitions, drop_news_partitions_before
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="news_articles 월 파티션 관리")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--list", action="store_true", help="파티션 목록 출력")
+    group.add_argument("--ensure", nargs=2, type=date.fromisoformat, metavar=("START", "END"),
+                       help="START ~ END 가 걸친 달의 파티션 생성")
+    group.add_argument("--drop-before", type=date.fromisoformat, metavar="DATE",
+                       help="DATE 가 속한 달 이전 파티션 삭제 (daily_sentiment 롤업은 유지)")
+    args = parser.parse_args()
+
+    init_db()
+    if args.list:
+        with get_engine().connect() as conn:
+            for name in sorted(existing_partitions(conn)):
+                print(name)
+    elif args.ensure:
+        created = prepare_news_partitions(*args.ensure)
+        logger.info(f"[news_partitions] 생성 {len(created)}개: {', '.join(created) or '-'}")
+    else:
+        dropped = drop_news_partitions_before(args.drop_before)
+        logger.info(f"[news_partitions] 삭제 {len(dropped)}개: {', '.join(dropped) or '-'}")
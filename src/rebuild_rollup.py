@@ -0,0 +1,30 @@
+"""
+daily_sentiment 롤업을 news_articles 로부터 다시 만듦.
+writer 밖에서 기사를 직접 수정/삭제했거나 롤업 값이 의심될 때 사용.
+
+    PYTHONPATH=src python src/rebuild_rollup.py [--ticker TSLA]
+"""
+import argparse
+import logging
+import sys
+import time
+
+from db.writer import init_db, rebuild_daily_sentiment
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="daily_sentiment 롤업 재구성")
+    parser.add_argument("--ticker", default=None, help="특정 ticker만 재구성")
+    args = parser.parse_args()
+
+    init_db()
+    started = time.perf_counter()
+    rows = rebuild_daily_sentiment(ticker=args.ticker)
+    logger.info(f"[rebuild_rollup] 완료: {rows}행, {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,50 @@
+"""
+news_articles 전체(또는 특정 ticker)를 다시 감정 분석해 sentiment 컬럼을 갱신.
+analyzer 변경 후 과거 데이터 재계산용.
+
+    PYTHONPATH=src python src/rescore.py [--ticker TSLA] [--batch-size 2000] [--workers 0]
+"""
+import argparse
+import logging
+import sys
+import time
+from typing import Optional
+
+from analyzer.sentiment import analyze_batch, article_text
+from db.writer import init_db, iter_articles_for_rescore, update_article_sentiments
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger(__name__)
+
+
+def rescore_articles(ticker: Optional[str] = None, batch_size: int = 2000, workers: Optional[int] = None) -> int:
+    """기사를 batch_size 씩 읽어 analyze_batch() 로 재분석 후 갱신. 반환값: 처리 건수"""
+    init_db()
+    started = time.perf_counter()
+    total = 0
+
+    for batch in iter_articles_for_rescore(ticker=ticker, batch_size=batch_size):
+        sentiments = analyze_batch([article_text(a) for a in batch], workers=workers)
+        total += update_article_sentiments([
+            {"id": a["id"], "date": a["date"], "sentiment_label": s["label"], "sentiment_score": s["score"]}
+            for a, s in zip(batch, sentiments)
+        ])
+        logger.info(f"[rescore] 누적 {total}건 갱신")
+
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed > 0 else 0.0
+    logger.info(f"[rescore] 완료: {total}건, {elapsed:.1f}s ({rate:.0f} articles/sec)")
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="news_articles 감정 재분석")
+    parser.add_argument("--ticker", default=None, help="특정 ticker만 재분석")
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (0 = CPU 코어 수)")
+    args = parser.parse_args()
+    rescore_articles(ticker=args.ticker, batch_size=args.batch_size, workers=args.workers)
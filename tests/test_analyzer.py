@@ -54,3 +54,90 @@ class TestSentiment:
         from analyzer.sentiment import analyze_articles
         results = analyze_articles([])
         assert results == []
+
+    def test_analyze_batch_matches_single(self):
+        """배치 결과가 순서/값 모두 analyze_sentiment와 동일한지 확인"""
+        from analyzer.sentiment import analyze_batch, analyze_sentiment
+        texts = ["great profit", "", "terrible crash", None, "stock market today"]
+        assert analyze_batch(texts, workers=1) == [analyze_sentiment(t) for t in texts]
+
+    def test_analyze_batch_process_pool(self):
+        """프로세스 풀 경로도 입력 순서를 유지하는지 확인"""
+        from analyzer.sentiment import analyze_batch, analyze_sentiment
+        texts = [f"good news {i}" if i % 2 else f"awful loss {i}" for i in range(40)]
+        results = analyze_batch(texts, workers=2, chunk_size=10, pool_min_batch=0)
+        assert results == [analyze_sentiment(t) for t in texts]
+
+    def test_analyze_articles_uses_title_when_no_content(self):
+        from analyzer.sentiment import analyze_articles, analyze_sentiment
+        articles = [{"url": "u", "title": "wonderful gains", "content": "", "date": "2026-01-01"}]
+        result = analyze_articles(articles)[0]
+        assert result["sentiment_score"] == analyze_sentiment("wonderful gains")["score"]
+        assert result["url"] == "u"
+
+    def test_iter_analyzed_pulls_one_batch_at_a_time(self):
+        """스트림에서 batch_size 개만 당겨 분석하고 순서를 유지하는지 확인"""
+        from analyzer.sentiment import iter_analyzed, analyze_sentiment
+        pulled = []
+
+        def stream():
+            for i in range(10):
+                pulled.append(i)
+                yield {"url": f"u{i}", "title": "", "content": f"great gain {i}", "date": "2026-01-01"}
+
+        it = iter_analyzed(stream(), batch_size=4)
+        first = next(it)
+        assert len(pulled) == 4
+        rest = list(it)
+        assert [r["url"] for r in [first, *rest]] == [f"u{i}" for i in range(10)]
+        assert first["sentiment_score"] == analyze_sentiment("great gain 0")["score"]
+
+
+class TestSentimentCache:
+    def test_cache_skips_repeated_texts(self, tmp_path, monkeypatch):
+        """캐시에 있는 텍스트는 다시 분석하지 않는지 확인"""
+        from analyzer import sentiment
+        from analyzer.cache import SentimentCache
+
+        cache = SentimentCache(path=str(tmp_path / "cache.sqlite"))
+        calls = []
+        original = sentiment._analyze_chunk
+        monkeypatch.setattr(sentiment, "_analyze_chunk", lambda texts: calls.extend(texts) or original(texts))
+
+        texts = ["great earnings", "awful quarter", "great earnings"]
+        first = sentiment.analyze_batch(texts, workers=1, cache=cache)
+        assert calls == ["great earnings", "awful quarter"]   # 배치 내 중복도 1번만 분석
+
+        calls.clear()
+        second = sentiment.analyze_batch(texts, workers=1, cache=cache)
+        assert calls == []
+        assert first == second == [sentiment.analyze_sentiment(t) for t in texts]
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        from analyzer.cache import SentimentCache
+        path = str(tmp_path / "cache.sqlite")
+        c1 = SentimentCache(path=path)
+        k = c1.key("hello world")
+        c1.put_many({k: {"label": "neutral", "score": 0.0}})
+        c1.close()
+        c2 = SentimentCache(path=path)
+        assert c2.get_many([k]) == {k: {"label": "neutral", "score": 0.0}}
+
+    def test_version_change_invalidates(self, tmp_path):
+        """analyzer 버전이 바뀌면 기존 캐시가 무효화되는지 확인"""
+        from analyzer.cache import SentimentCache
+        path = str(tmp_path / "cache.sqlite")
+        old = SentimentCache(path=path, analyzer_version="v1")
+        old.put_many({old.key("text"): {"label": "positive", "score": 0.5}})
+        old.close()
+        new = SentimentCache(path=path, analyzer_version="v2")
+        assert new.key("text") != old.key("text")
+        assert new.get_many([old.key("text")]) == {}
+
+    def test_memory_layer_is_lru_bounded(self):
+        from analyzer.cache import SentimentCache
+        cache = SentimentCache(path=None, max_memory=2)
+        cache.put_many({"a": {"label": "neutral", "score": 0.0}, "b": {"label": "neutral", "score": 0.0}})
+        cache.get_many(["a"])
+        cache.put_many({"c": {"label": "neutral", "score": 0.0}})
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
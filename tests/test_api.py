@@ -0,0 +1,266 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+def _compile(stmt) -> str:
+    from sqlalchemy.dialects import postgresql
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class TestSummaryQuery:
+    def test_summary_reads_rollup_only(self):
+        """요약이 news_articles 대신 daily_sentiment 롤업만 조인하는지 확인 (O(일수))"""
+        from api.main import _daily_summary_stmt
+        sql = _compile(_daily_summary_stmt("TSLA", 10))
+        assert "news_articles" not in sql
+        assert "LEFT OUTER JOIN daily_sentiment" in sql
+        assert "GROUP BY" not in sql
+        assert "daily_sentiment.score_sum / CAST(nullif(daily_sentiment.score_count, 0) AS FLOAT)" in sql
+
+    def test_summary_does_not_load_content(self):
+        """본문(content) 컬럼을 읽지 않는지 확인"""
+        from api.main import _daily_summary_stmt
+        sql = _compile(_daily_summary_stmt("TSLA", 10))
+        assert "content" not in sql
+
+
+class TestProjection:
+    def test_news_query_skips_content(self):
+        """목록 조회가 본문(content) 없이 응답에 필요한 컬럼만 읽는지 확인"""
+        from api.main import _news_stmt
+        sql = _compile(_news_stmt("TSLA", None, None, 30))
+        select_list = sql.split("FROM")[0]
+        assert "content" not in select_list
+        assert "created_at" not in select_list
+        assert "news_articles.sentiment_score" in select_list
+
+    def test_price_query_projects_response_columns(self):
+        from api.main import _prices_stmt
+        select_list = _compile(_prices_stmt("TSLA", 30)).split("FROM")[0]
+        assert "stock_prices.id" not in select_list
+        assert "created_at" not in select_list
+        assert "stock_prices.direction" in select_list
+
+    def test_rows_convert_without_orm_objects(self):
+        """projection 결과(Row, 컬럼명 속성 접근)를 ORM 객체 없이 응답 dict 로 변환"""
+        import datetime as dt
+        from collections import namedtuple
+        from api.main import NEWS_COLUMNS, _article_to_dict
+        Row = namedtuple("Row", [c.key for c in NEWS_COLUMNS])
+        r = Row(7, "TSLA", dt.date(2026, 1, 2), "https://x", "t", "positive", 0.5)
+        assert _article_to_dict(r) == {
+            "ticker": "TSLA", "date": "2026-01-02", "url": "https://x", "title": "t",
+            "sentiment_label": "positive", "sentiment_score": 0.5,
+        }
+
+
+class TestKeysetPagination:
+    def test_cursor_roundtrip(self):
+        import datetime as dt
+        from api.pagination import encode_cursor, decode_cursor
+        cursor = encode_cursor(dt.date(2026, 1, 2), 42)
+        assert "2026" not in cursor                     # 불투명 문자열
+        assert decode_cursor(cursor, (dt.date, int)) == (dt.date(2026, 1, 2), 42)
+
+    @pytest.mark.parametrize("cursor", ["!!!", "bm90LWpzb24", "WzFd"])
+    def test_invalid_cursor(self, cursor):
+        """깨진 base64 / JSON 이 아님 / 키 개수 불일치"""
+        import datetime as dt
+        from api.pagination import InvalidCursor, decode_cursor
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor, (dt.date, int))
+
+    def test_news_page_uses_row_comparison(self):
+        """OFFSET 없이 (date, id) 행 비교 + 인덱스와 같은 정렬로 다음 페이지를 읽는지 확인"""
+        import datetime as dt
+        from api.main import _news_stmt
+        sql = _compile(_news_stmt("TSLA", None, "positive", 30, (dt.date(2026, 1, 2), 5)))
+        assert "(news_articles.date, news_articles.id) < ('2026-01-02', 5)" in sql
+        assert "news_articles.date <= '2026-01-02'" in sql      # 파티션 pruning 용 단독 조건
+        assert "ORDER BY news_articles.date DESC, news_articles.id DESC" in sql
+        assert "news_articles.sentiment_label = 'positive'" in sql
+        assert "OFFSET" not in sql
+        assert "LIMIT 31" in sql
+
+    def test_split_page(self):
+        import datetime as dt
+        from types import SimpleNamespace
+        from api.pagination import decode_cursor, split_page
+        rows = [SimpleNamespace(date=dt.date(2026, 1, 3 - i), id=10 - i) for i in range(3)]
+        page, cursor = split_page(rows, 2, key=lambda r: (r.date, r.id))
+        assert page == rows[:2]
+        assert decode_cursor(cursor, (dt.date, int)) == (dt.date(2026, 1, 2), 9)
+        assert split_page(rows, 3, key=lambda r: (r.date, r.id)) == (rows, None)
+
+    def test_bad_cursor_is_400(self, cached_client):
+        client, state = cached_client
+        resp = client.get("/stocks/TSLA/prices", params={"cursor": "!!!"})
+        assert resp.status_code == 400
+        assert state["loads"] == 0
+
+
+class TestResponseCache:
+    def _cache(self, **kwargs):
+        from api.cache import ResponseCache
+        state = {"version": 1}
+        cache = ResponseCache(version_source=lambda: state["version"], version_check_sec=0, **kwargs)
+        return cache, state
+
+    def test_hit_and_miss_counts(self):
+        cache, _ = self._cache()
+        assert cache.get("k") is None
+        cache.put("k", b"[]", cache.current_version())
+        assert cache.get("k").body == b"[]"
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_data_version_bump_invalidates(self):
+        """writer 가 data_version 을 올리면 TTL 과 무관하게 기존 응답을 버리는지 확인"""
+        cache, state = self._cache()
+        cache.put("k", b"[1]", cache.current_version())
+        state["version"] = 2
+        assert cache.get("k") is None
+
+    def test_ttl_expiry(self):
+        import time
+        cache, _ = self._cache(ttl=0.05)
+        cache.put("k", b"[]", cache.current_version())
+        time.sleep(0.06)
+        assert cache.get("k") is None
+
+    def test_lru_bound(self):
+        cache, _ = self._cache(max_entries=2)
+        for k in ("a", "b"):
+            cache.put(k, b"[]", 1)
+        cache.get("a")
+        cache.put("c", b"[]", 1)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_etag_matching(self):
+        from api.cache import etag_matches, make_etag
+        etag = make_etag(b"[]")
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
+
+
+@pytest.fixture
+def cached_client(monkeypatch):
+    """DB 없이 응답 캐시 경로만 검사하도록 data_version / 조회 함수를 교체"""
+    from fastapi.testclient import TestClient
+    import api.main as api_main
+    from api.cache import ResponseCache
+
+    state = {"version": 1, "loads": 0}
+
+    async def fake_load(ticker, limit, after=None):
+        state["loads"] += 1
+        items = [{"ticker": ticker, "date": "2026-01-02", "open": 1.0, "close": 2.0, "volume": 10,
+                  "price_change": 1.0, "price_change_pct": 100.0, "direction": "up"}][:limit]
+        return {"items": items, "next_cursor": None}
+
+    monkeypatch.setattr(api_main, "response_cache", ResponseCache(lambda: state["version"], version_check_sec=0))
+    monkeypatch.setattr(api_main, "_load_prices", fake_load)
+    return TestClient(api_main.app), state
+
+
+class TestCachedEndpoints:
+    def test_second_request_served_from_cache_with_304(self, cached_client):
+        client, state = cached_client
+        first = client.get("/stocks/TSLA/prices?limit=5")
+        assert first.status_code == 200
+        assert first.json()["items"][0]["close"] == 2.0
+        etag = first.headers["etag"]
+
+        again = client.get("/stocks/TSLA/prices", params={"limit": 5}, headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert state["loads"] == 1
+
+    def test_version_bump_reloads(self, cached_client):
+        client, state = cached_client
+        etag = client.get("/stocks/TSLA/prices").headers["etag"]
+        state["version"] = 2
+        resp = client.get("/stocks/TSLA/prices", headers={"If-None-Match": etag})
+        assert resp.status_code == 304          # 내용이 같으면 ETag 도 같음
+        assert state["loads"] == 2
+
+    def test_cache_stats_endpoint(self, cached_client):
+        client, _ = cached_client
+        client.get("/stocks/TSLA/prices")
+        client.get("/stocks/TSLA/prices")
+        stats = client.get("/cache/stats").json()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+class TestMetricsEndpoint:
+    def test_route_histograms_and_pool_stats(self, monkeypatch):
+        """/metrics 가 경로 템플릿별 지연 히스토그램, 상태 코드별 응답 수, DB 풀 상태를 노출하는지 확인"""
+        from fastapi.testclient import TestClient
+        from api import main, metrics
+        monkeypatch.setattr(metrics, "pool_stats", lambda: {"size": 5, "checked_out": 2, "checked_in": 3, "overflow": -3})
+        client = TestClient(main.app)
+        client.get("/health")
+        client.get("/stocks/NOPE/prices")       # 지원하지 않는 ticker → 400
+        client.get("/no-such-route")            # 라우트 없음 → 404
+
+        resp = client.get("/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = resp.text
+        assert 'stockmind_http_request_duration_seconds_count{method="GET",route="/health"}' in text
+        assert 'stockmind_http_requests_total{method="GET",route="/stocks/{ticker}/prices",status="400"}' in text
+        assert 'stockmind_http_requests_total{method="GET",route="unmatched",status="404"}' in text
+        assert "/stocks/NOPE" not in text
+        assert 'stockmind_db_pool_connections{state="checked_out"} 2' in text
+        assert 'stockmind_db_pool_connections{state="overflow"} -3' in text
+
+
+class TestAsyncSession:
+    def test_async_url_uses_asyncpg(self):
+        """API 는 DATABASE_URL 과 같은 DB 를 asyncpg 드라이버로 접속하는지 확인"""
+        from db.async_session import to_async_url
+        assert to_async_url("postgresql://u:p@db:5432/x") == "postgresql+asyncpg://u:p@db:5432/x"
+        assert to_async_url("postgresql+psycopg2://u:p@db/x") == "postgresql+asyncpg://u:p@db/x"
+        assert to_async_url("postgresql+asyncpg://u:p@db/x") == "postgresql+asyncpg://u:p@db/x"
+        assert to_async_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+
+    def test_engine_options(self):
+        """풀 크기와 statement_timeout 이 엔진 인자로 전달되는지 확인"""
+        from db.async_session import async_engine_options
+        opts = async_engine_options(pool_size=3, max_overflow=2, statement_timeout_ms=1500)
+        assert (opts["pool_size"], opts["max_overflow"]) == (3, 2)
+        assert opts["connect_args"]["server_settings"]["statement_timeout"] == "1500"
+        assert "connect_args" not in async_engine_options(statement_timeout_ms=0)
+
+    def test_async_version_source(self):
+        """코루틴 함수를 version_source 로 쓰는 비동기 캐시 조회"""
+        import asyncio
+        from api.cache import ResponseCache
+
+        async def version():
+            return 7
+
+        cache = ResponseCache(version_source=version, version_check_sec=0)
+
+        async def run():
+            assert await cache.get_async("k") is None
+            cache.put("k", b"[]", await cache.current_version_async())
+            return await cache.get_async("k")
+
+        assert asyncio.run(run()).body == b"[]"
+        assert cache.stats()["data_version"] == 7
+
+    def test_endpoints_are_async(self):
+        """조회 엔드포인트가 스레드풀이 아닌 이벤트 루프에서 실행되는지 확인"""
+        import inspect
+        import api.main as api_main
+        for fn in (api_main.get_stock_prices, api_main.get_news_articles, api_main.get_daily_summary):
+            assert inspect.iscoroutinefunction(fn)
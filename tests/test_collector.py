@@ -22,6 +22,26 @@ class TestPriceFetcher:
         from collector.price_fetcher import _period_to_days
         assert _period_to_days("invalid") == 7
 
+    def test_period_to_days_year(self):
+        from collector.price_fetcher import _period_to_days
+        assert _period_to_days("1y") == 365
+
+    def test_fetch_price_since_requests_only_missing_range(self, monkeypatch):
+        """since 지정 시 (since - overlap) 부터만 조회하는지 확인"""
+        from datetime import date, datetime, timezone
+        from collector import price_fetcher
+
+        captured = {}
+
+        def fake_get(url, session, ua_rotator, params=None, **kwargs):
+            captured.update(params)
+            raise RuntimeError("offline")
+
+        monkeypatch.setattr(price_fetcher, "http_get", fake_get)
+        assert price_fetcher.fetch_price("TSLA", since=date(2026, 1, 10), overlap_days=3) == []
+        start = datetime.fromtimestamp(captured["period1"], tz=timezone.utc)
+        assert start.date() == date(2026, 1, 7)
+
     def test_fetch_price_returns_list(self):
         """fetch_price가 list를 반환하는지 확인 (실제 API 호출 없이 구조만 확인)"""
         from collector.price_fetcher import fetch_price
@@ -36,3 +56,505 @@ class TestPriceFetcher:
         assert isinstance(result, dict)
         for ticker in TICKERS:
             assert ticker in result
+
+
+def _no_limit():
+    from collector.rate_limiter import HostRateLimiter
+    return HostRateLimiter(initial_rate=0)
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.content = text.encode("utf-8")
+
+
+class TestArticleFetcher:
+    def test_fetch_articles_keeps_order_and_error_contract(self, monkeypatch):
+        """동시 수집에서도 입력 순서가 유지되고 실패 URL은 error 키를 갖는지 확인"""
+        import time
+        import random
+        from collector import article_fetcher
+
+        def fake_get(url, session, ua_rotator, **kwargs):
+            time.sleep(random.uniform(0, 0.05))
+            if url.endswith("bad"):
+                raise ValueError("boom")
+            return _FakeResponse(f"<html><body><article><p>{url}</p></article></body></html>")
+
+        monkeypatch.setattr(article_fetcher, "http_get", fake_get)
+        urls = [f"https://a.example.com/{i}" for i in range(6)] + ["https://b.example.com/bad"]
+        results = article_fetcher.fetch_articles(urls, enable_selenium_fallback=False, limiter=_no_limit())
+
+        assert [r["url"] for r in results] == urls
+        assert results[0]["content"] == urls[0]
+        assert "error" not in results[0]
+        assert results[-1]["error"] == "boom"
+        assert results[-1]["content"] == ""
+
+    def test_iter_articles_bounds_in_flight(self, monkeypatch):
+        """소비 속도와 무관하게 max_in_flight개 이상 미리 요청하지 않는지 확인"""
+        import threading
+        from collector import article_fetcher
+        calls = []
+        lock = threading.Lock()
+
+        def fake_get(url, session, ua_rotator, **kwargs):
+            with lock:
+                calls.append(url)
+            return _FakeResponse(f"<html><body><article><p>{url}</p></article></body></html>")
+
+        monkeypatch.setattr(article_fetcher, "http_get", fake_get)
+        urls = [f"https://a.example.com/{i}" for i in range(50)]
+        it = article_fetcher.iter_articles(
+            iter(urls), enable_selenium_fallback=False, max_workers=2, max_in_flight=4, limiter=_no_limit(),
+        )
+        assert next(it)["content"] == urls[0]
+        assert len(calls) <= 4
+        assert [a["url"] for a in it] == urls[1:]
+
+
+class _StatusResponse:
+    def __init__(self, status_code: int, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class TestRateLimiter:
+    def test_caps_concurrency_per_host(self):
+        import threading
+        import time
+        from collector.rate_limiter import HostRateLimiter
+
+        limiter = HostRateLimiter(initial_rate=0, per_host=2)
+        active = {"a": 0, "max": 0}
+        lock = threading.Lock()
+
+        def work():
+            with limiter.slot("https://a.example.com/x"):
+                with lock:
+                    active["a"] += 1
+                    active["max"] = max(active["max"], active["a"])
+                time.sleep(0.05)
+                with lock:
+                    active["a"] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert active["max"] == 2
+
+    def test_token_bucket_spaces_requests(self):
+        import time
+        from collector.rate_limiter import HostRateLimiter
+
+        limiter = HostRateLimiter(initial_rate=20, burst=1)
+        started = time.monotonic()
+        for _ in range(3):
+            with limiter.slot("https://a.example.com/x"):
+                pass
+        assert time.monotonic() - started >= 0.09
+
+    def test_other_hosts_not_blocked(self):
+        import time
+        from collector.rate_limiter import HostRateLimiter
+
+        limiter = HostRateLimiter(initial_rate=1, burst=1)
+        limiter.feedback("https://slow.example.com/x", 429, "30")
+        started = time.monotonic()
+        with limiter.slot("https://fast.example.com/x"):
+            pass
+        assert time.monotonic() - started < 0.5
+
+    def test_backs_off_on_429_and_recovers(self):
+        """429 → rate 절반 + Retry-After 대기, 정상 응답이 이어지면 다시 가속"""
+        from collector.rate_limiter import HostRateLimiter
+
+        limiter = HostRateLimiter(initial_rate=4, min_rate=0.5, max_rate=8, increase_step=1)
+        url = "https://a.example.com/x"
+        limiter.feedback(url, 429, "0")
+        assert limiter.stats()["a.example.com"] == {"rate": 2.0, "throttled": 1}
+        for _ in range(50):
+            limiter.feedback(url, 200)
+        assert limiter.stats()["a.example.com"]["rate"] == 8
+
+    def test_no_burst_right_after_retry_after(self):
+        """Retry-After 가 끝난 직후 첫 요청도 토큰 간격(1/rate)만큼 더 기다림"""
+        import time
+        from collector.rate_limiter import HostRateLimiter
+
+        limiter = HostRateLimiter(initial_rate=10, burst=1)
+        url = "https://a.example.com/x"
+        started = time.monotonic()
+        limiter.feedback(url, 429, "0.2")  # rate 10 → 5 req/s
+        with limiter.slot(url):
+            pass
+        elapsed = time.monotonic() - started
+        assert 0.2 + 1 / 5 - 0.02 <= elapsed < 0.7, f"{elapsed:.3f}s"
+
+    def test_request_retries_after_retry_after(self):
+        import time
+        from collector.rate_limiter import HostRateLimiter
+
+        limiter = HostRateLimiter(initial_rate=0, max_retries=2)
+        responses = [_StatusResponse(503, {"Retry-After": "0.2"}), _StatusResponse(200)]
+        started = time.monotonic()
+        resp = limiter.request(lambda url, **kw: responses.pop(0), "https://a.example.com/x")
+        assert resp.status_code == 200
+        assert time.monotonic() - started >= 0.2
+
+    def test_parse_retry_after_http_date(self):
+        from collector.rate_limiter import parse_retry_after
+        assert parse_retry_after("120") == 120
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=1445412500.0) == 10.0
+        assert parse_retry_after("soon") is None
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+        self.visited = []
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script):
+        return 0
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestDriverPool:
+    def test_reuses_warm_session(self):
+        """반납된 세션이 다음 acquire에서 재사용되는지 확인"""
+        from collector.driver_pool import DriverPool
+        pool = DriverPool(size=1, max_uses=10, max_memory_mb=0, factory=_FakeDriver)
+        with pool.acquire() as d1:
+            pass
+        with pool.acquire() as d2:
+            pass
+        assert d1 is d2
+        assert pool.created == 1
+        assert d1.visited[-1] == "about:blank"
+        pool.close()
+        assert d1.quit_called
+
+    def test_recycles_after_max_uses(self):
+        from collector.driver_pool import DriverPool
+        pool = DriverPool(size=1, max_uses=2, max_memory_mb=0, factory=_FakeDriver)
+        drivers = []
+        for _ in range(3):
+            with pool.acquire() as d:
+                drivers.append(d)
+        assert drivers[0] is drivers[1]
+        assert drivers[0].quit_called
+        assert drivers[2] is not drivers[0]
+        assert pool.created == 2
+
+    def test_discards_session_on_error(self):
+        from collector.driver_pool import DriverPool
+        pool = DriverPool(size=1, max_uses=10, max_memory_mb=0, factory=_FakeDriver)
+        with pytest.raises(RuntimeError):
+            with pool.acquire() as d:
+                raise RuntimeError("page crashed")
+        assert d.quit_called
+        with pool.acquire() as d2:
+            pass
+        assert d2 is not d
+
+    def test_bounds_concurrent_sessions(self):
+        import threading
+        import time
+        from collector.driver_pool import DriverPool
+        pool = DriverPool(size=2, max_uses=100, max_memory_mb=0, factory=_FakeDriver)
+
+        def work():
+            with pool.acquire():
+                time.sleep(0.05)
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert pool.created == 2
+
+
+class TestUrlCanonicalization:
+    def test_strips_tracking_params_and_fragment(self):
+        from collector.url_utils import canonicalize_url
+        u = "HTTPS://Finance.Yahoo.com/news/tesla-1.html?.tsrc=rss&utm_source=x&guccounter=1#comments"
+        assert canonicalize_url(u) == "https://finance.yahoo.com/news/tesla-1.html"
+
+    def test_keeps_meaningful_params_sorted(self):
+        from collector.url_utils import canonicalize_url
+        u = "https://example.com/a?b=2&ncid=yahoo&a=1"
+        assert canonicalize_url(u) == "https://example.com/a?a=1&b=2"
+
+    def test_hash_matches_for_tracking_variants(self):
+        from collector.url_utils import url_hash
+        a = url_hash("https://finance.yahoo.com/news/x.html")
+        b = url_hash("https://finance.yahoo.com/news/x.html?utm_medium=social")
+        assert a == b and len(a) == 40
+
+
+class TestYahooLinkSelection:
+    def _blocks(self, hrefs):
+        from bs4 import BeautifulSoup
+        html = "".join(f"<section data-testid='storyitem'><a href='{h}'>x</a></section>" for h in hrefs)
+        return BeautifulSoup(html, "html.parser").select("section")
+
+    def test_url_filter_applied_before_limit(self):
+        """url_filter로 기존 URL을 걸러낸 뒤 max_articles만큼 채우는지 확인"""
+        from collector.yahoo_scraper import _select_links
+        blocks = self._blocks([f"/news/{i}.html?.tsrc=fin-srch" for i in range(5)])
+        known = {"https://finance.yahoo.com/news/0.html", "https://finance.yahoo.com/news/1.html"}
+        links = _select_links(blocks, set(), lambda urls: [u for u in urls if u not in known], 2)
+        assert links == ["https://finance.yahoo.com/news/2.html", "https://finance.yahoo.com/news/3.html"]
+
+    def test_stop_urls_and_non_news_links_skipped(self):
+        from collector.yahoo_scraper import _select_links
+        blocks = self._blocks(["/news/a.html", "/video/b.html", "/news/a.html?utm_source=x", "/news/c.html"])
+        links = _select_links(blocks, {"https://finance.yahoo.com/news/c.html"}, None, 10)
+        assert links == ["https://finance.yahoo.com/news/a.html"]
+
+
+class _CacheResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers: dict = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+        self.apparent_encoding = "utf-8"
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding)
+
+
+class TestPageCache:
+    def test_roundtrip_and_content_addressing(self, tmp_path):
+        """같은 본문은 키가 달라도 gzip 파일 하나로 저장되는지 확인"""
+        from collector.page_cache import PageCache
+        cache = PageCache(root=str(tmp_path))
+        body = ("<html>" + "x" * 5000 + "</html>").encode()
+        cache.put("https://a.example.com/1", body, etag='"v1"')
+        cache.put("https://a.example.com/1?dup", body)
+
+        page = cache.get("https://a.example.com/1")
+        assert page.body == body and page.etag == '"v1"'
+        stats = cache.stats()
+        assert stats["pages"] == 2 and stats["blobs"] == 1
+        assert stats["bytes"] < len(body)
+        assert cache.get("https://a.example.com/missing") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        import os
+        from collector.page_cache import PageCache
+        cache = PageCache(root=str(tmp_path), max_bytes=2500)
+        for i in range(3):
+            cache.put(f"k{i}", os.urandom(1000))
+        # k0 이 가장 오래 접근되지 않음 → 삭제 대상
+        assert cache.get("k0") is None
+        assert cache.get("k2") is not None
+        assert cache.stats()["bytes"] <= 2500
+
+    def test_revalidates_with_etag(self, tmp_path):
+        """재요청 시 If-None-Match 를 보내고 304 면 캐시 본문을 돌려주는지 확인"""
+        from collector.page_cache import PageCache, cached_get
+        cache = PageCache(root=str(tmp_path))
+        sent = []
+
+        def fake_get(url, headers=None, **kwargs):
+            sent.append(headers)
+            if headers.get("If-None-Match") == '"v1"':
+                return _CacheResponse(304)
+            return _CacheResponse(200, b"<p>hello</p>", {"ETag": '"v1"'})
+
+        first = cached_get(fake_get, "https://a.example.com/x", cache=cache, max_age=0)
+        second = cached_get(fake_get, "https://a.example.com/x", cache=cache, max_age=0)
+        assert first.from_cache is False
+        assert second.from_cache is True and second.text == "<p>hello</p>"
+        assert sent[1]["If-None-Match"] == '"v1"'
+
+    def test_fresh_entry_skips_network(self, tmp_path):
+        from collector.page_cache import PageCache, cached_get
+        cache = PageCache(root=str(tmp_path))
+        cache.put("https://a.example.com/x", b"cached")
+
+        def fail_get(url, **kwargs):
+            raise AssertionError("네트워크 요청이 발생하면 안 됨")
+
+        assert cached_get(fail_get, "https://a.example.com/x", cache=cache, max_age=60).text == "cached"
+
+    def test_offline_mode_uses_cache_only(self, tmp_path):
+        """오프라인 모드: 캐시된 페이지로 기사 재구성, 없는 URL은 error"""
+        from collector.page_cache import PageCache
+        from collector.article_fetcher import fetch_articles
+        cache = PageCache(root=str(tmp_path))
+        cached_url = "https://a.example.com/cached"
+        cache.put(cached_url, b"<html><body><article><p>from cache</p></article></body></html>")
+
+        results = fetch_articles(
+            [cached_url, "https://a.example.com/missing"],
+            enable_selenium_fallback=False, cache=cache, offline=True,
+        )
+        assert results[0]["content"] == "from cache"
+        assert "오프라인 캐시 없음" in results[1]["error"]
+
+
+@pytest.fixture
+def rss_server():
+    """Yahoo 헤드라인 RSS 를 흉내 내는 로컬 HTTP 서버. state["items"] 로 ticker별 링크 수 조정"""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlsplit
+
+    state = {"items": 20, "requests": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            ticker = parse_qs(urlsplit(self.path).query)["s"][0]
+            state["requests"].append(ticker)
+            items = "".join(
+                f"<item><title>{ticker} {i}</title>"
+                f"<link>https://finance.yahoo.com/news/{ticker.lower()}-{i}.html?.tsrc=rss</link></item>"
+                for i in range(state["items"])
+            )
+            body = f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{server.server_port}/rss/2.0/headline?s={{ticker}}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+class _FakeSeleniumSource:
+    name = "selenium"
+
+    def __init__(self, links):
+        self.links = links
+        self.calls = 0
+
+    def candidates(self, ticker, max_scroll=0, **hints):
+        self.calls += 1
+        return self.links
+
+
+class TestLinkSources:
+    def test_rss_fast_path_skips_browser(self, rss_server, monkeypatch):
+        """RSS 후보가 충분하면 Selenium 소스를 호출하지 않는지 확인"""
+        from collector import link_sources
+        monkeypatch.setattr(link_sources, "get_page_cache", lambda: None)
+        selenium = _FakeSeleniumSource(["/news/slow.html"])
+        sources = [link_sources.RssLinkSource(rss_server["url"], offline=False), selenium]
+
+        known = {"https://finance.yahoo.com/news/tsla-0.html"}
+        links = link_sources.discover_links(
+            "TSLA", max_articles=5, sources=sources, min_candidates=10,
+            stop_urls={"https://finance.yahoo.com/news/tsla-1.html?utm_source=x"},
+            url_filter=lambda urls: [u for u in urls if u not in known],
+        )
+        assert rss_server["requests"] == ["TSLA"]
+        assert selenium.calls == 0
+        assert links == [f"https://finance.yahoo.com/news/tsla-{i}.html" for i in range(2, 7)]
+
+    def test_falls_back_to_selenium_when_feed_is_thin(self, rss_server, monkeypatch):
+        from collector import link_sources
+        monkeypatch.setattr(link_sources, "get_page_cache", lambda: None)
+        rss_server["items"] = 2
+        selenium = _FakeSeleniumSource(["/news/tsla-1.html", "/news/extra.html"])
+        sources = [link_sources.RssLinkSource(rss_server["url"], offline=False), selenium]
+
+        links = link_sources.discover_links("TSLA", max_articles=30, sources=sources, min_candidates=10)
+        assert selenium.calls == 1
+        assert links == [
+            "https://finance.yahoo.com/news/tsla-0.html",
+            "https://finance.yahoo.com/news/tsla-1.html",
+            "https://finance.yahoo.com/news/extra.html",
+        ]
+
+    def test_failing_source_is_skipped(self):
+        from collector import link_sources
+
+        class Broken:
+            name = "rss"
+
+            def candidates(self, ticker, max_scroll=0, **hints):
+                raise ConnectionError("down")
+
+        selenium = _FakeSeleniumSource(["/news/a.html"])
+        assert link_sources.discover_links("TSLA", sources=[Broken(), selenium]) == [
+            "https://finance.yahoo.com/news/a.html"
+        ]
+
+    def test_unknown_source_name_rejected(self):
+        from collector.link_sources import build_sources
+        with pytest.raises(ValueError):
+            build_sources("rss,carrier-pigeon")
+
+
+class _ScrollingDriver:
+    """스크롤할 때마다 기사 5개가 더 로드되는 목록 페이지 흉내"""
+
+    def __init__(self, per_round: int = 5, total: int = 100):
+        self.per_round = per_round
+        self.total = total
+        self.loaded = per_round
+        self.scrolls = 0
+
+    def execute_script(self, script, *args):
+        if "scrollTo" in script:
+            self.scrolls += 1
+            self.loaded = min(self.total, self.loaded + self.per_round)
+            return None
+        if "scrollHeight" in script:
+            return self.loaded * 100
+        return [f"/news/story-{i}.html" for i in range(self.loaded)]
+
+
+class TestScrollHarvest:
+    def _scroll(self, driver, harvester, max_round=10):
+        from collector.yahoo_scraper import _scroll_until_stable
+        return _scroll_until_stable(driver, max_round, pause=0, stable_need=2, on_round=lambda: harvester.read(driver))
+
+    def test_stops_when_enough_new_links(self):
+        from collector.yahoo_scraper import _LinkHarvester
+        driver = _ScrollingDriver()
+        harvester = _LinkHarvester(set(), None, max_articles=8, known_run=5)
+        assert self._scroll(driver, harvester) == 1
+        assert harvester.new_links == 10
+
+    def test_stops_at_run_of_known_links(self):
+        """이전 실행에서 저장한 구간(연속된 기존 URL)에 도달하면 스크롤 중단"""
+        from collector.yahoo_scraper import _LinkHarvester
+        known = {f"https://finance.yahoo.com/news/story-{i}.html" for i in range(7, 100)}
+        driver = _ScrollingDriver()
+        harvester = _LinkHarvester(set(), lambda urls: [u for u in urls if u not in known], 30, known_run=5)
+        assert self._scroll(driver, harvester) == 2
+        assert harvester.new_links == 7
+        assert driver.scrolls == 2
+
+    def test_without_hints_scrolls_until_stable(self):
+        from collector.yahoo_scraper import _LinkHarvester
+        driver = _ScrollingDriver(total=15)
+        harvester = _LinkHarvester(set(), None, None, known_run=5)
+        # 15개 로드 후 높이 고정 → stable 2회 확인까지 스크롤
+        assert self._scroll(driver, harvester) == 4
+        assert harvester.reason is None
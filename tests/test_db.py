@@ -56,3 +56,289 @@ class TestWriter:
         from db.writer import insert_articles
         result = insert_articles("TSLA", [])
         assert result == 0
+
+    def test_price_upsert_skips_unchanged_rows(self):
+        """변경되지 않은 행은 UPDATE 하지 않도록 WHERE 조건이 붙는지 확인"""
+        from sqlalchemy.dialects import postgresql
+        from db.writer import _price_upsert_stmt
+        row = {
+            "ticker": "TSLA", "date": "2026-01-01", "open": 1.0, "close": 2.0, "volume": 10,
+            "price_change": 1.0, "price_change_pct": 100.0, "direction": "up",
+        }
+        sql = str(_price_upsert_stmt([row]).compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (ticker, date) DO UPDATE" in sql
+        assert "stock_prices.close IS DISTINCT FROM excluded.close" in sql
+
+    def test_insert_stream_commits_in_batches(self, monkeypatch):
+        """스트림을 batch_size 행마다 나눠 저장하고, 실패 항목은 건너뛰는지 확인"""
+        from db import writer
+        batches = []
+        monkeypatch.setattr(writer, "_insert_article_rows", lambda rows: batches.append(len(rows)) or len(rows))
+
+        def stream():
+            for i in range(7):
+                yield {"url": f"https://finance.yahoo.com/news/{i}", "date": "2026-01-01", "title": "t"}
+            yield {"url": "https://finance.yahoo.com/news/bad", "date": "2026-01-01", "error": "boom"}
+
+        assert writer.insert_articles_stream("TSLA", stream(), batch_size=3) == 7
+        assert batches == [3, 3, 1]
+
+
+class TestBulkCopy:
+    def test_copy_value_escapes(self):
+        """COPY text 포맷 특수문자 / NULL / 날짜 변환"""
+        from datetime import date
+        from db.bulk_copy import copy_value
+        assert copy_value(None) == "\\N"
+        assert copy_value("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+        assert copy_value(date(2026, 1, 2)) == "2026-01-02"
+        assert copy_value("") == ""
+        assert copy_value(0.25) == "0.25"
+
+    def test_copy_buffer_column_order(self):
+        from db.bulk_copy import copy_buffer
+        buf = copy_buffer([{"b": 2, "a": "x"}, {"a": None, "b": 3}], ["a", "b"])
+        assert buf.read() == "x\t2\n\\N\t3\n"
+
+    def test_copy_statements_keep_conflict_rules(self):
+        """COPY 경로도 다중 VALUES 경로와 같은 ON CONFLICT 규칙을 쓰는지 확인"""
+        from sqlalchemy.dialects import postgresql
+        from db.bulk_copy import staging_table
+        from db.writer import ARTICLE_COLUMNS, _price_copy_upsert_stmt, _insert_with_rollup_stmt
+        price_sql = str(_price_copy_upsert_stmt("_stage").compile(dialect=postgresql.dialect()))
+        assert "FROM _stage ON CONFLICT (ticker, date) DO UPDATE" in price_sql
+        assert "stock_prices.close IS DISTINCT FROM excluded.close" in price_sql
+        article_stmt = _insert_with_rollup_stmt(staging_table("_stage", ARTICLE_COLUMNS))
+        article_sql = str(article_stmt.compile(dialect=postgresql.dialect()))
+        assert "FROM _stage ON CONFLICT (url_hash) DO NOTHING" in article_sql
+        assert "FROM _stage JOIN reg ON reg.url_hash = _stage.url_hash" in article_sql
+
+    def test_large_batch_uses_copy_in_chunks(self, monkeypatch):
+        """BULK_COPY_MIN_ROWS 이상이면 청크마다 COPY + INSERT..SELECT, 삽입 건수는 청크 합계"""
+        from contextlib import contextmanager
+        from types import SimpleNamespace
+        from db import writer
+
+        copied, executed = [], []
+
+        class FakeSession:
+            def execute(self, stmt):
+                executed.append(stmt)
+                return SimpleNamespace(scalar=lambda: len(copied[-1]) - 1)
+
+        @contextmanager
+        def fake_session():
+            yield FakeSession()
+
+        monkeypatch.setattr(writer, "BULK_COPY_MIN_ROWS", 5)
+        monkeypatch.setattr(writer, "BULK_COPY_CHUNK_ROWS", 4)
+        monkeypatch.setattr(writer, "get_session", fake_session)
+        monkeypatch.setattr(writer, "bump_data_version", lambda session: None)
+        monkeypatch.setattr(writer, "copy_to_staging", lambda session, target, name, cols, rows: copied.append(rows))
+
+        rows = [{"url": f"https://finance.yahoo.com/news/{i}", "url_hash": str(i)} for i in range(10)]
+        rows.append(dict(rows[0]))      # 같은 배치 안 중복 URL 은 COPY 전에 제거
+        assert writer._insert_article_rows(rows) == 3 + 3 + 1
+        assert [len(c) for c in copied] == [4, 4, 2]
+        assert all("INSERT INTO news_article_urls" in str(s) for s in executed)
+        assert all("INSERT INTO news_articles" in str(s) for s in executed)
+
+
+class TestDailySentimentRollup:
+    def _sql(self, stmt) -> str:
+        from sqlalchemy.dialects import postgresql
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    def test_insert_updates_rollup_in_same_statement(self):
+        """URL 등록, 기사 INSERT, 롤업 누적 갱신이 한 문장(같은 트랜잭션)으로 묶이는지 확인"""
+        import datetime as dt
+        from db.writer import ARTICLE_COLUMNS, _article_values, _insert_with_rollup_stmt
+        row = dict.fromkeys(ARTICLE_COLUMNS, None) | {"ticker": "TSLA", "date": dt.date(2026, 1, 2), "url_hash": "h"}
+        sql = self._sql(_insert_with_rollup_stmt(_article_values([row])))
+        assert sql.startswith("WITH src AS")
+        assert "CAST(src_values.sentiment_score AS FLOAT)" in sql
+        assert "ON CONFLICT (url_hash) DO NOTHING RETURNING news_article_urls.url_hash" in sql
+        assert "FROM src JOIN reg ON reg.url_hash = src.url_hash RETURNING" in sql
+        assert "FROM ins GROUP BY ins.ticker, ins.date" in sql
+        assert "article_count = (daily_sentiment.article_count + excluded.article_count)" in sql
+        assert "min_score = least(daily_sentiment.min_score, excluded.min_score)" in sql
+        assert "SELECT coalesce(sum(agg.article_count)" in sql
+
+    def test_rescore_recomputes_affected_days(self):
+        """감정 갱신 시 해당 기사들의 (ticker, date) 만 다시 집계해 덮어쓰는지 확인"""
+        from db.models import NewsArticle
+        from db.writer import _recompute_rollup_stmt
+        sql = self._sql(_recompute_rollup_stmt(NewsArticle.ticker == "TSLA"))
+        assert "FROM news_articles" in sql
+        assert "GROUP BY news_articles.ticker, news_articles.date" in sql
+        assert "article_count = excluded.article_count" in sql
+
+    def test_rescore_update_uses_partition_key(self, monkeypatch):
+        """감정 갱신은 id 와 함께 파티션 키(date)로 행을 찾고, 롤업 재계산도 해당 날짜로 좁히는지 확인"""
+        import datetime as dt
+        from contextlib import contextmanager
+        from types import SimpleNamespace
+        from db import writer
+
+        updates, executed = [], []
+        fake = SimpleNamespace(
+            connection=lambda: SimpleNamespace(execute=lambda stmt, params: updates.append((str(stmt), params))),
+            execute=lambda stmt: executed.append(self._sql(stmt)),
+        )
+
+        @contextmanager
+        def fake_session():
+            yield fake
+
+        monkeypatch.setattr(writer, "get_session", fake_session)
+        monkeypatch.setattr(writer, "bump_data_version", lambda session: None)
+        rows = [{"id": 7, "date": dt.date(2026, 1, 2), "sentiment_label": "positive", "sentiment_score": 0.5}]
+        assert writer.update_article_sentiments(rows) == 1
+        assert "news_articles.date = :_date" in updates[0][0]
+        assert updates[0][1][0]["_date"] == dt.date(2026, 1, 2)
+        assert "news_articles.date IN" in executed[0]
+
+    def test_rebuild_keeps_rollup_of_dropped_partitions(self):
+        """재구성은 남아 있는 기사의 가장 이른 날짜 이후 롤업만 지워, 삭제한 파티션 달의 요약을 보존하는지 확인"""
+        from db.writer import _clear_rollup_stmt
+        sql = self._sql(_clear_rollup_stmt())
+        assert sql.startswith("DELETE FROM daily_sentiment WHERE daily_sentiment.date >= coalesce((SELECT min(news_articles.date)")
+        assert "WHERE news_articles.ticker = daily_sentiment.ticker)" in sql     # 티커별 최소 날짜
+        assert "CAST(%(param_1)s AS DATE))" in sql                              # 기사가 없으면 infinity → 삭제 없음
+        sql = self._sql(_clear_rollup_stmt("TSLA"))
+        assert "WHERE news_articles.ticker = %(ticker_1)s)" in sql
+        assert "daily_sentiment.ticker = %(ticker_2)s" in sql
+
+    def test_mean_score(self):
+        from db.models import DailySentiment
+        assert DailySentiment(score_sum=1.5, score_count=3).mean_score == 0.5
+        assert DailySentiment(score_sum=0.0, score_count=0).mean_score is None
+
+
+def _explain(stmt) -> str:
+    """seq scan 을 끈 상태의 EXPLAIN 결과 (작은 테스트 테이블에서도 인덱스 사용 가능 여부 확인용)"""
+    from sqlalchemy import text
+    from sqlalchemy.dialects import postgresql
+    from db.writer import engine
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    with engine.begin() as conn:
+        conn.execute(text("SET LOCAL enable_seqscan = off"))
+        rows = conn.execute(text(f"EXPLAIN {sql}")).scalars().all()
+    return "\n".join(rows)
+
+
+# 파티션마다 붙는 인덱스 이름: ix_news_articles_<YYYY_MM | default>_<접미사>
+def _partition_index(suffix: str) -> str:
+    return rf"ix_news_articles_(\d{{4}}_\d{{2}}|default)_{suffix}\b"
+
+
+class TestIndexes:
+    """주요 조회 쿼리가 복합 인덱스를 실제로 사용하는지 EXPLAIN 으로 확인"""
+
+    @pytest.fixture(autouse=True)
+    def _migrated(self):
+        import datetime as dt
+        from db.writer import init_db, prepare_news_partitions
+        init_db()
+        prepare_news_partitions(dt.date(2026, 1, 1), dt.date(2026, 2, 28))
+
+    def test_news_by_ticker_uses_ticker_date_index(self):
+        import re
+        from api.main import _news_stmt
+        plan = _explain(_news_stmt("TSLA", None, None, 30))
+        assert re.search(_partition_index("ticker_date_id"), plan)
+
+    def test_news_by_sentiment_uses_label_index(self):
+        import re
+        from api.main import _news_stmt
+        plan = _explain(_news_stmt("TSLA", None, "positive", 30))
+        assert re.search(_partition_index("ticker_label_date_id"), plan)
+
+    def test_news_cursor_page_is_index_range_scan(self):
+        """다음 페이지도 인덱스 범위 조건으로 읽고 별도 정렬(Sort)이 없는지 확인"""
+        import re
+        import datetime as dt
+        from api.main import _news_stmt
+        plan = _explain(_news_stmt("TSLA", None, None, 30, (dt.date(2026, 1, 2), 1000)))
+        assert re.search(_partition_index("ticker_date_id"), plan)
+        assert "Sort" not in plan
+
+    def test_news_date_filter_prunes_partitions(self):
+        """날짜 조건이 있는 /news 조회는 그 달 파티션만 읽는지 확인 (DEFAULT / 다른 달 제외)"""
+        import datetime as dt
+        from api.main import _news_stmt
+        plan = _explain(_news_stmt("TSLA", dt.date(2026, 1, 5), None, 30))
+        assert "news_articles_2026_01" in plan
+        assert "news_articles_2026_02" not in plan
+        assert "news_articles_default" not in plan
+
+    def test_news_cursor_page_prunes_later_partitions(self):
+        """커서 이후 페이지는 커서 날짜보다 뒤의 월 파티션을 읽지 않는지 확인"""
+        import datetime as dt
+        from api.main import _news_stmt
+        plan = _explain(_news_stmt("TSLA", None, None, 30, (dt.date(2026, 1, 20), 1000)))
+        assert "news_articles_2026_01" in plan
+        assert "news_articles_2026_02" not in plan
+
+    def test_existing_urls_uses_ticker_index(self):
+        from db.writer import _existing_urls_stmt
+        plan = _explain(_existing_urls_stmt("TSLA"))
+        assert "ix_news_articles_" in plan
+
+    def test_known_url_lookup_uses_registry(self):
+        """URL 중복 확인은 기사 파티션이 아니라 레지스트리 PK 만 조회"""
+        from db.writer import _known_hashes_stmt
+        plan = _explain(_known_hashes_stmt(["0" * 40]))
+        assert "news_article_urls_pkey" in plan
+        assert "news_articles_" not in plan
+
+
+class TestPartitions:
+    def test_month_helpers(self):
+        from datetime import date
+        from db.partitions import add_months, month_range, partition_name, partition_month
+        assert add_months(date(2026, 11, 15), 2) == date(2027, 1, 1)
+        assert add_months(date(2026, 1, 31), -1) == date(2025, 12, 1)
+        assert month_range(date(2025, 12, 20), date(2026, 2, 1)) == [
+            date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1),
+        ]
+        assert partition_name(date(2026, 3, 1)) == "news_articles_2026_03"
+        assert partition_month("news_articles_2026_03") == date(2026, 3, 1)
+        assert partition_month("news_articles_default") is None
+
+    def test_month_partition_moves_default_rows_before_attach(self):
+        """새 월 파티션은 DEFAULT 의 그 달 행을 옮기고 지운 뒤, 인덱스를 만들고 마지막에 ATTACH"""
+        from datetime import date
+        from db.partitions import partition_ddl
+        stmts = partition_ddl(date(2026, 12, 1))
+        assert stmts[0] == "CREATE TABLE news_articles_2026_12 (LIKE news_articles INCLUDING DEFAULTS)"
+        assert stmts[1].startswith("INSERT INTO news_articles_2026_12 SELECT * FROM news_articles_default")
+        assert stmts[2].startswith("DELETE FROM news_articles_default")
+        assert "date >= '2026-12-01' AND date < '2027-01-01'" in stmts[2]
+        assert "CREATE INDEX ix_news_articles_2026_12_ticker_date_id" in " ".join(stmts)
+        assert stmts[-1] == (
+            "ALTER TABLE news_articles ATTACH PARTITION news_articles_2026_12 "
+            "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')"
+        )
+
+    def test_default_partition_ddl(self):
+        from db.partitions import partition_ddl
+        stmts = partition_ddl(None)
+        assert not any("INSERT" in s or "DELETE" in s for s in stmts)
+        assert stmts[-1] == "ALTER TABLE news_articles ATTACH PARTITION news_articles_default DEFAULT"
+
+    def test_partition_indexes_match_model(self):
+        """파티션 인덱스 정의가 모델의 부모 인덱스와 같은지 (다르면 ATTACH 시 인덱스가 새로 만들어짐)"""
+        from db.models import NewsArticle
+        from db.partitions import PARTITION_INDEXES
+        parent = {ix.name for ix in NewsArticle.__table__.indexes}
+        assert {f"ix_news_articles_{suffix}" for suffix, _ in PARTITION_INDEXES} == parent
+
+    def test_model_is_partitioned_by_date(self):
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateTable
+        from db.models import NewsArticle
+        ddl = str(CreateTable(NewsArticle.__table__).compile(dialect=postgresql.dialect()))
+        assert "PRIMARY KEY (id, date)" in ddl
+        assert "PARTITION BY RANGE (date)" in ddl
+        assert "UNIQUE" not in ddl
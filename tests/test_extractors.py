@@ -0,0 +1,80 @@
+import pytest
+import sys
+import os
+import glob
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# fixtures/pages 는 Yahoo Finance 기사 레이아웃을 본떠 손으로 작성한 페이지다 (실제 캡처본 아님).
+# malformed/ 는 html.parser 와 libxml2 의 트리가 갈라지는 비정형 마크업 모음.
+_PAGES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "pages")
+PAGES = sorted(glob.glob(os.path.join(_PAGES_DIR, "*.html")))
+MALFORMED = sorted(glob.glob(os.path.join(_PAGES_DIR, "malformed", "*.html")))
+
+
+def _read(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+class TestExtractorParity:
+    @pytest.mark.parametrize("path", PAGES, ids=os.path.basename)
+    def test_lxml_matches_bs4(self, path):
+        """fixture 페이지에서 lxml 단일 순회 결과가 기존 bs4 결과와 동일한지 확인"""
+        from collector.extractors import extract_bs4, extract_lxml
+        html = _read(path)
+        assert extract_lxml(html) == extract_bs4(html)
+
+    def test_fixture_pages_are_not_trivial(self):
+        from collector.extractors import extract_bs4
+        results = [extract_bs4(_read(p)) for p in PAGES]
+        assert len(results) >= 5
+        assert all(r["title"] for r in results)
+        assert all(r["content"] for r in results)
+
+    @pytest.mark.parametrize("path", MALFORMED, ids=os.path.basename)
+    def test_malformed_markup_matches_bs4(self, path):
+        """비정형 마크업에서도 extract_article(lxml) 결과가 bs4 와 동일한지 확인"""
+        from collector.extractors import extract_article, extract_bs4
+        html = _read(path)
+        assert extract_article(html, engine="lxml") == extract_bs4(html)
+
+    @pytest.mark.parametrize("name", [
+        "div_inside_p.html",
+        "nested_p.html",
+        "cdata_section.html",
+        "entity_without_semicolon.html",
+    ])
+    def test_divergent_markup_is_detected(self, name):
+        """libxml2 가 다르게 해석하는 구조는 MarkupDivergence 로 거부"""
+        from collector.extractors import MarkupDivergence, extract_lxml
+        with pytest.raises(MarkupDivergence):
+            extract_lxml(_read(os.path.join(_PAGES_DIR, "malformed", name)))
+
+    def test_template_text_excluded(self):
+        """<template> 안의 문단은 bs4 와 마찬가지로 본문에서 제외"""
+        from collector.extractors import extract_lxml
+        html = _read(os.path.join(_PAGES_DIR, "malformed", "template_in_body.html"))
+        result = extract_lxml(html)
+        assert "hidden template" not in result["content"]
+        assert result["content"].startswith("Microsoft said")
+
+
+class TestExtractArticle:
+    def test_falls_back_to_bs4_when_lxml_fails(self):
+        """lxml 이 처리하지 못하는 입력(인코딩 선언이 있는 str)은 bs4 로 폴백"""
+        from collector.extractors import extract_article, extract_lxml
+        html = '<?xml version="1.0" encoding="utf-8"?><html><body><article><p>hello</p></article></body></html>'
+        with pytest.raises(Exception):
+            extract_lxml(html)
+        assert extract_article(html, engine="lxml")["content"] == "hello"
+
+    def test_empty_document(self):
+        from collector.extractors import extract_article
+        result = extract_article("", engine="lxml")
+        assert result["title"] == "" and result["content"] == ""
+
+    def test_date_converted_to_kst(self):
+        from collector.extractors import extract_article
+        html = '<html><body><time datetime="2026-01-01T16:00:00Z">x</time></body></html>'
+        assert extract_article(html)["date"] == "2026-01-02"
@@ -0,0 +1,265 @@
+import pytest
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+@pytest.fixture
+def stub_stages(monkeypatch):
+    """run_pipeline의 외부 의존 단계(네트워크/DB/Selenium)를 가짜로 교체"""
+    import main
+
+    state = {"active": 0, "max_active": 0}
+    lock = threading.Lock()
+
+    def fake_links(ticker, **kwargs):
+        with lock:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        time.sleep(0.2)
+        with lock:
+            state["active"] -= 1
+        if ticker == "BROKEN":
+            raise RuntimeError("boom")
+        return [f"https://finance.yahoo.com/news/{ticker}-1.html"]
+
+    monkeypatch.setattr(main, "init_db", lambda: None)
+    monkeypatch.setattr(main, "fetch_price", lambda t, **kwargs: [])
+    monkeypatch.setattr(main, "get_latest_price_date", lambda t: None)
+    monkeypatch.setattr(main, "filter_new_urls", lambda urls: list(urls))
+    monkeypatch.setattr(main, "discover_links", fake_links)
+    monkeypatch.setattr(main, "iter_articles", lambda links: ({"url": u} for u in links))
+    monkeypatch.setattr(main, "iter_analyzed", lambda arts: arts)
+    monkeypatch.setattr(main, "insert_articles_stream", lambda t, arts: sum(1 for _ in arts))
+    monkeypatch.setattr(main, "METRICS_TEXTFILE", "")
+    return state
+
+
+class TestRunPipeline:
+    def test_tickers_run_concurrently(self, stub_stages):
+        """workers 수만큼 ticker가 동시에 처리되는지 확인"""
+        from main import run_pipeline
+        results = run_pipeline(["A", "B", "C"], workers=3)
+        assert stub_stages["max_active"] == 3
+        assert sorted(r["ticker"] for r in results) == ["A", "B", "C"]
+        assert all(r["inserted"] == 1 for r in results)
+
+    def test_single_worker_is_serial(self, stub_stages):
+        from main import run_pipeline
+        run_pipeline(["A", "B"], workers=1)
+        assert stub_stages["max_active"] == 1
+
+    def test_failure_is_isolated(self, stub_stages):
+        """한 ticker 실패가 다른 ticker 처리에 영향을 주지 않는지 확인"""
+        from main import run_pipeline
+        results = {r["ticker"]: r for r in run_pipeline(["A", "BROKEN"], workers=2)}
+        assert "error" in results["BROKEN"]
+        assert results["A"]["inserted"] == 1
+        # 실패한 ticker 가 쓴 시간(링크 수집 0.2s)도 ticker 합계에 들어가야 함
+        assert results["BROKEN"]["elapsed"] >= 0.2
+
+
+class _FakeLinkSource:
+    """호출 시 받은 max_scroll 을 기록하는 링크 소스"""
+
+    def __init__(self, name, links=(), error=None):
+        self.name = name
+        self.links = list(links)
+        self.error = error
+        self.calls = []
+
+    def candidates(self, ticker, max_scroll=0, **hints):
+        self.calls.append(max_scroll)
+        if self.error:
+            raise self.error
+        return self.links
+
+
+@pytest.fixture
+def stub_backfill(monkeypatch):
+    """backfill 의 네트워크/DB 단계를 가짜로 교체. 완료 기록은 메모리 dict 에 저장"""
+    import backfill
+
+    state = {"checkpoints": {}, "fetched": [], "fail": set()}
+
+    def fake_fetch(ticker, start, end, interval=None):
+        state["fetched"].append((start, end))
+        if (start, end) in state["fail"]:
+            raise RuntimeError("503")
+        return [{"ticker": ticker, "date": start.isoformat()}]
+
+    def fake_record(ticker, kind, start, end, rows):
+        state["checkpoints"][(ticker, kind, start, end)] = rows
+
+    def fake_completed(ticker, kind):
+        return {(s, e) for (t, k, s, e) in state["checkpoints"] if (t, k) == (ticker, kind)}
+
+    monkeypatch.setattr(backfill, "fetch_price_range", fake_fetch)
+    monkeypatch.setattr(backfill, "upsert_stock_prices", lambda rows, bulk=None: len(rows))
+    monkeypatch.setattr(backfill, "record_checkpoint", fake_record)
+    monkeypatch.setattr(backfill, "get_completed_chunks", fake_completed)
+    return state
+
+
+class TestBackfill:
+    def test_split_range(self):
+        from datetime import date
+        from backfill import split_range
+        chunks = split_range(date(2026, 1, 1), date(2026, 1, 10), chunk_days=4)
+        assert chunks == [
+            (date(2026, 1, 1), date(2026, 1, 4)),
+            (date(2026, 1, 5), date(2026, 1, 8)),
+            (date(2026, 1, 9), date(2026, 1, 10)),
+        ]
+        assert split_range(date(2026, 1, 2), date(2026, 1, 1)) == []
+
+    def test_resume_skips_completed_and_retries_failed(self, stub_backfill):
+        """중단 후 재실행 시 완료된 구간은 건너뛰고, 실패한 구간만 다시 조회하는지 확인"""
+        from datetime import date
+        from backfill import backfill_prices, split_range
+        start, end = date(2026, 1, 1), date(2026, 1, 20)
+        chunks = split_range(start, end, 5)
+        stub_backfill["fail"] = {chunks[2]}
+
+        first = backfill_prices("TSLA", start, end, chunk_days=5, workers=2)
+        assert (first["rows"], first["failed"]) == (3, 1)
+        assert chunks[2] not in {(s, e) for (_, _, s, e) in stub_backfill["checkpoints"]}
+
+        stub_backfill["fail"] = set()
+        stub_backfill["fetched"].clear()
+        second = backfill_prices("TSLA", start, end, chunk_days=5, workers=2)
+        assert stub_backfill["fetched"] == [chunks[2]]
+        assert (second["skipped"], second["rows"], second["failed"]) == (3, 1, 0)
+
+    def test_news_keeps_only_articles_in_range(self):
+        from datetime import date
+        from backfill import _in_range
+        articles = [
+            {"url": "a", "date": "2025-12-31"},
+            {"url": "b", "date": "2026-01-05"},
+            {"url": "c", "date": "2026-01-06", "error": "timeout"},
+        ]
+        counter = {"dropped": 0, "failed": 0}
+        kept = list(_in_range(articles, date(2026, 1, 1), date(2026, 1, 31), counter))
+        assert [a["url"] for a in kept] == ["b"]
+        assert counter == {"dropped": 1, "failed": 1}
+
+    def _stub_news(self, monkeypatch, rss, selenium, articles=lambda links: []):
+        """링크 소스 / 기사 수집 / 저장을 가짜로 교체 (discover_links 자체는 실제 코드 사용)"""
+        import backfill
+        from collector import link_sources
+        monkeypatch.setattr(link_sources, "build_sources", lambda: [rss, selenium])
+        monkeypatch.setattr(backfill, "filter_new_urls", lambda urls: urls)
+        monkeypatch.setattr(backfill, "iter_articles", articles)
+        monkeypatch.setattr(backfill, "iter_analyzed", lambda arts: arts)
+        monkeypatch.setattr(backfill, "insert_articles_stream", lambda t, arts, batch_size=None: sum(1 for _ in arts))
+
+    def test_news_scrolls_listing_even_when_rss_is_enough(self, stub_backfill, monkeypatch):
+        """RSS 가 평소처럼 20개를 돌려줘도 Selenium 목록을 max_scroll 만큼 깊게 탐색하는지 확인"""
+        from datetime import date
+        from backfill import backfill_news
+        rss = _FakeLinkSource("rss", [f"/news/rss-{i}.html" for i in range(20)])
+        selenium = _FakeLinkSource("selenium", [f"/news/old-{i}.html" for i in range(200)])
+        self._stub_news(monkeypatch, rss, selenium)
+
+        result = backfill_news("TSLA", date(2021, 1, 1), date(2021, 12, 31), max_scroll=50, max_articles=1000)
+        assert selenium.calls == [50]
+        assert result["links"] == 220
+        assert result["completed"]
+
+    def test_news_failure_is_not_checkpointed(self, stub_backfill, monkeypatch):
+        """링크 소스 실패 / 기사 수집 실패가 있으면 완료 기록을 남기지 않아 재실행 때 다시 탐색하는지 확인"""
+        from datetime import date
+        from backfill import backfill_news
+        start, end = date(2021, 1, 1), date(2021, 12, 31)
+        rss = _FakeLinkSource("rss", ["/news/a.html"])
+        selenium = _FakeLinkSource("selenium", error=ConnectionError("chrome crashed"))
+        self._stub_news(monkeypatch, rss, selenium)
+
+        result = backfill_news("TSLA", start, end)
+        assert not result["completed"] and not stub_backfill["checkpoints"]
+
+        fetched = lambda links: [{"url": links[0], "date": "2021-03-01"}, {"url": "x", "error": "timeout"}]
+        self._stub_news(monkeypatch, rss, _FakeLinkSource("selenium", []), articles=fetched)
+        result = backfill_news("TSLA", start, end)
+        assert (result["inserted"], result["failed"], result["completed"]) == (1, 1, False)
+        assert not stub_backfill["checkpoints"]
+
+        self._stub_news(monkeypatch, rss, _FakeLinkSource("selenium", []), articles=lambda links: [])
+        assert backfill_news("TSLA", start, end)["completed"]
+        assert stub_backfill["checkpoints"] == {("TSLA", "news", start, end): 0}
+        assert backfill_news("TSLA", start, end)["skipped"]
+
+    def test_price_range_request_failure_raises(self, monkeypatch):
+        """구간 조회 실패는 빈 구간과 구분되도록 예외로 올라오는지 확인 (완료 기록 방지)"""
+        from datetime import date, datetime, timezone
+        from collector import price_fetcher
+
+        captured = {}
+
+        def fake_get(url, session, ua_rotator, params=None, **kwargs):
+            captured.update(params)
+            raise RuntimeError("offline")
+
+        monkeypatch.setattr(price_fetcher, "http_get", fake_get)
+        with pytest.raises(RuntimeError):
+            price_fetcher.fetch_price_range("TSLA", date(2026, 1, 1), date(2026, 3, 31))
+        assert datetime.fromtimestamp(captured["period1"], tz=timezone.utc).date() == date(2026, 1, 1)
+        assert datetime.fromtimestamp(captured["period2"], tz=timezone.utc).date() == date(2026, 4, 1)
+
+
+class TestMetrics:
+    def test_stage_records_time_items_bytes_and_errors(self):
+        """stage() 블록의 시간 / 건수 / 바이트가 누적되고, 예외는 오류로 센 뒤 다시 던지는지 확인"""
+        from metrics import stage, STAGE_CALLS, STAGE_ERRORS, STAGE_ITEMS, STAGE_BYTES, STAGE_SECONDS
+        name = "test_stage_records"
+        with stage(name) as st:
+            time.sleep(0.01)
+            st.add(items=3, nbytes=100)
+        with pytest.raises(RuntimeError):
+            with stage(name):
+                raise RuntimeError("boom")
+
+        assert STAGE_CALLS.value(stage=name) == 2
+        assert STAGE_ITEMS.value(stage=name) == 3
+        assert STAGE_BYTES.value(stage=name) == 100
+        assert STAGE_ERRORS.value(stage=name) == 1
+        assert STAGE_SECONDS.value(stage=name) >= 0.01
+
+    def test_histogram_text_format(self):
+        """버킷은 누적 개수, +Inf 는 전체 개수, 라벨 값은 이스케이프"""
+        from metrics import Histogram
+        h = Histogram("t_seconds", "test", ["route"], buckets=(0.1, 1.0))
+        for v in (0.05, 0.5, 5.0):
+            h.observe(v, route='/a"b')
+        lines = h.render()
+        assert lines[:2] == ["# HELP t_seconds test", "# TYPE t_seconds histogram"]
+        assert 't_seconds_bucket{route="/a\\"b",le="0.1"} 1' in lines
+        assert 't_seconds_bucket{route="/a\\"b",le="1"} 2' in lines
+        assert 't_seconds_bucket{route="/a\\"b",le="+Inf"} 3' in lines
+        assert 't_seconds_count{route="/a\\"b"} 3' in lines
+        assert h.snapshot(route='/a"b')["sum"] == 5.55
+
+    def test_registry_rejects_type_conflict(self):
+        from metrics import Registry, Counter, Gauge
+        reg = Registry()
+        first = reg.register(Counter("x_total", "x"))
+        assert reg.register(Counter("x_total", "x")) is first
+        with pytest.raises(ValueError):
+            reg.register(Gauge("x_total", "x"))
+
+    def test_pipeline_writes_textfile(self, stub_stages, monkeypatch, tmp_path):
+        """실행이 끝나면 단계별 / 실행 메트릭이 textfile 로 저장되는지 확인 (임시 파일은 남지 않음)"""
+        import main
+        path = tmp_path / "prom" / "stockmind_pipeline.prom"
+        monkeypatch.setattr(main, "METRICS_TEXTFILE", str(path))
+        main.run_pipeline(["AAA", "BROKEN"], workers=2)
+
+        text = path.read_text(encoding="utf-8")
+        assert 'stockmind_pipeline_last_run_tickers{status="ok"} 1' in text
+        assert 'stockmind_pipeline_last_run_tickers{status="failed"} 1' in text
+        assert "# TYPE stockmind_stage_seconds_total counter" in text
+        assert [p.name for p in path.parent.iterdir()] == [path.name]
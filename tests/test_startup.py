@@ -0,0 +1,50 @@
+import pytest
+import sys
+import os
+import json
+import subprocess
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+# 콜드 import 시간 상한(초). 러너 성능에 맞게 환경변수로 조정 가능
+BUDGET = {
+    "main": float(os.getenv("STARTUP_BUDGET_MAIN", "1.5")),
+    "api.main": float(os.getenv("STARTUP_BUDGET_API", "2.0")),
+}
+# import 시점에 로드되면 안 되는 무거운 의존성 (실제로 필요할 때 지연 로드)
+HEAVY_MODULES = ["pandas", "selenium", "psycopg2", "asyncpg", "bs4", "lxml", "alembic"]
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _cold_import(module: str, runs: int = 3) -> dict:
+    """새 인터프리터에서 module 을 import 해 최소 소요 시간과 로드된 무거운 모듈 목록 반환"""
+    env = {**os.environ, "PYTHONPATH": SRC_DIR, "PYTHONDONTWRITEBYTECODE": "1"}
+    results = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=SRC_DIR, env=env, capture_output=True, text=True, check=True,
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {"elapsed": min(r["elapsed"] for r in results), "loaded": results[0]["loaded"]}
+
+
+class TestStartup:
+    @pytest.mark.parametrize("module", list(BUDGET))
+    def test_no_heavy_imports(self, module):
+        """파이프라인/API import 만으로 pandas·selenium 등이 로드되지 않는지 확인"""
+        assert _cold_import(module, runs=1)["loaded"] == []
+
+    @pytest.mark.parametrize("module", list(BUDGET))
+    def test_cold_import_within_budget(self, module):
+        result = _cold_import(module)
+        assert result["elapsed"] < BUDGET[module], (
+            f"{module}: cold import {result['elapsed'] * 1000:.0f}ms (budget {BUDGET[module] * 1000:.0f}ms)"
+        )